@@ -0,0 +1,105 @@
+"""
+Benchmark wall-clock time of environment variable based plugin discovery when
+importing modules sequentially versus concurrently.
+
+A synthetic plugin package is generated in a temporary directory with a number
+of modules, each defining a number of plugin types. To model modules residing
+on a slow (e.g. network) file-system, each module sleeps for a given latency
+when imported.
+
+Example::
+
+    $ poetry run python benchmarks/discovery_parallel_import.py --modules 40 --latency 0.02
+
+"""
+import argparse
+import importlib
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+from smqtk_core.plugin import discover_via_env_var, OS_ENV_PATH_SEP
+
+PKG_NAME = "synthetic_plugins_bench"
+ENV_VAR = "SMQTK_BENCH_PLUGIN_PATH"
+
+
+def make_plugin_tree(root: str, n_modules: int, n_types: int, latency: float) -> List[str]:
+    """
+    Write the synthetic plugin package under ``root``, returning the module
+    paths of its plugin modules.
+    """
+    pkg_dir = os.path.join(root, PKG_NAME)
+    os.makedirs(pkg_dir)
+    with open(os.path.join(pkg_dir, "__init__.py"), "w") as f:
+        f.write(
+            "import abc\n"
+            "from smqtk_core.plugin import Pluggable\n\n\n"
+            "class BenchInterface(Pluggable):\n"
+            "    @abc.abstractmethod\n"
+            "    def run(self) -> None: ...\n"
+        )
+    module_paths = []
+    for i in range(n_modules):
+        lines = [
+            "import time",
+            f"from {PKG_NAME} import BenchInterface",
+            f"time.sleep({latency})",
+        ]
+        for j in range(n_types):
+            lines += [
+                f"class Impl_{i}_{j}(BenchInterface):",
+                "    def run(self) -> None: ...",
+            ]
+        with open(os.path.join(pkg_dir, f"mod_{i}.py"), "w") as f:
+            f.write("\n".join(lines) + "\n")
+        module_paths.append(f"{PKG_NAME}.mod_{i}")
+    return module_paths
+
+
+def unload_plugin_tree() -> None:
+    for name in [n for n in sys.modules if n == PKG_NAME or n.startswith(PKG_NAME + ".")]:
+        del sys.modules[name]
+
+
+def time_discovery(repeats: int, max_workers: Optional[int]) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        unload_plugin_tree()
+        importlib.invalidate_caches()
+        s = time.perf_counter()
+        discover_via_env_var(ENV_VAR, max_workers=max_workers)
+        timings.append(time.perf_counter() - s)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modules", type=int, default=40, help="Number of plugin modules.")
+    parser.add_argument("--types", type=int, default=5, help="Number of plugin types per module.")
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Simulated seconds of I/O latency per module import.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of timed discoveries per mode.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[4, 8, 16],
+                        help="Thread counts to benchmark concurrent importing with.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        module_paths = make_plugin_tree(root, args.modules, args.types, args.latency)
+        sys.path.insert(0, root)
+        os.environ[ENV_VAR] = OS_ENV_PATH_SEP.join(module_paths)
+        print(f"{args.modules} modules x {args.types} types, {args.latency}s latency per import, "
+              f"{args.repeats} repeats")
+        print(f"{'mode':>12} {'min (s)':>10} {'median (s)':>11}")
+        for workers in [None, *args.workers]:
+            timings = time_discovery(args.repeats, workers)
+            mode = "sequential" if workers is None else f"{workers} threads"
+            print(f"{mode:>12} {min(timings):>10.4f} {statistics.median(timings):>11.4f}")
+        unload_plugin_tree()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark the throughput of ``filter_plugin_types`` over candidate pools of
+increasing size, with cold and warm verdict caches.
+
+Candidate pools are made of synthetic types: two thirds implement a
+``Pluggable`` interface and a third are abstract descendants of it. Unrelated
+types are not included, as `abc.ABCMeta`'s first negative sub-class check
+walks all descendants of the interface, which would dominate pools of this
+size. A "cold" filter starts with empty verdict caches, as the first discovery in a
+process does, while a "warm" filter reuses the verdicts of previous calls, as
+repeated discoveries do.
+
+Example::
+
+    $ poetry run python benchmarks/filter_plugin_types_throughput.py --sizes 1000 10000 100000
+
+"""
+import abc
+import argparse
+import statistics
+import time
+from typing import List, Type
+
+from smqtk_core.plugin import (
+    filter_plugin_types,
+    Pluggable,
+    PLUGIN_VERDICT_CACHE,
+    USABILITY_CACHE,
+)
+
+
+class BenchInterface(Pluggable):
+    @abc.abstractmethod
+    def run(self) -> None: ...
+
+
+def make_candidates(n: int) -> List[Type]:
+    def run(self: BenchInterface) -> None: ...
+
+    candidates: List[Type] = []
+    for i in range(n):
+        if i % 3:
+            candidates.append(type(f"Impl_{i}", (BenchInterface,), {"run": run}))
+        else:
+            candidates.append(type(f"Abstract_{i}", (BenchInterface,), {}))
+    return candidates
+
+
+def time_filter(candidates: List[Type], repeats: int, cold: bool) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        if cold:
+            PLUGIN_VERDICT_CACHE.invalidate()
+            USABILITY_CACHE.invalidate()
+        s = time.perf_counter()
+        filter_plugin_types(BenchInterface, candidates)
+        timings.append(time.perf_counter() - s)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Candidate pool sizes to benchmark.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of timed filters per mode.")
+    args = parser.parse_args()
+
+    print(f"{'pool size':>10} {'mode':>5} {'median (s)':>11} {'types/s':>12}")
+    for size in args.sizes:
+        candidates = make_candidates(size)
+        for cold in (True, False):
+            timings = time_filter(candidates, args.repeats, cold)
+            median = statistics.median(timings)
+            mode = "cold" if cold else "warm"
+            print(f"{size:>10} {mode:>5} {median:>11.4f} {size / median:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
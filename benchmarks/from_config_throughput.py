@@ -0,0 +1,76 @@
+"""
+Benchmark the throughput of ``Configurable.from_config`` on flat
+configurations against direct constructor calls and against the generic
+construction path of introspecting the constructor and recursively merging
+the configuration on top of its defaults on every call.
+
+Each configuration overrides half of the constructor's parameters, leaving
+the rest to their defaults.
+
+Example::
+
+    $ poetry run python benchmarks/from_config_throughput.py --params 4 16 --number 100000
+
+"""
+import argparse
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Type
+
+from smqtk_core.configuration import _param_map_func, Configurable
+from smqtk_core.dict import merge_dict
+
+
+def make_type(n_params: int) -> Type[Configurable]:
+    params = [f"p{i}" for i in range(n_params)]
+    namespace: Dict[str, Any] = {}
+    exec(
+        f"def __init__(self, {', '.join(f'{p}={i}' for i, p in enumerate(params))}):\n"
+        f"    self.config = dict({', '.join(f'{p}={p}' for p in params)})\n",
+        namespace,
+    )
+    return type(f"Bench{n_params}", (Configurable,), {
+        "__init__": namespace["__init__"],
+        "get_config": lambda self: self.config,
+    })
+
+
+def generic_from_config(cls: Type[Configurable], config: Dict) -> Configurable:
+    return cls(**merge_dict(_param_map_func(cls.__init__), config))  # type: ignore
+
+
+def time_calls(func: Callable[[], Any], number: int, repeats: int) -> List[float]:
+    timings = []
+    for _ in range(repeats):
+        s = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append(time.perf_counter() - s)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--params", type=int, nargs="+", default=[4, 16],
+                        help="Numbers of constructor parameters to benchmark.")
+    parser.add_argument("--number", type=int, default=100000,
+                        help="Number of constructions per timing.")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of timings per mode.")
+    args = parser.parse_args()
+
+    print(f"{'params':>6} {'mode':>12} {'median (s)':>11} {'objects/s':>12}")
+    for n_params in args.params:
+        cls = make_type(n_params)
+        config = {f"p{i}": -i for i in range(0, n_params, 2)}
+        modes = {
+            "direct": lambda: cls(**config),  # type: ignore
+            "from_config": lambda: cls.from_config(config),
+            "generic": lambda: generic_from_config(cls, config),
+        }
+        for mode, func in modes.items():
+            median = statistics.median(time_calls(func, args.number, args.repeats))
+            print(f"{n_params:>6} {mode:>12} {median:>11.4f} {args.number / median:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""
+Entry point for ``python -m smqtk_core``. See :mod:`smqtk_core.cli`.
+"""
+from smqtk_core.cli import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Command-line tool to inspect, time and prepare plugin discovery.
+
+This is available as ``python -m smqtk_core`` or, when installed, as the
+``smqtk-plugins`` command.
+
+Interfaces are specified on the command line by their type key, i.e. the
+module-qualified name of the interface class, such as
+``smqtk_descriptors.interfaces.descriptor_generator.DescriptorGenerator``.
+When no interfaces are specified, every abstract `Pluggable` type defined
+after importing all modules exposed through entry-point extensions and the
+plugin environment variable is used.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import logging
+import math
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Type
+
+# noinspection PyProtectedMember
+from smqtk_core.plugin import (
+    _call_with_deadline,
+    _DeadlineExceeded,
+    _type_to_key,
+    discover_via_entrypoint_extensions,
+    discover_via_env_var,
+    discover_via_manifest,
+    discover_via_subclasses,
+    DISCOVERY_CACHE,
+    filter_plugin_types,
+    Pluggable,
+    PluginManifest,
+    PersistentUsabilityStore,
+    SharedDiscoveryCache,
+)
+
+
+def _resolve_interface(type_key: str) -> Type[Pluggable]:
+    """
+    Import the `Pluggable` interface type with the given key.
+
+    :raises ValueError: The key does not refer to a `Pluggable` type.
+    """
+    module_name, _, name = type_key.rpartition(".")
+    try:
+        t = getattr(importlib.import_module(module_name), name)
+    except (ImportError, AttributeError, ValueError) as ex:
+        raise ValueError(f"Could not import interface '{type_key}': {ex}")
+    if not isinstance(t, type) or not issubclass(t, Pluggable):
+        raise ValueError(f"Type '{type_key}' is not a `Pluggable` type.")
+    return t
+
+
+def _all_interfaces() -> List[Type[Pluggable]]:
+    """
+    Import all modules exposed through the default plugin sources and return
+    the abstract `Pluggable` types then defined, sorted by type key.
+    """
+    discover_via_env_var(Pluggable.PLUGIN_ENV_VAR)
+    discover_via_entrypoint_extensions(Pluggable.PLUGIN_NAMESPACE)
+    return sorted(
+        (t for t in discover_via_subclasses(Pluggable) if inspect.isabstract(t)),
+        key=_type_to_key,
+    )
+
+
+def _get_interfaces(type_keys: Sequence[str]) -> List[Type[Pluggable]]:
+    if type_keys:
+        return [_resolve_interface(k) for k in type_keys]
+    return _all_interfaces()
+
+
+def _impl_sources(interface_type: Type[Pluggable]) -> Dict[str, List[str]]:
+    """
+    Map the type key of each implementation of the given interface to the
+    names of the discovery sources that provide it.
+
+    Imports and ``is_usable()`` probes are subject to the interface's
+    ``PLUGIN_TIMEOUT`` budget.
+    """
+    timeout = interface_type.PLUGIN_TIMEOUT
+    env_var = interface_type.PLUGIN_ENV_VAR
+    namespace = interface_type.PLUGIN_NAMESPACE
+    manifest_env_var = interface_type.PLUGIN_MANIFEST_ENV_VAR
+    manifest_path = os.environ.get(manifest_env_var, "")
+    if manifest_path:
+        ep_source = f"manifest:{manifest_path}"
+        ep_types = discover_via_manifest(interface_type, manifest_path, namespace)
+    else:
+        ep_source = f"entrypoint:{namespace}"
+        ep_types = discover_via_entrypoint_extensions(
+            namespace, interface_type=interface_type, timeout=timeout
+        )
+    sources = {
+        f"env_var:{env_var}": discover_via_env_var(env_var, timeout=timeout),
+        ep_source: ep_types,
+        "subclasses": discover_via_subclasses(interface_type),
+    }
+    impl_sources: Dict[str, List[str]] = {}
+    for source, candidates in sources.items():
+        for t in filter_plugin_types(interface_type, candidates, timeout):
+            impl_sources.setdefault(_type_to_key(t), []).append(source)
+    return dict(sorted(impl_sources.items()))
+
+
+def _percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Get the nearest-rank percentile of the given values.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def cli_list(args: argparse.Namespace) -> None:
+    report = {
+        _type_to_key(iface): _impl_sources(iface)
+        for iface in _get_interfaces(args.interfaces)
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for iface_key, impls in report.items():
+        print(iface_key)
+        for impl_key, sources in impls.items():
+            print(f"    {impl_key}  [{', '.join(sources)}]")
+
+
+def cli_time(args: argparse.Namespace) -> None:
+    report = {}
+    for iface in _get_interfaces(args.interfaces):
+        timings = []
+        for _ in range(args.repeats):
+            if not args.cached:
+                DISCOVERY_CACHE.invalidate(iface)
+            s = time.perf_counter()
+            iface.get_impls()
+            timings.append(time.perf_counter() - s)
+        report[_type_to_key(iface)] = {
+            "repeats": args.repeats,
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "p95": _percentile(timings, 95),
+        }
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{'interface':<60} {'min (s)':>10} {'median (s)':>11} {'p95 (s)':>10}")
+    for iface_key, r in report.items():
+        print(f"{iface_key:<60} {r['min']:>10.6f} {r['median']:>11.6f} {r['p95']:>10.6f}")
+
+
+def cli_manifest(args: argparse.Namespace) -> None:
+    manifest = PluginManifest.generate(args.namespace)
+    manifest.save(args.output)
+    print(
+        f"Wrote manifest of {len(manifest.types)} types across "
+        f"{len(manifest.interfaces)} interfaces to {args.output}"
+    )
+
+
+def cli_usability_cache(args: argparse.Namespace) -> None:
+    store = PersistentUsabilityStore(args.output)
+    now = time.time()
+    count = 0
+    for iface in _get_interfaces(args.interfaces):
+        # Sub-class discovery draws from all modules imported for the
+        # interfaces, including those of other discovery sources.
+        for t in discover_via_subclasses(iface):
+            if inspect.isabstract(t):
+                continue
+            type_key = _type_to_key(t)
+            try:
+                usable = _call_with_deadline(
+                    "usability", type_key, iface.PLUGIN_TIMEOUT, t.is_usable
+                )
+            except _DeadlineExceeded:
+                # As at discovery, a timed out probe yields no verdict.
+                continue
+            store.put(type_key, bool(usable), now, flush=False)
+            count += 1
+    store.flush()
+    print(f"Wrote usability verdicts of {count} types to {args.output}")
+
+
+def cli_shared_cache(args: argparse.Namespace) -> None:
+    cache = SharedDiscoveryCache(args.directory)
+    for iface in _get_interfaces(args.interfaces):
+        # Discovery writes a new entry when there is none for the interface.
+        os.environ[iface.PLUGIN_SHARED_CACHE_ENV_VAR] = args.directory
+        cache.discard(iface)
+        iface.invalidate_impls()
+        iface.get_impls()
+        print(f"Wrote shared discovery cache entry of {_type_to_key(iface)}")
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="smqtk-plugins",
+        description="Inspect, time and prepare SMQTK plugin discovery.",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Emit trace level plugin discovery logging.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    interfaces_help = (
+        "Type keys of the interfaces to use. If none are given, all "
+        "interfaces defined by discoverable plugin modules are used."
+    )
+
+    p = subparsers.add_parser(
+        "list", help="List the implementations of interfaces and the "
+                     "discovery sources that provide them.",
+    )
+    p.add_argument("interfaces", nargs="*", help=interfaces_help)
+    p.add_argument("--json", action="store_true", help="Output JSON.")
+    p.set_defaults(func=cli_list)
+
+    p = subparsers.add_parser(
+        "time", help="Time repeated discovery of the implementations of "
+                     "interfaces.",
+    )
+    p.add_argument("interfaces", nargs="*", help=interfaces_help)
+    p.add_argument("-r", "--repeats", type=int, default=10,
+                   help="Number of timed discoveries per interface.")
+    p.add_argument("--cached", action="store_true",
+                   help="Time discovery with the discovery cache retained "
+                        "between repeats instead of dropped.")
+    p.add_argument("--json", action="store_true", help="Output JSON.")
+    p.set_defaults(func=cli_time)
+
+    p = subparsers.add_parser(
+        "manifest", help="Generate, or refresh, a plugin manifest file.",
+    )
+    p.add_argument("output", help="Path of the manifest file to write.")
+    p.add_argument("-n", "--namespace", default=Pluggable.PLUGIN_NAMESPACE,
+                   help="Entry-point namespace to generate the manifest for.")
+    p.set_defaults(func=cli_manifest)
+
+    p = subparsers.add_parser(
+        "usability-cache",
+        help="Probe the implementations of interfaces and write their "
+             "is_usable() verdicts to a persistent usability cache file.",
+    )
+    p.add_argument("output", help="Path of the usability cache file to write.")
+    p.add_argument("interfaces", nargs="*", help=interfaces_help)
+    p.set_defaults(func=cli_usability_cache)
+
+    p = subparsers.add_parser(
+        "shared-cache",
+        help="Write, or refresh, the entries of interfaces in a shared "
+             "discovery cache directory for the current environment.",
+    )
+    p.add_argument("directory", help="Path of the shared cache directory.")
+    p.add_argument("interfaces", nargs="*", help=interfaces_help)
+    p.set_defaults(func=cli_shared_cache)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = get_parser()
+    args = parser.parse_args(argv)
+    if args.verbose:
+        logging.basicConfig(level=1)
+    try:
+        args.func(args)
+    except ValueError as ex:
+        parser.error(str(ex))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
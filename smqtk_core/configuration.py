@@ -32,21 +32,28 @@ this is not required property of these constructs.
 
 """
 import abc
+from collections import deque
+from concurrent.futures import Executor, Future
+import functools
 import inspect
 import json
 import types
 from typing import (
-    Any, Callable, Dict, FrozenSet, Iterable, Sequence, Set, Tuple, Type,
-    TypeVar, Union
+    Any, Callable, cast, Deque, Dict, FrozenSet, Iterable, Iterator, Mapping,
+    Optional, Sequence, Set, Tuple, Type, TypeVar, Union
 )
 
 from smqtk_core.dict import merge_dict
+# noinspection PyProtectedMember
+from smqtk_core.plugin import _type_to_key, Pluggable, resolve_type, TypeKeyIndex
 
 
 # Type variable for arbitrary types.
 T = TypeVar("T")
 # Type variable for Configurable-inheriting types.
 C = TypeVar("C", bound="Configurable")
+# Type variable for arbitrary return types.
+R = TypeVar("R")
 
 
 def _param_map_func(func: Callable) -> Dict[str, object]:
@@ -81,15 +88,88 @@ def _param_map_func(func: Callable) -> Dict[str, object]:
     return pmap
 
 
-def _type_to_key(t: Type) -> str:
+class _ConstructorAdapter:
     """
-    Common function for transforming a class type to its associated string key
-    for use in configuration semantics.
+    Construction path specialized to a class's constructor, built once from
+    its signature so that `Configurable.from_config` neither introspects the
+    constructor nor generically merges dictionaries on every call.
+    """
+
+    __slots__ = ("init", "init_defaults", "init_kwdefaults", "param_map", "dict_params")
+
+    def __init__(self, init: Callable):
+        """
+        :param init: The ``__init__`` of the class to adapt.
+        """
+        self.init = init
+        self.init_defaults = getattr(init, "__defaults__", None)
+        self.init_kwdefaults = getattr(init, "__kwdefaults__", None)
+        # Check that the class has a defined constructor. Otherwise a default
+        # constructor does not checkout as a method or function.
+        self.param_map: Dict[str, object] = (
+            _param_map_func(init)
+            if isinstance(init, (types.MethodType, types.FunctionType)) else {}
+        )
+        # Parameters whose default is a dictionary, into which configured
+        # dictionaries are merged rather than replacing it.
+        self.dict_params = tuple(k for k, v in self.param_map.items() if isinstance(v, dict))
+
+    def is_current(self, init: Callable) -> bool:
+        """
+        Get if this adapter was built from the given constructor, with its
+        current default values.
+        """
+        return (
+            self.init is init
+            and self.init_defaults is getattr(init, "__defaults__", None)
+            and self.init_kwdefaults is getattr(init, "__kwdefaults__", None)
+        )
 
-    :param t: Type to get the key for.
-    :return: String key for the input type.
+    def merge_default(self, config_dict: Dict) -> Dict:
+        """
+        Merge the given configuration on top of the constructor's defaults.
+
+        This is equivalent to
+        ``merge_dict(self.param_map, config_dict, copy_on_write=True)`` but,
+        in the common case of no dictionary defaults, a single shallow
+        dictionary merge. Dictionary defaults, which are the very objects of
+        the constructor's default values, are thus left unmodified.
+        """
+        merged = {**self.param_map, **config_dict}
+        for k in self.dict_params:
+            v = config_dict.get(k)
+            if isinstance(v, dict):
+                merged[k] = merge_dict(cast(Dict, self.param_map[k]), v, copy_on_write=True)
+        return merged
+
+
+# Name of the class attribute constructor adapters are stored in.
+_ADAPTER_ATTR = "_smqtk_constructor_adapter"
+
+
+def _get_constructor_adapter(cls: Type) -> _ConstructorAdapter:
+    """
+    Get the constructor adapter of the given class, building it if there is
+    none yet or if the class's ``__init__``, or its default values, have been
+    replaced since.
+
+    Adapters are stored on the class itself, as `abc` does with its own
+    per-class state, so that getting one is a single lookup in the class's
+    own namespace that neither requires locking nor keeps dynamically defined
+    classes alive. Concurrent builds for the same class produce equivalent
+    adapters, one of which is retained.
     """
-    return f"{t.__module__}.{t.__name__}"
+    init = cls.__init__
+    adapter = cls.__dict__.get(_ADAPTER_ATTR)
+    if adapter is None or not adapter.is_current(init):
+        adapter = _ConstructorAdapter(init)
+        try:
+            setattr(cls, _ADAPTER_ATTR, adapter)
+        except (AttributeError, TypeError):
+            # Class attributes cannot be set, e.g. for some built-in or
+            # extension types. Build a new adapter each time.
+            pass
+    return adapter
 
 
 class Configurable (metaclass=abc.ABCMeta):
@@ -116,6 +196,11 @@ class Configurable (metaclass=abc.ABCMeta):
         It is not be guaranteed that the configuration dictionary returned
         from this method is valid for construction of an instance of this class.
 
+        The constructor's parameters are introspected once per class and
+        memoized until the class's ``__init__``, or its default values, are
+        replaced. Each call returns a new (shallow) copy that the caller is
+        free to modify.
+
         :return: Default configuration dictionary for the class.
         :rtype: dict
 
@@ -130,15 +215,11 @@ class Configurable (metaclass=abc.ABCMeta):
         >>> config = self.get_default_config()
         >>> assert config == {'a': 1, 'b': 'foo'}
         """
-        # Check that the current class has a defined constructor. Otherwise a
-        # default constructor does not checkout as a method or function.
-        if isinstance(cls.__init__, (types.MethodType, types.FunctionType)):
-            dflt_config = _param_map_func(cls.__init__)
-            # TODO: Validate JSON compliance of ``dflt_config`` here?
-            return dflt_config
-
-        # No constructor explicitly defined on this class
-        return {}
+        # The adapter's parameter map is empty when no constructor is
+        # explicitly defined on this class.
+        dflt_config = dict(_get_constructor_adapter(cls).param_map)
+        # TODO: Validate JSON compliance of ``dflt_config`` here?
+        return dflt_config
 
     @classmethod
     def from_config(
@@ -222,7 +303,14 @@ class Configurable (metaclass=abc.ABCMeta):
         # specification, which we cover here. If an implementation needs
         # something more special, they can override this function.
         if merge_default:
-            config_dict = merge_dict(cls.get_default_config(), config_dict)
+            if getattr(cls.get_default_config, "__func__", None) is _BASE_GET_DEFAULT_CONFIG:
+                # Defaults are those of the constructor, whose adapter merges
+                # them without introspection.
+                config_dict = _get_constructor_adapter(cls).merge_default(config_dict)
+            else:
+                # Default configurations may share nested dictionaries with
+                # the constructor's default values.
+                config_dict = merge_dict(cls.get_default_config(), config_dict, copy_on_write=True)
 
         # A `type: ignore` is applied here as there is an error emitted due to
         # this abstract class not locally defining a constructor that takes
@@ -235,6 +323,55 @@ class Configurable (metaclass=abc.ABCMeta):
         # `type: ignore` this line.
         return cls(**config_dict)  # type: ignore
 
+    @classmethod
+    def from_config_many(
+        cls: Type[C],
+        config_dicts: Iterable[Dict],
+        merge_default: bool = True,
+        executor: Optional[Executor] = None,
+        max_pending: int = 64,
+    ) -> Iterator[C]:
+        """
+        Instantiate a new instance of this class for each of the given
+        configuration dictionaries, as :meth:`from_config` would.
+
+        Work that does not depend on the individual configurations, such as
+        checking how this class is constructed and drawing its constructor's
+        defaults, is performed once for the whole batch. Instances are
+        yielded lazily, in the order of their configurations, so that
+        configurations may be drawn from a generator.
+
+        Construction may optionally be performed across an executor's pool of
+        threads or processes. In that case, up to ``max_pending``
+        constructions are submitted ahead of the instance last yielded. For a
+        process pool, this class and the configurations must be picklable.
+
+        >>> class SimpleConfig(Configurable):
+        ...     def __init__(self, a=1, b='foo'):
+        ...         self.a = a
+        ...         self.b = b
+        ...     def get_config(self):
+        ...         return {'a': self.a, 'b': self.b}
+        >>> [i.a for i in SimpleConfig.from_config_many({'a': a} for a in range(3))]
+        [0, 1, 2]
+
+        :param config_dicts: Iterable of JSON compliant dictionaries each
+            encapsulating a configuration.
+        :param merge_default: Merge the given configurations on top of the
+            default provided by ``get_default_config``.
+        :param executor: Optional executor to construct instances in.
+        :param max_pending: Maximum number of constructions submitted to the
+            executor ahead of the instance last yielded.
+
+        :return: Iterator of constructed instances.
+        """
+        args = (merge_default,)
+        if executor is None:
+            return map(_batch_constructor(cls, args), config_dicts)
+        return _imap_bounded(
+            executor, _construct, ((cls, args, c) for c in config_dicts), max_pending
+        )
+
     @abc.abstractmethod
     def get_config(self) -> Dict[str, Any]:
         """
@@ -258,6 +395,89 @@ class Configurable (metaclass=abc.ABCMeta):
         """
 
 
+# The base implementation of `Configurable.get_default_config`, which
+# `Configurable.from_config` specializes when not overridden.
+_BASE_GET_DEFAULT_CONFIG = cast(classmethod, Configurable.__dict__["get_default_config"]).__func__
+
+
+# The base implementation of `Configurable.from_config`, which batch
+# construction bypasses when not overridden.
+_BASE_FROM_CONFIG = cast(classmethod, Configurable.__dict__["from_config"]).__func__
+
+
+def _batch_constructor(cls: Type[C], args: Sequence) -> Callable[[Dict], C]:
+    """
+    Get a function constructing an instance of the given class from a
+    configuration as ``cls.from_config(config, *args)`` would, for use
+    across many configurations.
+
+    When the class does not override how it is constructed from
+    configurations, the returned function directly constructs instances via
+    the class's constructor adapter.
+    """
+    if (
+        len(args) <= 1
+        and getattr(cls.from_config, "__func__", None) is _BASE_FROM_CONFIG
+        and getattr(cls.get_default_config, "__func__", None) is _BASE_GET_DEFAULT_CONFIG
+    ):
+        # The only additional argument of the base method is `merge_default`.
+        if args and not args[0]:
+            return lambda config_dict: cls(**config_dict)  # type: ignore
+        adapter = _get_constructor_adapter(cls)
+        return lambda config_dict: cls(**adapter.merge_default(config_dict))  # type: ignore
+    return lambda config_dict: cls.from_config(config_dict, *args)
+
+
+def _construct(cls: Type[C], args: Sequence, config_dict: Dict) -> C:
+    """
+    Construct an instance of the given class as ``cls.from_config(config_dict,
+    *args)`` would. This is a module level function so that it may be
+    submitted to process pools.
+    """
+    return _batch_constructor(cls, args)(config_dict)
+
+
+def _imap_bounded(
+    executor: Executor,
+    func: Callable[..., R],
+    items: Iterable[Sequence],
+    max_pending: int,
+) -> Iterator[R]:
+    """
+    Lazily call a function with each item's arguments in the given executor,
+    yielding results in the order of the items.
+
+    Unlike `Executor.map`, items are drawn from the iterable only as results
+    are consumed, with at most ``max_pending`` of them submitted ahead of the
+    last yielded result. Submitted calls not yet started are cancelled when
+    the iterator is closed early.
+
+    An error raised while drawing an item is raised in place of that item's
+    result, i.e. after the results of all earlier items are yielded.
+    """
+    pending: Deque["Future[R]"] = deque()
+    items_iter = iter(items)
+    try:
+        while True:
+            try:
+                item = next(items_iter)
+            except StopIteration:
+                break
+            except Exception as ex:
+                failed: "Future[R]" = Future()
+                failed.set_exception(ex)
+                pending.append(failed)
+                break
+            pending.append(executor.submit(func, *item))
+            if len(pending) >= max(max_pending, 1):
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for f in pending:
+            f.cancel()
+
+
 def make_default_config(configurable_iter: Iterable[Type[C]]) -> Dict[str, Union[None, str, Dict]]:
     """
     Generated default configuration dictionary for the given iterable of
@@ -304,6 +524,7 @@ def make_default_config(configurable_iter: Iterable[Type[C]]) -> Dict[str, Union
     """
     d: Dict[str, Union[None, str, Dict]] = {"type": None}
     for cls in configurable_iter:
+        cls = resolve_type(cls)
         assert isinstance(cls, type) and issubclass(cls, Configurable), \
             "Encountered invalid Configurable type: '{}' (type={})".format(
                 cls, type(cls)
@@ -389,7 +610,7 @@ def to_config_dict(c_inst: Configurable) -> Dict:
 
 def cls_conf_from_config_dict(
     config: Dict,
-    type_iter: Iterable[Type[T]]
+    type_iter: Union[Iterable[Type[T]], Type[T], TypeKeyIndex]
 ) -> Tuple[Type[T], Dict]:
     """
     Helper function for getting the appropriate type and configuration
@@ -400,7 +621,17 @@ def cls_conf_from_config_dict(
         Configuration dictionary to draw from.
 
     :param type_iter:
-        An iterable of class types to select from.
+        An iterable of class types to select from. This may include
+        :class:`smqtk_core.plugin.LazyPluginType` handles, only the selected
+        one of which is resolved.
+        Alternatively, this may be a :class:`smqtk_core.plugin.Pluggable`
+        interface type, in which case only the configured implementation type
+        is resolved via :meth:`smqtk_core.plugin.Pluggable.get_impl` instead
+        of discovering all implementations.
+        Alternatively, this may be a :class:`smqtk_core.plugin.TypeKeyIndex`
+        of the types to select from, which resolves the configured type with
+        a single lookup. This is preferable to an iterable when resolving
+        many configurations against the same, large, set of types.
 
     :raises ValueError:
         This may be raised if:
@@ -414,34 +645,74 @@ def cls_conf_from_config_dict(
         configured type as well as the sub-dictionary from the configuration.
         From this return, ``type.from_config(config)`` should be callable.
     """
+    conf_type_name = _get_config_type_name(config)
+    cls = _resolve_config_type(conf_type_name, _get_type_source(type_iter))
+    return cls, config[conf_type_name]
+
+
+def _get_config_type_name(config: Dict) -> str:
+    """
+    Get the configured implementation type key of the given "standard" SMQTK
+    configuration dictionary, checking that it has a configuration block.
+
+    :raises ValueError: See :func:`cls_conf_from_config_dict`.
+    """
     if 'type' not in config:
         raise ValueError("Configuration dictionary given does not have an "
                          "implementation type specification.")
     conf_type_name = config['type']
-    type_map: Dict[str, Type[T]] = dict(map(lambda t: (_type_to_key(t), t), type_iter))
-
-    conf_type_options = set(config.keys()) - {'type'}
     # Type provided may either by None, not have a matching block in the
     # config, not have a matching implementation type, or match both.
     if conf_type_name is None:
         raise ValueError("No implementation type specified. Options: %s"
-                         % list(conf_type_options))
-    elif conf_type_name not in conf_type_options:
+                         % list(set(config.keys()) - {'type'}))
+    elif conf_type_name == 'type' or conf_type_name not in config:
         raise ValueError("Implementation type specified as '%s', but no "
                          "configuration block was present for that type. "
                          "Available configuration block options: %s"
-                         % (conf_type_name, list(conf_type_options)))
-    elif conf_type_name not in type_map:
+                         % (conf_type_name, list(set(config.keys()) - {'type'})))
+    return conf_type_name
+
+
+def _get_type_source(
+    type_iter: Union[Iterable[Type[T]], Type[T], TypeKeyIndex]
+) -> Union[Mapping[str, Type[T]], Type[T]]:
+    """
+    Get the source to resolve configured types from for the given types to
+    select from: a `Pluggable` interface type or type key index as is, or a
+    mapping of the type keys of the given types to the types.
+    """
+    if isinstance(type_iter, (type, TypeKeyIndex)):
+        return type_iter
+    return dict(map(lambda t: (_type_to_key(t), t), type_iter))
+
+
+def _resolve_config_type(
+    conf_type_name: str,
+    type_source: Union[Mapping[str, Type[T]], Type[T]],
+) -> Type[T]:
+    """
+    Resolve the implementation type with the given key from either a mapping
+    of type keys to types, such as a `TypeKeyIndex`, or the implementations
+    of a `Pluggable` interface type.
+
+    :raises ValueError: See :func:`cls_conf_from_config_dict`.
+    """
+    if isinstance(type_source, type):
+        if not issubclass(type_source, Pluggable):
+            raise ValueError("Type given to select from must be a `Pluggable` "
+                             "interface type, got '%s'." % type_source.__name__)
+        return type_source.get_impl(conf_type_name)
+    if conf_type_name not in type_source:
         raise ValueError("Implementation type specified as '%s', but no "
                          "plugin implementations are available for that type. "
                          "Available implementation types options: %s"
-                         % (conf_type_name, list(type_map)))
-    cls = type_map[conf_type_name]
-    return cls, config[conf_type_name]
+                         % (conf_type_name, list(type_source)))
+    return resolve_type(type_source[conf_type_name])
 
 
 def from_config_dict(config: Dict,
-                     type_iter: Iterable[Type[C]],
+                     type_iter: Union[Iterable[Type[C]], Type[C], TypeKeyIndex],
                      *args: Any) -> C:
     """
     Helper function for instantiating an instance of a class given the
@@ -474,6 +745,20 @@ def from_config_dict(config: Dict,
     >>> inst.b == "baz"
     True
 
+    When the implementations to select from are those of a
+    :class:`smqtk_core.plugin.Pluggable` interface, the interface type itself
+    may be given as ``type_iter``. This only imports the configured
+    implementation instead of discovering all of them, i.e.
+    ``from_config_dict(config, MyInterface)`` is preferable to
+    ``from_config_dict(config, MyInterface.get_impls())``.
+
+    When resolving many configurations against the same, large, set of
+    types, a :class:`smqtk_core.plugin.TypeKeyIndex` of them may be given as
+    ``type_iter`` so that the configured type is resolved with a single
+    lookup, e.g. ``from_config_dict(config, index)`` with
+    ``index = TypeKeyIndex.from_interface(MyInterface)`` built once and
+    reused.
+
     :raises ValueError:
         This may be raised if:
             - type field not present in ``config``.
@@ -492,7 +777,9 @@ def from_config_dict(config: Dict,
         Configuration dictionary to draw from.
 
     :param type_iter:
-        An iterable of class types to select from.
+        An iterable of class types to select from, a `Pluggable` interface
+        type to select an implementation of, or a `TypeKeyIndex` of types to
+        select from.
 
     :param object args:
         Other positional arguments to pass to the configured class'
@@ -509,6 +796,133 @@ def from_config_dict(config: Dict,
     return cls.from_config(cls_conf, *args)
 
 
+async def afrom_config_dict(config: Dict,
+                            type_iter: Union[Iterable[Type[C]], Type[C], TypeKeyIndex],
+                            *args: Any,
+                            executor: Optional[Executor] = None) -> C:
+    """
+    Asynchronous variant of :func:`from_config_dict`.
+
+    Resolving the configured type, which may import modules or perform
+    plugin discovery, and constructing the instance are run in the given
+    executor so as to not block the running event loop. The same discovery
+    caches as :func:`from_config_dict` are used.
+
+    :param config:
+        Configuration dictionary to draw from.
+
+    :param type_iter:
+        An iterable of class types to select from, a `Pluggable` interface
+        type to select an implementation of, or a `TypeKeyIndex` of types to
+        select from.
+
+    :param object args:
+        Other positional arguments to pass to the configured class'
+        ``from_config`` class method.
+
+    :param executor:
+        Executor to run in. If None, the event loop's default executor is
+        used.
+
+    :return: Instance of the configured class type as specified in ``config``
+        and as available in ``type_iter``.
+    """
+    # Deferred as asyncio is costly to import and only needed here.
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(from_config_dict, config, type_iter, *args)
+    )
+
+
+def from_config_dict_many(configs: Iterable[Dict],
+                          type_iter: Union[Iterable[Type[C]], Type[C], TypeKeyIndex],
+                          *args: Any,
+                          executor: Optional[Executor] = None,
+                          max_pending: int = 64) -> Iterator[C]:
+    """
+    Batch variant of :func:`from_config_dict`, instantiating an instance for
+    each of the given configuration dictionaries.
+
+    Configured types are resolved once per distinct ``"type"`` across the
+    batch, and each resolved type's construction is prepared once, as
+    described for :meth:`Configurable.from_config_many`. Instances are
+    yielded lazily, in the order of their configurations, so that
+    configurations may be drawn from a generator.
+
+    Construction may optionally be performed across an executor's pool of
+    threads or processes, with at most ``max_pending`` constructions
+    submitted ahead of the instance last yielded. Type resolution is always
+    performed in the calling thread. For a process pool, configured types and
+    their configuration blocks must be picklable.
+
+    >>> class SimpleConfig(Configurable):
+    ...     def __init__(self, a=1, b='foo'):
+    ...         self.a = a
+    ...         self.b = b
+    ...     def get_config(self):
+    ...         return {'a': self.a, 'b': self.b}
+    >>> key = 'smqtk_core.configuration.SimpleConfig'
+    >>> configs = ({'type': key, key: {'a': a}} for a in range(3))
+    >>> [i.a for i in from_config_dict_many(configs, {SimpleConfig})]
+    [0, 1, 2]
+
+    :raises ValueError: A configuration is invalid, as described for
+        :func:`from_config_dict`. This is raised when the instance of that
+        configuration would be yielded.
+    :raises AssertionError: A configured type does not descend from
+        ``Configurable``.
+
+    :param configs:
+        Iterable of configuration dictionaries to draw from.
+
+    :param type_iter:
+        An iterable of class types to select from, a `Pluggable` interface
+        type to select implementations of, or a `TypeKeyIndex` of types to
+        select from.
+
+    :param object args:
+        Other positional arguments to pass to the configured classes'
+        ``from_config`` class method.
+
+    :param executor:
+        Optional executor to construct instances in.
+
+    :param max_pending:
+        Maximum number of constructions submitted to the executor ahead of
+        the instance last yielded.
+
+    :return: Iterator of instances of the configured class types.
+    """
+    type_source = _get_type_source(type_iter)
+    # Configured type key to the resolved type and the function constructing
+    # instances of it.
+    resolved: Dict[str, Tuple[Type[C], Callable[[Dict], C]]] = {}
+
+    def prepare(config: Dict) -> Tuple[Type[C], Callable[[Dict], C], Dict]:
+        conf_type_name = _get_config_type_name(config)
+        entry = resolved.get(conf_type_name)
+        if entry is None:
+            cls = _resolve_config_type(conf_type_name, type_source)
+            assert issubclass(cls, Configurable), \
+                "Configured class type '%s' does not descend from `Configurable`." \
+                % cls.__name__
+            entry = resolved[conf_type_name] = (cls, _batch_constructor(cls, args))
+        return entry[0], entry[1], config[conf_type_name]
+
+    if executor is None:
+        for config in configs:
+            _, construct, cls_conf = prepare(config)
+            yield construct(cls_conf)
+        return
+    yield from _imap_bounded(
+        executor, _construct,
+        ((cls, args, cls_conf) for cls, _, cls_conf in map(prepare, configs)),
+        max_pending,
+    )
+
+
 def configuration_test_helper(inst: C,
                               config_ignored_params: Union[Set, FrozenSet] = frozenset(),
                               from_config_args: Sequence = ()) -> Tuple[C, C, C]:
@@ -2,10 +2,12 @@
 Utility functions pertaining to python dictionaries.
 """
 import copy
-from typing import Dict
+from typing import Dict, List, Tuple
 
 
-def merge_dict(a: Dict, b: Dict, deep_copy: bool = False) -> Dict:
+def merge_dict(
+    a: Dict, b: Dict, deep_copy: bool = False, copy_on_write: bool = False
+) -> Dict:
     """
     Merge dictionary b into dictionary a.
 
@@ -18,19 +20,54 @@ def merge_dict(a: Dict, b: Dict, deep_copy: bool = False) -> Dict:
     Values are assigned (not copied) by default. Setting ``deep_copy`` causes
     values from ``b`` to be deep-copied into ``a``.
 
-    :param a: The "base" dictionary that is updated in place.
+    Setting ``copy_on_write`` leaves ``a``, and the dictionaries nested in it,
+    unmodified and returns a new merged dictionary instead. Only ``a`` and the
+    nested dictionaries that ``b`` merges into are shallow-copied, while all
+    other values, including untouched nested dictionaries, are shared with
+    ``a``. Merging a small ``b`` onto a large ``a`` thus costs in proportion to
+    ``b`` and the widths of the dictionaries it merges into, not the total
+    size of ``a``. Note that, because of this sharing, later in-place changes
+    to untouched nested dictionaries of either are visible in both.
+
+    Nesting is traversed iteratively, so arbitrarily deep dictionaries may be
+    merged without reaching the interpreter's recursion limit.
+
+    >>> base = {'a': 1, 'b': {'c': 2}, 'd': {'e': 3}}
+    >>> merged = merge_dict(base, {'b': {'c': 4}}, copy_on_write=True)
+    >>> merged == {'a': 1, 'b': {'c': 4}, 'd': {'e': 3}}
+    True
+    >>> base['b']
+    {'c': 2}
+    >>> merged['d'] is base['d']
+    True
+
+    :param a: The "base" dictionary that is updated in place, unless
+        ``copy_on_write`` is set.
     :param b: The dictionary to merge into ``a`` recursively.
     :param deep_copy: Optionally deep-copy values from ``b`` when assigning
         into ``a``.
+    :param copy_on_write: Optionally return a new merged dictionary instead
+        of updating ``a`` in place.
 
-    :return: ``a`` dictionary after merger (not a copy).
+    :return: ``a`` dictionary after merger (not a copy), or the new merged
+        dictionary if ``copy_on_write`` is set.
 
     """
-    for k in b:
-        if k in a and isinstance(a[k], dict) and isinstance(b[k], dict):
-            merge_dict(a[k], b[k], deep_copy)
-        elif deep_copy:
-            a[k] = copy.deepcopy(b[k])
-        else:
-            a[k] = b[k]
-    return a
+    merged = a.copy() if copy_on_write else a
+    # Pairs of dictionaries of the merged result and the dictionaries of
+    # ``b`` to merge into them.
+    stack: List[Tuple[Dict, Dict]] = [(merged, b)]
+    while stack:
+        a_sub, b_sub = stack.pop()
+        for k in b_sub:
+            a_v = a_sub.get(k)
+            b_v = b_sub[k]
+            if isinstance(a_v, dict) and isinstance(b_v, dict):
+                if copy_on_write:
+                    a_v = a_sub[k] = a_v.copy()
+                stack.append((a_v, b_v))
+            elif deep_copy:
+                a_sub[k] = copy.deepcopy(b_v)
+            else:
+                a_sub[k] = b_v
+    return merged
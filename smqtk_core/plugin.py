@@ -21,6 +21,61 @@ This discovery will follow the values of the ``PLUGIN_ENV_VAR`` and
 calling ``get_impls()`` from, using inherited values if not immediately
 specified.
 
+Results of ``get_impls()`` are memoized per interface type in the module-level
+`DISCOVERY_CACHE`. A cached result is reused for as long as the value of the
+interface's ``PLUGIN_ENV_VAR`` environment variable, the content of its
+``PLUGIN_NAMESPACE`` entry-point extensions and the set of defined `Pluggable`
+sub-classes remain unchanged. Caching may be turned off for an interface (and
+its descendants) by setting its ``PLUGIN_DISCOVERY_CACHE`` class variable to
+``False``.
+
+The ``is_usable()`` verdicts of plugin types are memoized in the module-level
+`USABILITY_CACHE`, optionally with a time-to-live, so that repeated discovery
+does not probe implementations again. When the ``SMQTK_PLUGIN_USABILITY_CACHE``
+environment variable is set to a file path, verdicts are additionally
+persisted to that file so that they are reused across process restarts for as
+long as the python interpreter, platform and installed distributions do not
+change.
+
+To avoid importing every module exposed through entry-point extensions on
+every process start, a `PluginManifest` may be generated once and stored to a
+file. When the environment variable named by an interface's
+``PLUGIN_MANIFEST_ENV_VAR`` class variable (``SMQTK_PLUGIN_MANIFEST`` by
+default) is set to a file path, ``get_impls()`` draws entry-point provided
+types from that manifest, importing only the modules that provide
+implementations of the interface being queried. The manifest file is
+(re)generated automatically when it is missing or stale.
+
+When many processes start at once, e.g. batch jobs on a cluster, the
+environment variable named by ``PLUGIN_SHARED_CACHE_ENV_VAR``
+(``SMQTK_PLUGIN_SHARED_CACHE`` by default) may be set to a directory on a
+shared file-system. A `SharedDiscoveryCache` there records which types the
+environment variable and entry-point sources provide for each interface, so
+that only the first process in an environment scans entry-points and imports
+all plugin modules.
+
+When an interface's ``PLUGIN_LAZY_TYPES`` class variable is set to ``True``,
+``get_impls()`` returns `LazyPluginType` handles instead of class types. In
+combination with a plugin manifest, this allows implementations to be listed
+without importing any of their modules until they are actually used.
+
+A plugin module hanging on import, or a plugin type hanging in its
+``is_usable()`` probe, would stall discovery indefinitely. Setting an
+interface's ``PLUGIN_TIMEOUT`` class variable to a number of seconds bounds
+the time given to each, skipping and recording in `PLUGIN_TIMEOUTS` those that
+exceed it. The budget applies to each import and probe, not to discovery as a
+whole.
+
+From within an event loop, ``aget_impls()`` and `adiscover_all` perform
+discovery in an executor so as to not block the loop.
+
+Processes that fork workers may call `warmup` beforehand so that the workers
+inherit discovery results instead of performing discovery again.
+
+To find out which sources and modules discovery spends its time, or memory,
+on, discovery may be performed within a `profile_discovery` context, which
+records a `DiscoveryProfile` report that may be exported as JSON.
+
 Because these plugin semantics are pretty low level and commonly utilized,
 logging can be extremely verbose. Logging in this module, while still exists,
 is set to emit only at log level 1 or lower ("trace").
@@ -38,13 +93,30 @@ these annotations should be updated.
 """
 
 import abc
+import ast
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import contextlib
+import functools
+import gc
+import hashlib
 import importlib
+import importlib.util
 import inspect
+import json
 import logging
 import os
+import platform
 import sys
+import tempfile
+import threading
+import time
+import tracemalloc
 import types
-from typing import cast, Collection, FrozenSet, Iterable, Set, Type, TypeVar
+import weakref
+from typing import (
+    Any, Callable, cast, Collection, Dict, FrozenSet, Hashable, Iterable,
+    Iterator, List, Mapping, Optional, Sequence, Set, Tuple, Type, TypeVar
+)
 
 # Before 3.8, we depend on importlib_metadata >=3.7.0, which is in parity with
 # the python version 3.10+ `importlib.metadata.entry_points`.
@@ -55,8 +127,8 @@ from typing import cast, Collection, FrozenSet, Iterable, Set, Type, TypeVar
 if sys.version_info >= (3, 8) and sys.version_info < (3, 10):
     import importlib.metadata as metadata
 
-    def get_ns_entrypoints(ns: str) -> Iterable["metadata.EntryPoint"]:
-        return metadata.entry_points().get(ns, ())
+    def _scan_entrypoints() -> Dict[str, Tuple["metadata.EntryPoint", ...]]:
+        return {ns: tuple(eps) for ns, eps in metadata.entry_points().items()}
 else:
     if sys.version_info < (3, 8):
         import importlib_metadata as metadata
@@ -64,8 +136,154 @@ else:
         # must be >=3.10
         import importlib.metadata as metadata
 
-    def get_ns_entrypoints(ns: str) -> Iterable["metadata.EntryPoint"]:
-        return metadata.entry_points(group=ns)  # lgtm [py/call/wrong-named-argument]
+    def _scan_entrypoints() -> Dict[str, Tuple["metadata.EntryPoint", ...]]:
+        all_eps = metadata.entry_points()
+        if isinstance(all_eps, dict):
+            # importlib_metadata <5 returns a mapping of group to entry-points.
+            return {ns: tuple(eps) for ns, eps in all_eps.items()}
+        ns_eps: Dict[str, List["metadata.EntryPoint"]] = {}
+        for ep in all_eps:
+            ns_eps.setdefault(ep.group, []).append(ep)
+        return {ns: tuple(eps) for ns, eps in ns_eps.items()}
+
+
+# Entry-points of all namespaces as of the last scan, and the state of the
+# python search path at the time of that scan.
+_ENTRYPOINT_CACHE: Optional[Tuple[Hashable, Dict[str, Tuple["metadata.EntryPoint", ...]]]] = None
+
+
+def _search_path_state() -> Hashable:
+    """
+    Get a marker of the state of the python search path, changing when an
+    entry is added to or removed from ``sys.path`` or when the content of a
+    ``sys.path`` directory changes (e.g. by installing or removing a
+    distribution in it).
+    """
+    state = []
+    for path in sys.path:
+        try:
+            mtime: Optional[int] = os.stat(path or os.curdir).st_mtime_ns
+        except OSError:
+            mtime = None
+        state.append((path, mtime))
+    return tuple(state)
+
+
+def get_ns_entrypoints(ns: str) -> Tuple["metadata.EntryPoint", ...]:
+    """
+    Get the entry-points defined for the given namespace by installed python
+    packages.
+
+    Entry-points of all namespaces are scanned for at once and cached. The
+    cache is reused for as long as ``sys.path`` and the directory content of
+    its entries do not change. Use :func:`invalidate_entrypoint_cache` to force
+    a new scan, e.g. after changing an installed distribution's metadata in
+    place.
+
+    :param ns: Entry-point namespace (group) to get the entry-points of.
+
+    :return: Entry-points defined for the namespace.
+    """
+    return _get_entrypoint_groups().get(ns, ())
+
+
+def _get_entrypoint_groups() -> Dict[str, Tuple["metadata.EntryPoint", ...]]:
+    """
+    Get the cached entry-points of all namespaces, scanning for them if the
+    cache is missing or out of date. See :func:`get_ns_entrypoints`.
+    """
+    global _ENTRYPOINT_CACHE
+    state = _search_path_state()
+    # Read the global once, as another thread may replace it concurrently.
+    cache = _ENTRYPOINT_CACHE
+    if cache is None or cache[0] != state:
+        cache = _ENTRYPOINT_CACHE = (state, _scan_entrypoints())
+    return cache[1]
+
+
+def invalidate_entrypoint_cache() -> None:
+    """
+    Drop the cached entry-points used by :func:`get_ns_entrypoints`.
+    """
+    global _ENTRYPOINT_CACHE
+    _ENTRYPOINT_CACHE = None
+
+
+def get_interface_ns(entrypoint_ns: str, interface_type: Type) -> str:
+    """
+    Get the name of the entry-point namespace scoped to the given interface
+    type within the given namespace.
+
+    Modules exposed under a scoped namespace declare that they provide
+    implementations of that interface. See
+    :func:`discover_via_entrypoint_extensions` for details.
+
+    >>> import collections.abc
+    >>> get_interface_ns("smqtk_plugins", collections.abc.Sized)
+    'smqtk_plugins.collections.abc.Sized'
+
+    :param entrypoint_ns: The entry-point namespace to scope.
+    :param interface_type: The interface type to scope the namespace to.
+
+    :return: Name of the scoped namespace.
+    """
+    return f"{entrypoint_ns}.{_type_to_key(interface_type)}"
+
+
+def _declares_interface(interface_key: str, interface_type: Type) -> bool:
+    """
+    Check if a declaration of the interface type with the given key covers the
+    given interface type, i.e. if it is the interface type or an already
+    imported descendant of it. Nothing is imported to check this.
+    """
+    if interface_key == _type_to_key(interface_type):
+        return True
+    module_name, _, attr = interface_key.rpartition(".")
+    declared = getattr(sys.modules.get(module_name), attr, None)
+    return isinstance(declared, type) and issubclass(declared, interface_type)
+
+
+def _select_ns_entrypoints(
+    entrypoint_ns: str, interface_type: Optional[Type] = None
+) -> List["metadata.EntryPoint"]:
+    """
+    Select the entry-points of the given namespace, and of the interface scoped
+    namespaces within it, that are relevant to the given interface type.
+
+    :param entrypoint_ns: The entry-point namespace to select from.
+    :param interface_type: Optional interface type to select entry-points
+        for. If None, all entry-points of the namespace and its scoped
+        namespaces are selected.
+
+    :return: Selected entry-points, without duplicate values, in namespace
+        order.
+    """
+    base_eps = get_ns_entrypoints(entrypoint_ns)
+    prefix = entrypoint_ns + "."
+    scoped = [
+        (group[len(prefix):], eps)
+        for group, eps in sorted(_get_entrypoint_groups().items())
+        if group.startswith(prefix)
+    ]
+    # Type ignoring here for the same reason as in
+    # `_load_entrypoint_modules`.
+    if interface_type is None:
+        selected = list(base_eps) + [ep for _, eps in scoped for ep in eps]
+    else:
+        declared = {ep.value for _, eps in scoped for ep in eps}  # type: ignore[attr-defined]
+        selected = [ep for ep in base_eps if ep.value not in declared]  # type: ignore[attr-defined]
+        selected += [
+            ep for iface_key, eps in scoped
+            if _declares_interface(iface_key, interface_type)
+            for ep in eps
+        ]
+    seen: Set[str] = set()
+    unique = []
+    for ep in selected:
+        if ep.value not in seen:  # type: ignore[attr-defined]
+            seen.add(ep.value)  # type: ignore[attr-defined]
+            unique.append(ep)
+    return unique
 
 
 # Environment variable *PATH separator for the current platform.
@@ -73,15 +291,800 @@ OS_ENV_PATH_SEP = os.pathsep
 
 _EMPTY_FROZENSET_STR: FrozenSet[str] = frozenset()
 
-# Generic Type variable
+# Generic Type variables
 T = TypeVar("T")
+R = TypeVar("R")
 # Type variable for something that would descend from Pluggable
 P = TypeVar("P", bound="Pluggable")
 
 LOG = logging.getLogger(__name__)
 
+# Counter that is incremented every time a new sub-class of `Pluggable` is
+# defined. This is used as a cheap marker of whether the results of
+# `discover_via_subclasses` may have changed since a discovery result was
+# cached.
+_SUBCLASS_GENERATION = 0
+
+# Registry of the descendants of each `Pluggable` type, populated as sub-classes
+# are defined. Both the keys and descendants are weakly referenced so as to not
+# prolong the lifetime of any type, in the same way as ``__subclasses__``.
+_PLUGGABLE_DESCENDANTS: "weakref.WeakKeyDictionary[Type, weakref.WeakSet[Type]]" = \
+    weakref.WeakKeyDictionary()
+# Guards the registry and generation counter above, which may be updated from
+# any thread that imports a module defining new sub-classes.
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _type_to_key(t: Type) -> str:
+    """
+    Common function for transforming a class type to its associated string key
+    for use in configuration semantics.
+
+    :param t: Type to get the key for.
+    :return: String key for the input type.
+    """
+    return f"{t.__module__}.{t.__name__}"
+
+
+# Memo of the environment fingerprint alongside the search path state it was
+# computed under.
+_FINGERPRINT_CACHE: Optional[Tuple[Hashable, str]] = None
+
+
+def _environment_fingerprint() -> str:
+    """
+    Get a digest identifying the current python interpreter, platform and
+    installed distribution versions.
+
+    The digest is memoized for as long as ``sys.path`` and the directory
+    content of its entries do not change.
+    """
+    global _FINGERPRINT_CACHE
+    state = _search_path_state()
+    cache = _FINGERPRINT_CACHE
+    if cache is None or cache[0] != state:
+        h = hashlib.sha256()
+        h.update(json.dumps([
+            sys.version, sys.executable, platform.platform(), platform.machine(),
+            sorted(_distribution_versions().items()),
+        ]).encode())
+        cache = _FINGERPRINT_CACHE = (state, h.hexdigest())
+    return cache[1]
+
+
+class DiscoveryProfile:
+    """
+    Report of where time, and optionally memory, was spent during plugin
+    discovery, as recorded while active via :func:`profile_discovery`.
+
+    The report consists of three lists of records:
+
+    * ``sources``: one record per discovery source used for an interface,
+      with keys ``"interface"``, ``"source"`` and ``"seconds"``. Sources are
+      named ``"env_var:<variable>"``, ``"entrypoint:<namespace>"``,
+      ``"manifest"``, ``"shared_cache"``, ``"subclasses"`` and ``"warmup"``,
+      while
+      ``"filter"`` records the filtering of the candidate types drawn from all
+      sources.
+    * ``imports``: one record per module imported by a source, with keys
+      ``"source"``, ``"module"``, ``"seconds"``, ``"memory_delta"`` and
+      ``"error"``. The memory delta is the change in the size of memory traced
+      by `tracemalloc` over the import, or None when memory is not traced.
+    * ``usability``: one record per ``is_usable()`` probe, with keys
+      ``"type"``, ``"seconds"`` and ``"usable"``.
+
+    Import times include the time spent importing a module's own imports,
+    and, when modules are imported concurrently, memory deltas include the
+    allocations of other concurrent imports.
+    """
+
+    def __init__(self, trace_memory: bool = True):
+        """
+        :param trace_memory: If memory deltas of imports are to be recorded.
+        """
+        self.trace_memory = trace_memory
+        self.sources: List[Dict[str, Any]] = []
+        self.imports: List[Dict[str, Any]] = []
+        self.usability: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def _traced_memory(self) -> Optional[int]:
+        if self.trace_memory and tracemalloc.is_tracing():
+            return tracemalloc.get_traced_memory()[0]
+        return None
+
+    def _append(self, records: List[Dict[str, Any]], record: Dict[str, Any]) -> None:
+        with self._lock:
+            records.append(record)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: JSON-compliant dictionary of this report.
+        """
+        with self._lock:
+            return {
+                "sources": [dict(r) for r in self.sources],
+                "imports": [dict(r) for r in self.imports],
+                "usability": [dict(r) for r in self.usability],
+            }
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        :param kwargs: Keyword arguments to pass to `json.dumps`.
+
+        :return: JSON string of this report.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def slowest_imports(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        :param n: Number of records to return.
+
+        :return: The records of the ``n`` slowest module imports, slowest
+            first.
+        """
+        with self._lock:
+            return sorted(self.imports, key=lambda r: r["seconds"], reverse=True)[:n]
+
+
+# Profile currently recording discovery, if any.
+_ACTIVE_PROFILE: Optional[DiscoveryProfile] = None
+
+
+@contextlib.contextmanager
+def profile_discovery(trace_memory: bool = True) -> Iterator[DiscoveryProfile]:
+    """
+    Record a `DiscoveryProfile` of the plugin discovery performed within this
+    context.
+
+    Only work actually performed is recorded, thus discovery results and
+    ``is_usable()`` verdicts already cached are not. Use
+    :meth:`Pluggable.refresh_impls`, or profile in a fresh process, to
+    capture a full discovery.
+
+    >>> with profile_discovery(trace_memory=False) as profile:
+    ...     _ = discover_via_env_var("SMQTK_PROFILE_EXAMPLE_UNSET")
+    >>> profile.to_dict()
+    {'sources': [], 'imports': [], 'usability': []}
+
+    :param trace_memory: If the memory deltas of module imports are to be
+        recorded. This starts `tracemalloc` for the duration of the context if
+        it is not already tracing, which slows down imports considerably.
+
+    :raises RuntimeError: Discovery is already being profiled.
+
+    :return: Context manager yielding the profile being recorded.
+    """
+    global _ACTIVE_PROFILE
+    if _ACTIVE_PROFILE is not None:
+        raise RuntimeError("Plugin discovery is already being profiled.")
+    profile = DiscoveryProfile(trace_memory)
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    _ACTIVE_PROFILE = profile
+    try:
+        yield profile
+    finally:
+        _ACTIVE_PROFILE = None
+        if start_tracing:
+            tracemalloc.stop()
+
+
+def _profiled_import(source: str, module_name: str, load: Callable[[], T]) -> T:
+    """
+    Call the given function importing a module, recording it in the active
+    discovery profile, if any.
+    """
+    profile = _ACTIVE_PROFILE
+    if profile is None:
+        return load()
+    mem_start = profile._traced_memory()
+    start = time.perf_counter()
+    error = True
+    try:
+        module = load()
+        error = False
+        return module
+    finally:
+        seconds = time.perf_counter() - start
+        mem_end = profile._traced_memory()
+        profile._append(profile.imports, {
+            "source": source,
+            "module": module_name,
+            "seconds": seconds,
+            "memory_delta": (
+                mem_end - mem_start
+                if mem_start is not None and mem_end is not None else None
+            ),
+            "error": error,
+        })
+
+
+@contextlib.contextmanager
+def _profiled_source(interface_type: Type, source: str) -> Iterator[None]:
+    """
+    Record the time spent within this context for a discovery source in the
+    active discovery profile, if any.
+    """
+    profile = _ACTIVE_PROFILE
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile._append(profile.sources, {
+            "interface": _type_to_key(interface_type),
+            "source": source,
+            "seconds": time.perf_counter() - start,
+        })
+
+
+class _DeadlineExceeded(Exception):
+    """
+    Exception for when a call made via `_call_with_deadline` exceeds its time
+    budget.
+    """
+
+
+class PluginTimeouts:
+    """
+    Record of the plugin modules whose import, and plugin types whose
+    ``is_usable()`` probe, exceeded their time budget during discovery and
+    were thus skipped.
+
+    Python offers no way to interrupt a thread, so a call exceeding its
+    budget is abandoned rather than stopped and continues in a background
+    daemon thread. While it does, discoveries skip the same module or type
+    immediately instead of waiting on it again. Once it completes, a module
+    is imported normally by the next discovery, while a late ``is_usable()``
+    verdict is discarded so that the type is probed again.
+
+    The instance of this class used during discovery is available as the
+    module-level `PLUGIN_TIMEOUTS` attribute.
+    """
+
+    def __init__(self) -> None:
+        # Pair of the kind of call, i.e. "import" or "usability", and the
+        # module name or type key, to the time budget, the time the budget
+        # was exceeded and the thread of the abandoned call.
+        self._records: Dict[Tuple[str, str], Tuple[float, float, threading.Thread]] = {}
+        self._lock = threading.Lock()
+        # Incremented on each skip so that callers may tell whether anything
+        # was skipped during some operation.
+        self.generation = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return any(n == name for _, n in self._records)
+
+    def _record(self, kind: str, name: str, budget: float, thread: threading.Thread) -> None:
+        with self._lock:
+            self._records[(kind, name)] = (budget, time.time(), thread)
+            self.generation += 1
+
+    def _skip_pending(self, kind: str, name: str) -> bool:
+        """
+        Get if an abandoned call of the given kind for the given name is still
+        running, counting it as a skip if so.
+        """
+        with self._lock:
+            entry = self._records.get((kind, name))
+            if entry is None or not entry[2].is_alive():
+                return False
+            self.generation += 1
+            return True
+
+    def pending(self, kind: str, name: str) -> bool:
+        """
+        Get if an abandoned call of the given kind for the given module name or
+        type key is still running.
+        """
+        with self._lock:
+            entry = self._records.get((kind, name))
+        return entry is not None and entry[2].is_alive()
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Get a record of each module or type that exceeded its budget, with
+        keys ``"kind"`` (``"import"`` or ``"usability"``), ``"name"``,
+        ``"budget"`` in seconds, ``"time"`` at which the budget was exceeded
+        and if the abandoned call is still ``"pending"``.
+        """
+        with self._lock:
+            items = sorted(self._records.items(), key=lambda i: i[1][1])
+        return [
+            {
+                "kind": kind, "name": name, "budget": budget, "time": t,
+                "pending": thread.is_alive(),
+            }
+            for (kind, name), (budget, t, thread) in items
+        ]
+
+    def clear(self) -> None:
+        """
+        Drop all records. Abandoned calls still running are waited on again
+        by later discoveries.
+        """
+        with self._lock:
+            self._records.clear()
+
+
+PLUGIN_TIMEOUTS = PluginTimeouts()
+
+
+def _call_with_deadline(
+    kind: str,
+    name: str,
+    timeout: Optional[float],
+    func: Callable[[], T],
+) -> T:
+    """
+    Call the given function, giving up on it after the given number of
+    seconds.
+
+    The function is called in a separate daemon thread that is abandoned,
+    and recorded in `PLUGIN_TIMEOUTS`, if it exceeds the budget.
+
+    :param kind: Kind of call, i.e. "import" or "usability".
+    :param name: Name of the module, or key of the type, the call is for.
+    :param timeout: Time budget in seconds. If this is None, the function is
+        called directly in the calling thread.
+    :param func: Function to call.
+
+    :raises _DeadlineExceeded: The call exceeded its budget, or an earlier
+        call for the same kind and name exceeded its budget and is still
+        running.
+
+    :return: The function's return value.
+    """
+    if timeout is None:
+        return func()
+    if PLUGIN_TIMEOUTS._skip_pending(kind, name):
+        raise _DeadlineExceeded(f"Previous {kind} of '{name}' has not completed yet.")
+    outcome: "Future[T]" = Future()
+
+    def run() -> None:
+        try:
+            outcome.set_result(func())
+        except BaseException as ex:
+            outcome.set_exception(ex)
+
+    thread = threading.Thread(target=run, name=f"smqtk-plugin-{kind}:{name}", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        PLUGIN_TIMEOUTS._record(kind, name, timeout, thread)
+        LOG.warning(
+            "Plugin %s of '%s' exceeded its time budget of %g seconds and "
+            "was skipped.", kind, name, timeout
+        )
+        raise _DeadlineExceeded(f"{kind} of '{name}' exceeded {timeout} seconds.")
+    return outcome.result()
+
+
+def _import_with_deadline(
+    source: str, module_name: str, load: Callable[[], T], timeout: Optional[float]
+) -> Optional[T]:
+    """
+    Call the given function importing a module, as `_profiled_import` does,
+    under an optional time budget.
+
+    :return: The imported module, or None if importing it exceeded the
+        budget.
+    """
+    try:
+        return _profiled_import(
+            source, module_name,
+            functools.partial(_call_with_deadline, "import", module_name, timeout, load),
+        )
+    except _DeadlineExceeded:
+        return None
+
+
+class PersistentUsabilityStore:
+    """
+    File-backed store of ``is_usable()`` verdicts keyed by type key, valid only
+    for the environment they were recorded in.
+
+    The file is a JSON object of the format:
+
+    .. code-block:: json
 
-def is_valid_plugin(cls: Type, interface_type: Type) -> bool:
+        {
+            "format_version": 1,
+            "fingerprint": "<environment digest>",
+            "verdicts": {"plugin.module.Impl": [true, 1234567890.0]}
+        }
+
+    where each verdict is recorded with the time (seconds since the epoch) it
+    was probed. Verdicts recorded under a different environment fingerprint
+    than the current one are ignored and discarded on the next write.
+
+    Verdicts may be recorded without writing the file, to be written together
+    by a later :meth:`flush`. A file that cannot be written, e.g. a read-only
+    one prebuilt for a container image, is still read from, while newly
+    recorded verdicts are only retained in memory. Instances are safe to use
+    from multiple threads.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.fingerprint = _environment_fingerprint()
+        self._lock = threading.Lock()
+        # If verdicts have been recorded since the file was last written.
+        self._unwritten = False
+        self._verdicts = self._read()
+
+    def _read(self) -> Dict[str, List]:
+        try:
+            with open(self.filepath) as f:
+                d = json.load(f)
+        except (OSError, ValueError) as ex:
+            LOG.log(1, f"Could not load usability cache '{self.filepath}': {ex}")
+            return {}
+        if (
+            not isinstance(d, dict)
+            or d.get("format_version") != self.FORMAT_VERSION
+            or d.get("fingerprint") != self.fingerprint
+        ):
+            LOG.log(1, f"Usability cache '{self.filepath}' is for a different environment.")
+            return {}
+        return d.get("verdicts", {})
+
+    def _merge(self) -> None:
+        """
+        Merge in verdicts that other processes may have written in the
+        meantime, with ours taking precedence.
+        """
+        verdicts = self._read()
+        verdicts.update(self._verdicts)
+        self._verdicts = verdicts
+
+    def _write(self) -> None:
+        """
+        Write the verdicts to the file. Failing to do so, e.g. because the
+        file is read-only, is logged and otherwise ignored, as the verdicts
+        are retained in memory.
+        """
+        try:
+            _atomic_write_text(self.filepath, json.dumps({
+                "format_version": self.FORMAT_VERSION,
+                "fingerprint": self.fingerprint,
+                "verdicts": self._verdicts,
+            }, indent=2, sort_keys=True))
+        except OSError as ex:
+            LOG.warning("Could not write usability cache '%s': %s", self.filepath, ex)
+
+    def get(self, type_key: str) -> Optional[Tuple[bool, float]]:
+        """
+        :return: The recorded verdict and the time it was probed for the
+            given type key, or None if there is none.
+        """
+        with self._lock:
+            entry = self._verdicts.get(type_key)
+        if entry is None:
+            return None
+        return bool(entry[0]), float(entry[1])
+
+    def put(self, type_key: str, usable: bool, probe_time: float, flush: bool = True) -> None:
+        """
+        Record the verdict for the given type key.
+
+        :param type_key: Key of the type the verdict is for.
+        :param usable: The verdict.
+        :param probe_time: The time the verdict was probed.
+        :param flush: If the file is to be written now. Otherwise, the verdict
+            is written by the next :meth:`flush`.
+        """
+        with self._lock:
+            self._verdicts[type_key] = [usable, probe_time]
+            self._unwritten = True
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write the verdicts recorded since the file was last written, if any,
+        to the file.
+        """
+        with self._lock:
+            if self._unwritten:
+                self._merge()
+                self._write()
+                self._unwritten = False
+
+    def discard(self, type_key: Optional[str] = None) -> None:
+        """
+        Remove the verdict for the given type key, or all verdicts if None,
+        from the file.
+        """
+        with self._lock:
+            self._merge()
+            if type_key is None:
+                self._verdicts.clear()
+            else:
+                self._verdicts.pop(type_key, None)
+            self._write()
+            self._unwritten = False
+
+
+class UsabilityCache:
+    """
+    Memoization of `Pluggable.is_usable` verdicts per class type.
+
+    Verdicts are retained until invalidated via :meth:`invalidate` or, if a
+    time-to-live is set, until they are older than that many seconds. Classes
+    are weakly referenced so as to not prolong their lifetime.
+
+    When the environment variable named by ``persist_env_var`` is set to a
+    file path, verdicts not yet memoized in this process are looked up in,
+    and newly probed verdicts are written to, a `PersistentUsabilityStore` at
+    that path. Within a :meth:`batched_writes` context, as used by
+    `filter_plugin_types`, newly probed verdicts are written together when
+    the context exits instead of one at a time.
+
+    The instance of this class used by `is_valid_plugin` is available as the
+    module-level `USABILITY_CACHE` attribute.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        persist_env_var: str = "SMQTK_PLUGIN_USABILITY_CACHE",
+    ):
+        """
+        :param ttl: Optional maximum age, in seconds, of verdicts before they
+            are re-probed. If None, verdicts do not expire.
+        :param persist_env_var: Name of the environment variable that may
+            specify the file path of a persistent verdict store.
+        """
+        self.ttl = ttl
+        self.persist_env_var = persist_env_var
+        self._verdicts: "weakref.WeakKeyDictionary[Type, Tuple[bool, float]]" = \
+            weakref.WeakKeyDictionary()
+        self._store: Optional[PersistentUsabilityStore] = None
+        # Number of `batched_writes` contexts currently entered.
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+
+    def _get_store(self) -> Optional[PersistentUsabilityStore]:
+        """
+        Get the persistent store specified by the environment, if any.
+        """
+        filepath = os.environ.get(self.persist_env_var, "")
+        if not filepath:
+            return None
+        with self._lock:
+            store = self._store
+            if store is None or store.filepath != filepath:
+                self._store = PersistentUsabilityStore(filepath)
+        if store is not None and store is not self._store:
+            # Verdicts not yet written to the previous store are not lost.
+            store.flush()
+        return self._store
+
+    @contextlib.contextmanager
+    def batched_writes(self) -> Iterator[None]:
+        """
+        Defer writing newly probed verdicts to the persistent store until the
+        outermost of nested, or concurrently entered, contexts exits, at which
+        point they are written at once.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                flush = self._batch_depth == 0
+            if flush:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Write verdicts not yet written to the persistent store, if any.
+        """
+        with self._lock:
+            store = self._store
+        if store is not None:
+            store.flush()
+
+    def _is_expired(self, probe_time: float, now: float) -> bool:
+        return self.ttl is not None and now - probe_time > self.ttl
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._verdicts)
+
+    def __contains__(self, cls: Type) -> bool:
+        with self._lock:
+            return cls in self._verdicts
+
+    def is_usable(self, cls: Type["Pluggable"], timeout: Optional[float] = None) -> bool:
+        """
+        Get the memoized ``is_usable()`` verdict of the given class, probing
+        the class if there is no verdict yet or if it has expired.
+
+        :param cls: The `Pluggable` class type to get the verdict of.
+        :param timeout: Optional time budget, in seconds, for probing the
+            class. A class whose probe exceeds it is reported as not usable,
+            without memoizing that verdict, and is recorded in
+            `PLUGIN_TIMEOUTS`.
+
+        :return: If the class reports as usable.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._verdicts.get(cls)
+        if entry is None or self._is_expired(entry[1], now):
+            store = self._get_store()
+            type_key = _type_to_key(cls)
+            entry = store.get(type_key) if store is not None else None
+            flush = False
+            if entry is None or self._is_expired(entry[1], now):
+                start = time.perf_counter()
+                try:
+                    entry = (bool(_call_with_deadline("usability", type_key, timeout, cls.is_usable)), now)
+                except _DeadlineExceeded:
+                    return False
+                profile = _ACTIVE_PROFILE
+                if profile is not None:
+                    profile._append(profile.usability, {
+                        "type": type_key,
+                        "seconds": time.perf_counter() - start,
+                        "usable": entry[0],
+                    })
+                if store is not None:
+                    # Recorded under the lock so that a batch exiting
+                    # concurrently either flushes this verdict or leaves it
+                    # to be flushed here.
+                    with self._lock:
+                        store.put(type_key, *entry, flush=False)
+                        flush = self._batch_depth == 0
+            with self._lock:
+                self._verdicts[cls] = entry
+            if flush:
+                cast(PersistentUsabilityStore, store).flush()
+        return entry[0]
+
+    def invalidate(self, cls: Optional[Type] = None) -> None:
+        """
+        Drop memoized verdicts, including persisted ones.
+
+        :param cls: The class type to drop the verdict of. If this is None,
+            all verdicts are dropped.
+        """
+        with self._lock:
+            if cls is None:
+                self._verdicts.clear()
+            else:
+                self._verdicts.pop(cls, None)
+        store = self._get_store()
+        if store is not None:
+            store.discard(None if cls is None else _type_to_key(cls))
+
+
+USABILITY_CACHE = UsabilityCache()
+
+# Reasons for which `is_valid_plugin` may reject a candidate type.
+_SKIP_IS_INTERFACE = "Literally the base class."
+_SKIP_NOT_DESCENDANT = "Does not descend from base class."
+_SKIP_ABSTRACT = "Does not implement one or more abstract methods"
+_SKIP_NOT_USABLE = "Class does not report as usable."
+
+
+class PluginVerdictCache:
+    """
+    Memoization of the structural part of `is_valid_plugin` verdicts per
+    candidate and interface type pair, i.e. whether the candidate is a
+    strict, non-abstract descendant of the interface.
+
+    The usability part of verdicts is memoized separately, in
+    `USABILITY_CACHE`, so that it may expire independently. Both candidate and
+    interface types are weakly referenced so as to not prolong their lifetime.
+    Candidates that cannot be weakly referenced are not memoized.
+
+    Since a type's bases and abstract methods are fixed on definition in all
+    but exotic cases, entries are only dropped explicitly via
+    :meth:`invalidate`.
+
+    The instance of this class used by `is_valid_plugin` is available as the
+    module-level `PLUGIN_VERDICT_CACHE` attribute.
+    """
+
+    def __init__(self) -> None:
+        # Interface type to mapping of candidate types to a pair of the reason
+        # of rejection, if any, and if the candidate is a `Pluggable` type.
+        self._verdicts: \
+            "weakref.WeakKeyDictionary[Type, weakref.WeakKeyDictionary[Type, Tuple[Optional[str], bool]]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(v) for v in self._verdicts.values())
+
+    def __contains__(self, pair: Tuple[Type, Type]) -> bool:
+        cls, interface_type = pair
+        with self._lock:
+            iface_verdicts = self._verdicts.get(interface_type)
+            return iface_verdicts is not None and cls in iface_verdicts
+
+    @staticmethod
+    def _evaluate(cls: Type, interface_type: Type) -> Tuple[Optional[str], bool]:
+        if cls is interface_type:
+            return _SKIP_IS_INTERFACE, False
+        elif not issubclass(cls, interface_type):
+            return _SKIP_NOT_DESCENDANT, False
+        elif inspect.isabstract(cls):
+            return _SKIP_ABSTRACT, False
+        # Descendants of a `Pluggable` interface are known to be `Pluggable`
+        # without a potentially costly check of the candidate itself.
+        return None, issubclass(interface_type, Pluggable) or issubclass(cls, Pluggable)
+
+    def verdict(self, cls: Type, interface_type: Type) -> Tuple[Optional[str], bool]:
+        """
+        Get the memoized structural verdict of the given candidate type with
+        respect to the given interface type, evaluating it if there is none
+        yet.
+
+        :param cls: The candidate class type.
+        :param interface_type: The interface type under consideration.
+
+        :return: The reason the candidate is rejected, or None if it is not,
+            and if the candidate's usability remains to be checked, i.e. if it
+            is a `Pluggable` type.
+        """
+        try:
+            with self._lock:
+                iface_verdicts = self._verdicts.get(interface_type)
+                if iface_verdicts is None:
+                    iface_verdicts = self._verdicts[interface_type] = weakref.WeakKeyDictionary()
+                entry = iface_verdicts.get(cls)
+        except TypeError:
+            # One of the types cannot be weakly referenced.
+            return self._evaluate(cls, interface_type)
+        if entry is None:
+            # Evaluated outside the lock as sub-class checks may call
+            # arbitrary code.
+            entry = self._evaluate(cls, interface_type)
+            with self._lock:
+                iface_verdicts[cls] = entry
+        return entry
+
+    def invalidate(self, cls: Optional[Type] = None) -> None:
+        """
+        Drop memoized verdicts.
+
+        :param cls: The type to drop the verdicts of, as either a candidate
+            or an interface. If this is None, all verdicts are dropped.
+        """
+        with self._lock:
+            if cls is None:
+                self._verdicts.clear()
+                return
+            try:
+                self._verdicts.pop(cls, None)
+                for iface_verdicts in list(self._verdicts.values()):
+                    iface_verdicts.pop(cls, None)
+            except TypeError:
+                pass
+
+
+PLUGIN_VERDICT_CACHE = PluginVerdictCache()
+
+
+def is_valid_plugin(cls: Type, interface_type: Type, timeout: Optional[float] = None) -> bool:
     """
     Determine if a class type is a valid candidate for plugin discovery.
 
@@ -95,51 +1098,49 @@ def is_valid_plugin(cls: Type, interface_type: Type) -> bool:
            properties if the `abc.ABCMeta` metaclass has been used).
 
         4. If the cls is a subclass of Pluggable, it must report as usable via
-           its is_usable() class method.
+           its is_usable() class method. This verdict is memoized in
+           `USABILITY_CACHE`.
+
+    The verdict on conditions 1 through 3 is memoized per class and interface
+    type pair in `PLUGIN_VERDICT_CACHE`.
 
     Logging for this function, when enabled can be very verbose, and is only
     active with a logging level of 1 or lower.
 
     :param cls: The class type whose validity is being tested
     :param interface_type: The base class under consideration
+    :param timeout: Optional time budget, in seconds, for the ``is_usable()``
+        probe of condition 4. A class whose probe exceeds it is not valid. See
+        `UsabilityCache.is_usable`.
 
     :return: ``True`` if the class is a valid candidate for discovery, and
         ``False`` otherwise.
     :rtype: bool
     """
-    log_prefix = f"[{interface_type.__name__} ->? {cls.__module__}.{cls.__name__}]"
     llevel = 1
-    if cls is interface_type:
-        LOG.log(llevel, f"{log_prefix} [skip] Literally the base class.")
-        return False
-    elif not issubclass(cls, interface_type):
-        LOG.log(llevel, f"{log_prefix} [skip] Does not descend from base class.")
-        return False
-    else:
-        # We've narrowed cls down to a subclass of `interface_type`.
-        # Next we want to know if there are not-yet-implemented
-        # abstract methods.
-        if inspect.isabstract(cls):
+    reason, check_usable = PLUGIN_VERDICT_CACHE.verdict(cls, interface_type)
+    if check_usable and not USABILITY_CACHE.is_usable(cls, timeout):
+        reason = _SKIP_NOT_USABLE
+    # Only build log messages when they would be emitted, as this function
+    # may be called for very many candidates.
+    if LOG.isEnabledFor(llevel):
+        if reason is None:
+            message = "[KEEP] Retaining subclass."
+        elif reason is _SKIP_ABSTRACT:
             # Type checking does not easily introspect that
             # `__abstractmethods__` is an attribute of types derived from that
             # metaclass, thus the use of `getattr` here.
             cls_abstract_methods: FrozenSet[str] = getattr(
                 cls, "__abstractmethods__", _EMPTY_FROZENSET_STR
             )
-            LOG.log(
-                llevel,
-                f"{log_prefix} [skip] Does not implement one or "
-                f"more abstract methods: {list(cls_abstract_methods)}"
-            )
-            return False
-        elif issubclass(cls, Pluggable) and not cls.is_usable():
-            # Class inherits from Pluggable and does not report itself as
-            # usable.
-            LOG.log(llevel, f"{log_prefix} [skip] Class does not report as usable.")
-            return False
+            message = f"[skip] {reason}: {list(cls_abstract_methods)}"
         else:
-            LOG.log(llevel, f"{log_prefix} [KEEP] Retaining subclass.")
-            return True
+            message = f"[skip] {reason}"
+        LOG.log(
+            llevel, "[%s ->? %s.%s] %s",
+            interface_type.__name__, cls.__module__, cls.__name__, message
+        )
+    return reason is None
 
 
 def _collect_types_in_module(module: types.ModuleType) -> Set[Type]:
@@ -162,7 +1163,254 @@ def _collect_types_in_module(module: types.ModuleType) -> Set[Type]:
     return type_set
 
 
-def discover_via_env_var(env_var: str) -> Set[Type]:
+def _map_ordered(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: Optional[int] = None,
+) -> List[R]:
+    """
+    Apply a function to each item, optionally concurrently across a pool of
+    threads, returning results in the order of the input items.
+
+    When run concurrently, all items are processed before the exception
+    raised for the first failing item, in input order, is propagated. This is
+    the same exception that sequential processing would have raised.
+
+    :param func: Function to apply.
+    :param items: Items to apply the function to.
+    :param max_workers: Maximum number of threads to use. If this is None or
+        less than 2, items are processed sequentially in the calling thread.
+
+    :return: List of function results, in input order.
+    """
+    if max_workers is None or max_workers < 2 or len(items) < 2:
+        return [func(i) for i in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        futures = [pool.submit(func, i) for i in items]
+        return [f.result() for f in futures]
+
+
+class _ModuleScan:
+    """
+    Result of statically scanning a python module's source.
+
+    :ivar classes: Mapping of top-level class names to the names of their
+        bases. A base name is None if its expression is not a plain or dotted
+        name.
+    :ivar imported_modules: Absolute names of modules imported (possibly).
+    :ivar imported_names: Original names of attributes imported from other
+        modules.
+    :ivar base_modules: Absolute names of the modules that class bases are
+        imported from.
+    :ivar opaque: If the module cannot be reasoned about statically, e.g.
+        because its source is not available or it uses a star import.
+    """
+
+    def __init__(self) -> None:
+        self.classes: Dict[str, List[Optional[str]]] = {}
+        self.imported_modules: Set[str] = set()
+        self.imported_names: Set[str] = set()
+        self.base_modules: Set[str] = set()
+        self.opaque = False
+
+
+def _base_name(node: ast.expr, aliases: Dict[str, str]) -> Optional[str]:
+    """
+    Get the name a class base expression refers to, following import aliases,
+    or None if it is not a plain or dotted name (e.g. a function call).
+    """
+    if isinstance(node, ast.Subscript):
+        # Generic parameterization, e.g. ``Base[T]``.
+        node = node.value
+    if isinstance(node, ast.Name):
+        return aliases.get(node.id, node.id)
+    elif isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _base_module(node: ast.expr, origins: Dict[str, str]) -> Optional[str]:
+    """
+    Get the absolute name of the module a class base expression refers to an
+    attribute of, following imports, or None if it does not refer to an
+    imported name.
+
+    :param node: The class base expression.
+    :param origins: Mapping of names bound by imports to the absolute dotted
+        names they refer to.
+    """
+    if isinstance(node, ast.Subscript):
+        node = node.value
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name) or node.id not in origins:
+        return None
+    parts.append(origins[node.id])
+    return ".".join(reversed(parts)).rpartition(".")[0] or None
+
+
+def _module_level_classes(tree: ast.Module) -> Iterator[ast.ClassDef]:
+    """
+    Yield the class definitions of a parsed module that bind module
+    attributes, i.e. those at the top level, including within conditional,
+    ``try`` and ``with`` blocks, but not those within function or other class
+    bodies.
+    """
+    stack: List[ast.AST] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.ClassDef):
+            yield node
+        elif not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.expr)):
+            # Blocks of compound statements, exception handlers and match
+            # cases.
+            stack.extend(reversed([
+                c for c in ast.iter_child_nodes(node) if not isinstance(c, ast.expr)
+            ]))
+
+
+def _scan_module_source(module_name: str) -> _ModuleScan:
+    """
+    Statically scan the source of a module without importing it. Parent
+    packages of the module are imported in order to locate it, however.
+
+    :raises ModuleNotFoundError: The module could not be found.
+    """
+    scan = _ModuleScan()
+    spec = importlib.util.find_spec(module_name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{module_name}'", name=module_name)
+    get_source = getattr(spec.loader, "get_source", None)
+    try:
+        source = get_source(module_name) if get_source is not None else None
+        tree = ast.parse(source) if source is not None else None
+    except (ImportError, SyntaxError, ValueError):
+        tree = None
+    if tree is None:
+        scan.opaque = True
+        return scan
+    package = module_name if spec.submodule_search_locations is not None \
+        else module_name.rpartition(".")[0]
+    aliases: Dict[str, str] = {}
+    origins: Dict[str, str] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            scan.imported_modules.update(a.name for a in node.names)
+            for a in node.names:
+                if a.asname:
+                    origins[a.asname] = a.name
+                else:
+                    top = a.name.partition(".")[0]
+                    origins[top] = top
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                source_module = importlib.util.resolve_name(
+                    "." * node.level + (node.module or ""), package
+                )
+            except (ImportError, ValueError):
+                continue
+            scan.imported_modules.add(source_module)
+            for a in node.names:
+                if a.name == "*":
+                    scan.opaque = True
+                    continue
+                # The imported name may be a sub-module.
+                scan.imported_modules.add(f"{source_module}.{a.name}")
+                scan.imported_names.add(a.name)
+                origins[a.asname or a.name] = f"{source_module}.{a.name}"
+                if a.asname:
+                    aliases[a.asname] = a.name
+    for node in _module_level_classes(tree):
+        # A class may be defined differently in alternative blocks.
+        scan.classes.setdefault(node.name, []).extend(_base_name(b, aliases) for b in node.bases)
+        scan.base_modules.update(
+            m for m in (_base_module(b, origins) for b in node.bases) if m
+        )
+    return scan
+
+
+def _filter_plausible_modules(
+    interface_type: Type, module_names: Sequence[str]
+) -> List[str]:
+    """
+    Filter the given module names to those whose source, as statically
+    scanned, plausibly defines, imports or imports modules that define,
+    classes that descend from the given interface type.
+
+    A class is considered to plausibly descend from the interface if one of
+    its bases is named the same as the interface, one of its currently defined
+    descendants or another plausibly descending class found in the scanned
+    modules. Modules within the same top-level packages that are imported by
+    the given modules are scanned as well. Modules that are already imported,
+    or cannot be reasoned about statically, are always retained. So are
+    modules defining classes with bases imported from modules that are
+    neither scanned nor imported, e.g. from another package, as whether
+    those bases descend from the interface is not known.
+
+    :raises ModuleNotFoundError: A given module could not be found.
+    """
+    top_level = {name.partition(".")[0] for name in module_names}
+    scans: Dict[str, _ModuleScan] = {}
+    to_scan = list(module_names)
+    while to_scan:
+        name = to_scan.pop()
+        if name in scans or name in sys.modules:
+            continue
+        try:
+            scans[name] = _scan_module_source(name)
+        except ModuleNotFoundError:
+            if name in module_names:
+                raise
+            # An imported name that is not a module.
+            continue
+        to_scan.extend(
+            m for m in scans[name].imported_modules
+            if m.partition(".")[0] in top_level
+        )
+
+    plausible = {interface_type.__name__}
+    plausible.update(t.__name__ for t in discover_via_subclasses(interface_type))
+    changed = True
+    while changed:
+        changed = False
+        for scan in scans.values():
+            for cls_name, bases in scan.classes.items():
+                if cls_name not in plausible and any(b in plausible for b in bases):
+                    plausible.add(cls_name)
+                    changed = True
+
+    relevant = {
+        name for name, scan in scans.items()
+        if scan.opaque
+        or any(m not in scans and m not in sys.modules for m in scan.base_modules)
+        or scan.imported_names & plausible
+        or any(None in bases or plausible.intersection(bases) for bases in scan.classes.values())
+    }
+    # Modules importing relevant modules are relevant too.
+    changed = True
+    while changed:
+        changed = False
+        for name, scan in scans.items():
+            if name not in relevant and scan.imported_modules & relevant:
+                relevant.add(name)
+                changed = True
+    kept = [n for n in module_names if n in sys.modules or n in relevant]
+    LOG.log(
+        1,
+        f"[{interface_type.__name__}] Static scan retained modules {kept} of "
+        f"{list(module_names)}."
+    )
+    return kept
+
+
+def discover_via_env_var(
+    env_var: str,
+    max_workers: Optional[int] = None,
+    scan_for: Optional[Type] = None,
+    timeout: Optional[float] = None,
+) -> Set[Type]:
     """
     Discover and return types specified in python-importable modules
     specified in the given environment variable.
@@ -186,7 +1434,29 @@ def discover_via_env_var(env_var: str) -> Set[Type]:
 
     Any errors raised from attempting to import a module are propagated upward.
 
+    Modules may optionally be imported concurrently across a pool of threads,
+    which may reduce discovery time when importing is I/O bound (e.g. modules
+    on a network file-system). When doing so, all modules are attempted to be
+    imported before the error of the first failing module, in the order
+    listed, is propagated upward. Note that concurrent import of modules that
+    circularly import each other may expose partially initialized modules.
+
+    A time budget may optionally be given for the import of each module, so
+    that a module hanging on import, e.g. while probing for a missing device
+    driver, does not stall discovery. Modules exceeding it are skipped and
+    recorded in `PLUGIN_TIMEOUTS`. Discovery then takes at most about the
+    budget times the number of modules, divided by the number of workers.
+
     :param env_var: The name of the environment variable to read from.
+    :param max_workers: Maximum number of threads to import modules with. If
+        this is None or less than 2, modules are imported sequentially.
+    :param scan_for: Optional interface type to restrict importing to modules
+        that plausibly provide descendants of. Module sources are statically
+        scanned first and modules that do not define or import anything
+        plausibly descending from this type are not imported. Parent packages
+        of modules are still imported in order to locate the modules.
+    :param timeout: Optional time budget, in seconds, for importing each
+        module.
 
     :raises ModuleNotFoundError: When one or more module paths specified in the
         given environment variable are not importable.
@@ -204,20 +1474,28 @@ def discover_via_env_var(env_var: str) -> Set[Type]:
             f"Environment variable `{env_var}` not defined or did not "
             f"contain any module paths."
         )
-    for path in env_var_paths:
-        # Skip empty strings
-        if path:
-            # May raise ModuleNotFoundError if `path` is not a valid,
-            # importable module path.
-            m = importlib.import_module(path)
-            m_tset = _collect_types_in_module(m)
-            LOG.log(
-                llevel,
-                f"For environment variable `{env_var}`, found module "
-                f"path `{path}` with types: "
-                f"{[t.__name__ for t in m_tset]}"
-            )
-            type_set.update(m_tset)
+    # Skip empty strings
+    env_var_paths = [path for path in env_var_paths if path]
+    if scan_for is not None:
+        env_var_paths = _filter_plausible_modules(scan_for, env_var_paths)
+    # May raise ModuleNotFoundError if a path is not a valid, importable module
+    # path.
+    source = f"env_var:{env_var}"
+    modules = _map_ordered(
+        lambda p: _import_with_deadline(source, p, functools.partial(importlib.import_module, p), timeout),
+        env_var_paths, max_workers,
+    )
+    for path, m in zip(env_var_paths, modules):
+        if m is None:
+            continue
+        m_tset = _collect_types_in_module(m)
+        LOG.log(
+            llevel,
+            f"For environment variable `{env_var}`, found module "
+            f"path `{path}` with types: "
+            f"{[t.__name__ for t in m_tset]}"
+        )
+        type_set.update(m_tset)
     return type_set
 
 
@@ -228,7 +1506,13 @@ class NotAModuleError(Exception):
     """
 
 
-def discover_via_entrypoint_extensions(entrypoint_ns: str) -> Set[Type]:
+def discover_via_entrypoint_extensions(
+    entrypoint_ns: str,
+    max_workers: Optional[int] = None,
+    scan_for: Optional[Type] = None,
+    interface_type: Optional[Type] = None,
+    timeout: Optional[float] = None,
+) -> Set[Type]:
     """
     Discover and return types defined in modules exposed through the
     entry-point extensions defined for the given namespace by installed python
@@ -264,16 +1548,95 @@ def discover_via_entrypoint_extensions(entrypoint_ns: str) -> Set[Type]:
         }
         ...
 
+    Modules may also declare which interfaces they provide implementations of
+    by being exposed under the namespace scoped to each such interface instead,
+    named by :func:`get_interface_ns` as the namespace followed by the
+    interface's type key, e.g.::
+
+        ...
+        entry_points = {
+            "smqtk_plugins.my_interfaces.MyInterface": [
+                "my_package = my_package.plugins",
+            ]
+        }
+        ...
+
+    When an ``interface_type`` is given, only modules that declare that
+    interface, or an already imported descendant of it, are loaded, as well
+    as modules that do not declare any interface. Modules should therefore
+    declare every interface, including parent interfaces, they should be
+    discovered for. When no ``interface_type`` is given, all modules are
+    loaded.
+
+    Modules may optionally be loaded concurrently across a pool of threads,
+    and under a time budget per module, with the same considerations as
+    described for :func:`discover_via_env_var`.
+
     :param entrypoint_ns: The name of the entry-point mapping in  to look for
         extensions under.
+    :param max_workers: Maximum number of threads to load modules with. If
+        this is None or less than 2, modules are loaded sequentially.
+    :param scan_for: Optional interface type to restrict loading to modules
+        that plausibly provide descendants of, as described for
+        :func:`discover_via_env_var`.
+    :param interface_type: Optional interface type to restrict loading to
+        modules that declare it or declare nothing, as described above.
+    :param timeout: Optional time budget, in seconds, for loading each
+        module.
+
+    :raises NotAModuleError: An entry-point did not specify a module.
 
     :return: Set of discovered types from the modules and class types specified
         in the extensions under the specified entry-point.
     """
+    def scan_filter(
+        entry_points: List["metadata.EntryPoint"]
+    ) -> List["metadata.EntryPoint"]:
+        # Entry-points specifying an attribute are retained to be reported as
+        # not being a module.
+        kept = set(_filter_plausible_modules(
+            cast(Type, scan_for), [ep.module for ep in entry_points if not ep.attr]
+        ))
+        return [ep for ep in entry_points if ep.attr or ep.module in kept]
+
+    entry_points = _select_ns_entrypoints(entrypoint_ns, interface_type)
+    if scan_for is not None:
+        entry_points = scan_filter(entry_points)
     type_set: Set[Type] = set()
-    for entry_point in get_ns_entrypoints(entrypoint_ns):
-        m = entry_point.load()
-        if not isinstance(m, types.ModuleType):
+    for _, m in _load_entrypoint_modules(entry_points, max_workers, timeout):
+        type_set.update(_collect_types_in_module(m))
+    return type_set
+
+
+def _load_entrypoint_modules(
+    entry_points: Sequence["metadata.EntryPoint"],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> List[Tuple["metadata.EntryPoint", types.ModuleType]]:
+    """
+    Load the modules specified by the given entry-points.
+
+    :param entry_points: The entry-points to load modules of.
+    :param max_workers: Maximum number of threads to load modules with.
+    :param timeout: Optional time budget, in seconds, for loading each
+        module. Modules exceeding it are omitted from the result.
+
+    :raises NotAModuleError: An entry-point did not specify a module.
+
+    :return: List of entry-point and loaded module pairs.
+    """
+    ep_modules = []
+    # Type ignoring here for the same reason as below.
+    loaded = _map_ordered(
+        lambda ep: _import_with_deadline(
+            f"entrypoint:{ep.group}", ep.value, ep.load, timeout  # type: ignore[attr-defined]
+        ),
+        entry_points, max_workers,
+    )
+    for entry_point, m in zip(entry_points, loaded):
+        if m is None:
+            continue
+        if not isinstance(m, types.ModuleType):
             # Type ignoring here has to do with mypy in py3.7 not recognizing
             # these attributes, which are indeed valid, as existing in the
             # EntryPoint namedtuple.
@@ -288,9 +1651,8 @@ def discover_via_entrypoint_extensions(entrypoint_ns: str) -> Set[Type]:
                 "`foo = package.module:class`. Please change it to "
                 "`foo = package.module` to fix the issue."
             )
-        else:
-            type_set.update(_collect_types_in_module(m))
-    return type_set
+        ep_modules.append((entry_point, m))
+    return ep_modules
 
 
 def discover_via_subclasses(interface_type: Type) -> Set[Type]:
@@ -310,7 +1672,10 @@ def discover_via_subclasses(interface_type: Type) -> Set[Type]:
     depending on the import state at the time of invocation. E.g. further
     imports may increase the quantity of returns from this function.
 
-    This function uses depth-first-search when traversing subclass tree.
+    For `Pluggable` types, descendants are drawn from a registry that is
+    populated as sub-classes are defined, avoiding the traversal of the
+    subclass tree. For other types, this function uses depth-first-search
+    when traversing the subclass tree. Both return the same types.
 
     Reference:
       https://docs.python.org/3/library/stdtypes.html#class.__subclasses__
@@ -325,6 +1690,10 @@ def discover_via_subclasses(interface_type: Type) -> Set[Type]:
         under.
     :return: Set of recursive subclass types under `interface_type`.
     """
+    if isinstance(interface_type, type) and issubclass(interface_type, Pluggable):
+        with _REGISTRY_LOCK:
+            return set(_PLUGGABLE_DESCENDANTS.get(interface_type, ()))
+
     # __subclasses__ only returns *immediate* subclasses, i.e. one level.
     # To get nested subclasses we'll have to do some graph traversal.
     class_set = set()
@@ -342,7 +1711,9 @@ def discover_via_subclasses(interface_type: Type) -> Set[Type]:
 
 
 def filter_plugin_types(
-    interface_type: Type, candidate_pool: Collection[Type]
+    interface_type: Type,
+    candidate_pool: Collection[Type],
+    timeout: Optional[float] = None,
 ) -> Set[Type]:
     """
     Filter the given set of types to those that are "plugins" of the given
@@ -358,10 +1729,1200 @@ def filter_plugin_types(
     :param interface_type: The parent type to filter on.
     :param candidate_pool: Some iterable of types from which to collect
         interface type plugins from.
+    :param timeout: Optional time budget, in seconds, for the ``is_usable()``
+        probe of each candidate. See :py:func:`is_valid_plugin`.
     :return: Set of types that are considered "plugins" of the interface types
         following the above listed rules.
     """
-    return {cls for cls in candidate_pool if is_valid_plugin(cls, interface_type)}
+    # Verdicts newly probed are persisted together, if at all.
+    with USABILITY_CACHE.batched_writes():
+        return {cls for cls in candidate_pool if is_valid_plugin(cls, interface_type, timeout)}
+
+
+def _atomic_write_text(filepath: str, text: str) -> None:
+    """
+    Write text to a file such that concurrent readers either see the previous
+    content or the complete new content, never a partial write.
+    """
+    dirpath = os.path.dirname(os.path.abspath(filepath))
+    os.makedirs(dirpath, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dirpath, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _module_file_mtimes(module_names: Iterable[str]) -> Dict[str, float]:
+    """
+    Get the modification times of the source files of already imported
+    modules. Modules without a file location (e.g. built-in modules) are
+    skipped.
+    """
+    mtimes: Dict[str, float] = {}
+    for name in module_names:
+        filepath = getattr(sys.modules.get(name), "__file__", None)
+        if filepath and os.path.isfile(filepath):
+            mtimes[filepath] = os.stat(filepath).st_mtime
+    return mtimes
+
+
+def _distribution_versions() -> Dict[str, str]:
+    """
+    Get a mapping of installed distribution names to their versions.
+    """
+    versions: Dict[str, str] = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        # Broken installations may lack a name. These are not resolvable as
+        # entry-point providers anyway.
+        if name:
+            versions[name] = dist.version
+    return versions
+
+
+class PluginManifest:
+    """
+    Record of the plugin types exposed through the entry-point extensions of a
+    namespace, allowing those types to be found without importing every
+    extension module.
+
+    The manifest content, as produced by :meth:`to_dict`, is a JSON-compliant
+    dictionary of the following format:
+
+    .. code-block:: json
+
+        {
+            "format_version": 1,
+            "namespace": "smqtk_plugins",
+            "interfaces": {
+                "interface.module.Interface": ["plugin.module.Impl"]
+            },
+            "types": {
+                "plugin.module.Impl": {
+                    "module": "plugin.module",
+                    "attr": "Impl",
+                    "usable": true
+                }
+            },
+            "fingerprint": {
+                "entrypoints": [["name", "plugin.module"]],
+                "distributions": {"some-dist": "1.0.0"},
+                "mtimes": {"/path/to/plugin/module.py": 1234567890.0}
+            }
+        }
+
+    The ``interfaces`` mapping relates the type key of every `Pluggable`
+    class (including `Pluggable` itself) to the keys of the concrete types
+    found that descend from it. The ``types`` mapping records where each
+    type may be imported from and the ``is_usable()`` verdict at the time of
+    generation. The ``fingerprint`` is used to determine if the manifest has
+    become stale, see :meth:`is_stale`.
+
+    Type keys are the same as those used for the ``"type"`` value of
+    configuration dictionaries (see :mod:`smqtk_core.configuration`).
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        namespace: str,
+        interfaces: Dict[str, List[str]],
+        types_meta: Dict[str, Dict[str, Any]],
+        fingerprint: Dict[str, Any],
+    ):
+        self.namespace = namespace
+        self.interfaces = interfaces
+        self.types = types_meta
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def generate(cls, namespace: str) -> "PluginManifest":
+        """
+        Generate a new manifest by importing all modules exposed through the
+        entry-point extensions of the given namespace.
+
+        :param namespace: The entry-point namespace to generate a manifest for.
+
+        :raises NotAModuleError: An entry-point did not specify a module.
+
+        :return: New manifest instance.
+        """
+        interfaces: Dict[str, List[str]] = {}
+        types_meta: Dict[str, Dict[str, Any]] = {}
+        ep_content = []
+        module_names = set()
+        for entry_point, m in _load_entrypoint_modules(_select_ns_entrypoints(namespace)):
+            ep_content.append([entry_point.name, entry_point.value])  # type: ignore[attr-defined]
+            module_names.add(m.__name__)
+            for attr_name in dir(m):
+                t = getattr(m, attr_name)
+                if (
+                    not isinstance(t, type) or not issubclass(t, Pluggable)
+                    or t is Pluggable or inspect.isabstract(t)
+                ):
+                    continue
+                t_key = _type_to_key(t)
+                if t_key in types_meta:
+                    # Already recorded via another module or attribute alias.
+                    continue
+                module_names.add(t.__module__)
+                types_meta[t_key] = {
+                    "module": m.__name__,
+                    "attr": attr_name,
+                    "usable": bool(t.is_usable()),
+                }
+                for base in t.__mro__[1:]:
+                    if issubclass(base, Pluggable):
+                        interfaces.setdefault(_type_to_key(base), []).append(t_key)
+        for impl_keys in interfaces.values():
+            impl_keys.sort()
+        fingerprint = {
+            "entrypoints": sorted(ep_content),
+            "distributions": _distribution_versions(),
+            "mtimes": _module_file_mtimes(module_names),
+        }
+        return cls(namespace, interfaces, types_meta, fingerprint)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "PluginManifest":
+        """
+        Create a manifest from its dictionary form as returned by
+        :meth:`to_dict`.
+
+        :raises ValueError: The dictionary is not of a supported format
+            version.
+        """
+        if d.get("format_version") != cls.FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported plugin manifest format version "
+                f"'{d.get('format_version')}'. Expected '{cls.FORMAT_VERSION}'."
+            )
+        return cls(d["namespace"], d["interfaces"], d["types"], d["fingerprint"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: JSON-compliant dictionary form of this manifest.
+        """
+        return {
+            "format_version": self.FORMAT_VERSION,
+            "namespace": self.namespace,
+            "interfaces": self.interfaces,
+            "types": self.types,
+            "fingerprint": self.fingerprint,
+        }
+
+    @classmethod
+    def load(cls, filepath: str) -> "PluginManifest":
+        """
+        Load a manifest from a JSON file.
+
+        :raises OSError: The file could not be read.
+        :raises ValueError: The file content is not a valid manifest.
+        """
+        with open(filepath) as f:
+            d = json.load(f)
+        try:
+            return cls.from_dict(d)
+        except (AttributeError, KeyError, TypeError) as ex:
+            raise ValueError(f"Invalid plugin manifest content in '{filepath}': {ex!r}")
+
+    def save(self, filepath: str) -> None:
+        """
+        Atomically write this manifest to a JSON file.
+        """
+        _atomic_write_text(filepath, json.dumps(self.to_dict(), indent=2, sort_keys=True))
+
+    def is_stale(self) -> bool:
+        """
+        Check if this manifest no longer reflects the current environment.
+
+        A manifest is stale when the entry-points defined for its namespace,
+        the set or versions of installed distributions, or the modification
+        time of a module file recorded in the manifest have changed.
+        """
+        fp = self.fingerprint
+        ep_content = sorted(
+            [ep.name, ep.value]  # type: ignore[attr-defined]
+            for ep in _select_ns_entrypoints(self.namespace)
+        )
+        if ep_content != fp["entrypoints"]:
+            return True
+        for filepath, mtime in fp["mtimes"].items():
+            try:
+                if os.stat(filepath).st_mtime != mtime:
+                    return True
+            except OSError:
+                return True
+        return _distribution_versions() != fp["distributions"]
+
+    def impl_keys(self, interface_type: Type, usable_only: bool = True) -> Set[str]:
+        """
+        Get the keys of types recorded as descending from the given interface
+        type.
+
+        :param interface_type: Interface type to get implementation keys for.
+        :param usable_only: Only include types that were recorded as usable.
+
+        :return: Set of type keys.
+        """
+        keys = self.interfaces.get(_type_to_key(interface_type), ())
+        return {k for k in keys if not usable_only or self.types[k]["usable"]}
+
+    def resolve(self, type_key: str) -> Type:
+        """
+        Import and return the type recorded under the given key.
+
+        :raises KeyError: The key is not recorded in this manifest.
+        """
+        meta = self.types[type_key]
+        module = _profiled_import(
+            "manifest", meta["module"],
+            functools.partial(importlib.import_module, meta["module"]),
+        )
+        return getattr(module, meta["attr"])
+
+
+# Manifests loaded in this process, keyed on file path and namespace.
+_LOADED_MANIFESTS: Dict[Tuple[str, str], PluginManifest] = {}
+
+
+def get_manifest(filepath: str, namespace: str) -> PluginManifest:
+    """
+    Get the plugin manifest for the given namespace stored at the given file
+    path, generating and saving a new manifest when the file does not exist,
+    is invalid, was generated for a different namespace or is stale.
+
+    Manifests are loaded once per process. Use :func:`clear_loaded_manifests`
+    to force the file to be loaded and checked again. When a generated
+    manifest cannot be saved, e.g. because the path is read-only, this is
+    logged and the manifest is used regardless.
+
+    :param filepath: Path to the manifest JSON file.
+    :param namespace: The entry-point namespace the manifest is for.
+
+    :return: Current plugin manifest.
+    """
+    llevel = 1
+    cache_key = (filepath, namespace)
+    manifest = _LOADED_MANIFESTS.get(cache_key)
+    if manifest is not None:
+        return manifest
+    try:
+        manifest = PluginManifest.load(filepath)
+    except (OSError, ValueError) as ex:
+        LOG.log(llevel, f"Could not load plugin manifest '{filepath}': {ex}")
+    else:
+        if manifest.namespace != namespace:
+            LOG.log(llevel, f"Plugin manifest '{filepath}' is for a different namespace.")
+            manifest = None
+        elif manifest.is_stale():
+            LOG.log(llevel, f"Plugin manifest '{filepath}' is stale.")
+            manifest = None
+    if manifest is None:
+        LOG.log(llevel, f"Generating plugin manifest '{filepath}' for namespace `{namespace}`.")
+        manifest = PluginManifest.generate(namespace)
+        try:
+            manifest.save(filepath)
+        except OSError as ex:
+            # The generated manifest is still used by this process.
+            LOG.warning("Could not save plugin manifest '%s': %s", filepath, ex)
+    _LOADED_MANIFESTS[cache_key] = manifest
+    return manifest
+
+
+def clear_loaded_manifests() -> None:
+    """
+    Forget all plugin manifests loaded by :func:`get_manifest` in this
+    process.
+    """
+    _LOADED_MANIFESTS.clear()
+
+
+def discover_via_manifest(
+    interface_type: Type, manifest_path: str, entrypoint_ns: str
+) -> Set[Type]:
+    """
+    Discover and return the types recorded in a plugin manifest as usable
+    implementations of the given interface type.
+
+    This is an alternative to `discover_via_entrypoint_extensions` that only
+    imports the modules that provide the types returned, as opposed to all
+    modules exposed through the entry-point namespace.
+
+    :param interface_type: The interface type to find implementations of.
+    :param manifest_path: Path to the manifest JSON file. See
+        :func:`get_manifest` for when this is (re)generated.
+    :param entrypoint_ns: The entry-point namespace the manifest is for.
+
+    :return: Set of discovered types.
+    """
+    manifest = get_manifest(manifest_path, entrypoint_ns)
+    return {manifest.resolve(k) for k in manifest.impl_keys(interface_type)}
+
+
+class LazyPluginType:
+    """
+    Lightweight handle to a plugin type that is only imported when first
+    used.
+
+    The handle carries the type key of the type it refers to (as used for the
+    ``"type"`` value of configuration dictionaries) and exposes matching
+    ``__module__``, ``__name__`` and ``__qualname__`` attributes without
+    importing anything. The real type is imported on first access of any
+    other attribute, on instantiation (calling the handle) or on an explicit
+    call to :meth:`resolve`. Handles compare and hash equal based on their
+    type key.
+
+    Handles may be given in place of types to
+    :func:`smqtk_core.configuration.cls_conf_from_config_dict` and
+    :func:`smqtk_core.configuration.from_config_dict`.
+
+    >>> h = LazyPluginType("collections.OrderedDict")
+    >>> h.__name__, h.is_resolved
+    ('OrderedDict', False)
+    >>> h(a=1)
+    OrderedDict([('a', 1)])
+    >>> h.is_resolved
+    True
+    """
+
+    def __init__(self, type_key: str, loader: Optional[Callable[[], Type]] = None):
+        """
+        :param type_key: Key of the type this handle refers to.
+        :param loader: Optional callable that imports and returns the type. By
+            default, the type is imported as the attribute named by the last
+            component of the type key from the module named by the rest of
+            it.
+        """
+        module_name, _, name = type_key.rpartition(".")
+        self.type_key = type_key
+        self.__module__ = module_name
+        self.__name__ = name
+        self.__qualname__ = name
+        self._loader = loader
+        self._type: Optional[Type] = None
+
+    @classmethod
+    def from_type(cls, t: Type) -> "LazyPluginType":
+        """
+        Create an already resolved handle for the given type.
+        """
+        h = cls(_type_to_key(t))
+        h._type = t
+        return h
+
+    @property
+    def is_resolved(self) -> bool:
+        """
+        If the referenced type has been imported yet.
+        """
+        return self._type is not None
+
+    def resolve(self) -> Type:
+        """
+        Import, if not done so already, and return the referenced type.
+
+        :raises ImportError: The module of the type could not be imported.
+        :raises AttributeError: The module imported does not contain the
+            type.
+        """
+        if self._type is None:
+            if self._loader is not None:
+                self._type = self._loader()
+            else:
+                module = importlib.import_module(self.__module__)
+                self._type = getattr(module, self.__name__)
+        return self._type
+
+    def __getattr__(self, item: str) -> Any:
+        # Only called when normal attribute lookup fails, i.e. for anything not
+        # set in the constructor. Private attributes are excluded to avoid
+        # recursion when those are not yet set (e.g. during unpickling).
+        if item.startswith("__") or item in ("_loader", "_type"):
+            raise AttributeError(item)
+        return getattr(self.resolve(), item)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __instancecheck__(self, instance: Any) -> bool:
+        return isinstance(instance, self.resolve())
+
+    def __subclasscheck__(self, subclass: Type) -> bool:
+        return issubclass(subclass, self.resolve())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyPluginType):
+            return self.type_key == other.type_key
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.type_key)
+
+    def __repr__(self) -> str:
+        state = "resolved" if self.is_resolved else "unresolved"
+        return f"<{self.__class__.__name__} '{self.type_key}' ({state})>"
+
+
+def resolve_type(t: Any) -> Type:
+    """
+    Get the concrete type for the given type or `LazyPluginType` handle.
+    """
+    if isinstance(t, LazyPluginType):
+        return t.resolve()
+    return t
+
+
+class TypeKeyIndex(Mapping[str, Type]):
+    """
+    Index of types, or `LazyPluginType` handles, by their type key, as used
+    for the ``"type"`` value of configuration dictionaries.
+
+    This may be given to :func:`smqtk_core.configuration.from_config_dict`,
+    and related functions, in place of an iterable of types so that the
+    configured type is resolved with a single lookup instead of keying every
+    candidate type on every call.
+
+    An index is either built from an iterable of types and maintained via
+    :meth:`add` and :meth:`discard`, or built with :meth:`from_interface` to
+    track the implementations of a `Pluggable` interface. The latter is
+    refreshed when a key not in the index is looked up, or explicitly via
+    :meth:`refresh`, by applying the difference to the interface's current
+    ``get_impls()`` result, which is itself memoized. Keys of
+    implementations that are no longer discovered are thus only dropped on
+    refresh.
+
+    >>> class Foo:
+    ...     pass
+    >>> index = TypeKeyIndex([Foo])
+    >>> index["smqtk_core.plugin.Foo"] is Foo
+    True
+    """
+
+    def __init__(
+        self,
+        types: Iterable[Type] = (),
+        interface_type: Optional[Type["Pluggable"]] = None,
+    ):
+        """
+        :param types: Types to index initially.
+        :param interface_type: Optional `Pluggable` interface type whose
+            implementations this index tracks. See :meth:`from_interface`.
+        """
+        self.interface_type = interface_type
+        self._index: Dict[str, Type] = {}
+        self._lock = threading.Lock()
+        self.update(types)
+
+    @classmethod
+    def from_interface(cls, interface_type: Type["Pluggable"]) -> "TypeKeyIndex":
+        """
+        Build an index tracking the implementations of the given `Pluggable`
+        interface type.
+        """
+        index = cls(interface_type=interface_type)
+        index.refresh()
+        return index
+
+    def add(self, t: Type) -> None:
+        """
+        Add, or replace, the type with the key of the given type.
+        """
+        with self._lock:
+            self._index[_type_to_key(t)] = t
+
+    def update(self, types: Iterable[Type]) -> None:
+        """
+        Add, or replace, the given types.
+        """
+        keyed = [(_type_to_key(t), t) for t in types]
+        with self._lock:
+            self._index.update(keyed)
+
+    def discard(self, t: Type) -> None:
+        """
+        Remove the given type, if indexed.
+        """
+        key = _type_to_key(t)
+        with self._lock:
+            if self._index.get(key) == t:
+                del self._index[key]
+
+    def refresh(self) -> bool:
+        """
+        Apply changes in the implementations of the tracked interface type.
+        This does nothing if this index does not track an interface.
+
+        :return: If the index changed.
+        """
+        if self.interface_type is None:
+            return False
+        impls = {_type_to_key(t): t for t in self.interface_type.get_impls()}
+        changed = False
+        with self._lock:
+            for key in [k for k in self._index if k not in impls]:
+                del self._index[key]
+                changed = True
+            for key, t in impls.items():
+                if self._index.get(key) is not t:
+                    self._index[key] = t
+                    changed = True
+        return changed
+
+    def __getitem__(self, key: str) -> Type:
+        t = self._index.get(key)
+        if t is None and self.interface_type is not None and self.refresh():
+            t = self._index.get(key)
+        if t is None:
+            raise KeyError(key)
+        return t
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[cast(str, key)]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._index))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} of {len(self)} types>"
+
+
+class DiscoveryCache:
+    """
+    Memoization of plugin discovery results per interface type.
+
+    Each entry is stored alongside the "state key" that was current when the
+    entry was computed. An entry is only returned when the state key given at
+    lookup time is equal to the one it was stored with, otherwise it is
+    considered stale and discarded.
+
+    Interface types and discovered types are weakly referenced, in the same
+    way as in the registry used by `discover_via_subclasses`, so as to not
+    prolong their lifetime. An entry of which a discovered type has since
+    been garbage collected is considered stale as well. Other discovered
+    objects, i.e. `LazyPluginType` handles, are referenced strongly as
+    nothing else may.
+
+    The instance of this class used by `Pluggable.get_impls` is available as
+    the module-level `DISCOVERY_CACHE` attribute.
+    """
+
+    def __init__(self) -> None:
+        # Interface type to the state key, the discovered types, the other
+        # discovered objects and the total number of discovered items.
+        self._entries: \
+            "weakref.WeakKeyDictionary[Type, Tuple[Hashable, weakref.WeakSet[Type], FrozenSet[Any], int]]" = \
+            weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, interface_type: Type) -> bool:
+        with self._lock:
+            return interface_type in self._entries
+
+    def get(
+        self, interface_type: Type, state_key: Hashable
+    ) -> Optional[FrozenSet[Type]]:
+        """
+        Get the cached discovery result for the given interface type.
+
+        :param interface_type: The interface type the result was cached for.
+        :param state_key: The current discovery state key to validate the
+            cached entry against.
+
+        :return: The cached set of types, or None if there is no entry for the
+            interface type or if the entry is stale.
+        """
+        with self._lock:
+            entry = self._entries.get(interface_type)
+            if entry is None:
+                return None
+            impls = frozenset((*entry[1], *entry[2]))
+            if entry[0] != state_key or len(impls) != entry[3]:
+                LOG.log(1, "[%s] Discarding stale discovery cache entry.", interface_type.__name__)
+                del self._entries[interface_type]
+                return None
+            return impls
+
+    def put(
+        self, interface_type: Type, state_key: Hashable, impls: Iterable[Type]
+    ) -> FrozenSet[Type]:
+        """
+        Cache a discovery result for the given interface type.
+
+        :param interface_type: The interface type the result is for.
+        :param state_key: The discovery state key the result was computed
+            under.
+        :param impls: The discovered types to cache.
+
+        :return: The immutable set of types now cached.
+        """
+        impls = frozenset(impls)
+        weak_impls: "weakref.WeakSet[Type]" = weakref.WeakSet(t for t in impls if isinstance(t, type))
+        others = frozenset(t for t in impls if not isinstance(t, type))
+        with self._lock:
+            self._entries[interface_type] = (state_key, weak_impls, others, len(impls))
+        return impls
+
+    def invalidate(self, interface_type: Optional[Type] = None) -> None:
+        """
+        Drop cached discovery results.
+
+        :param interface_type: The interface type to drop the cached result
+            for. If this is None, all cached results are dropped.
+        """
+        with self._lock:
+            if interface_type is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(interface_type, None)
+
+
+DISCOVERY_CACHE = DiscoveryCache()
+
+
+def _module_attr_name(t: Type) -> Optional[str]:
+    """
+    Get the name of an attribute of the module of the given type that is
+    bound to the type, preferring the type's own name, or None if there is
+    none.
+    """
+    module = sys.modules.get(t.__module__)
+    if module is None:
+        return None
+    if getattr(module, t.__name__, None) is t:
+        return t.__name__
+    return next((k for k, v in vars(module).items() if v is t), None)
+
+
+class SharedDiscoveryCache:
+    """
+    Discovery cache stored as files in a directory that may be shared across
+    processes and machines, e.g. on a network file-system, so that one
+    process's discovery serves all others in the same environment.
+
+    Entries record, per interface type, the implementation types drawn from
+    the environment variable and entry-point extension sources, by type key,
+    module and the module attribute bound to them. If a type is not bound to
+    any attribute of its module, no entry is stored for the interface.
+    Entries are keyed on the interface, the values of its discovery
+    configuration, ``sys.path`` and a fingerprint of the python interpreter,
+    platform and installed distribution versions. Thus, entries are only
+    shared between equivalent environments, and a change of environment
+    leads to a new entry rather than an invalidation. Note that this does not
+    detect changes to the entry-points of editable installations whose
+    version does not change.
+
+    Entries are written atomically via a rename, so readers never see partial
+    content and do not need to acquire any lock. Processes that miss an entry
+    concurrently each perform discovery and write the same content.
+
+    Implementations drawn from an entry are still checked via
+    `is_valid_plugin` in the reading process, as usability may differ across
+    machines, except when drawn as `LazyPluginType` handles, for which the
+    ``is_usable()`` verdict recorded by the writing process is relied upon.
+    An entry whose types can no longer be imported is discarded by the
+    reading process, which then performs a full discovery.
+
+    Failing to write an entry, e.g. because the directory is read-only, is
+    logged and otherwise ignored.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, directory: str):
+        """
+        :param directory: Path to the directory to store entries in. It is
+            created when the first entry is written.
+        """
+        self.directory = directory
+
+    def key(self, interface_type: Type["Pluggable"]) -> str:
+        """
+        Get the key of the entry for the given interface type in the current
+        environment.
+        """
+        env_var = interface_type.PLUGIN_ENV_VAR
+        h = hashlib.sha256()
+        h.update(json.dumps([
+            _environment_fingerprint(),
+            sys.path,
+            _type_to_key(interface_type),
+            env_var, os.environ.get(env_var, ""),
+            interface_type.PLUGIN_NAMESPACE,
+            interface_type.PLUGIN_STATIC_SCAN,
+        ]).encode())
+        return h.hexdigest()
+
+    def _filepath(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, interface_type: Type["Pluggable"]) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get the entry for the given interface type in the current environment.
+
+        :param interface_type: The interface type to get the entry of.
+
+        :return: Mapping of implementation type keys to their metadata, i.e.
+            the ``"module"`` that defines them, the ``"attr"`` of that module
+            bound to them and if they were ``"usable"`` when recorded, or None
+            if there is no valid entry.
+        """
+        try:
+            with open(self._filepath(self.key(interface_type))) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if (
+            not isinstance(data, dict)
+            or data.get("format_version") != self.FORMAT_VERSION
+            or data.get("interface") != _type_to_key(interface_type)
+            or not isinstance(data.get("impls"), dict)
+        ):
+            return None
+        return data["impls"]
+
+    def put(
+        self,
+        interface_type: Type["Pluggable"],
+        impls: Iterable[Type],
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Store the entry for the given interface type in the current
+        environment.
+
+        :param interface_type: The interface type to store the entry of.
+        :param impls: The non-abstract implementation types to record.
+        :param timeout: Optional time budget, in seconds, for the
+            ``is_usable()`` probe of each type without a memoized verdict. A
+            type whose probe exceeds it is recorded as not usable.
+        """
+        impls_meta: Dict[str, Dict[str, Any]] = {}
+        # Verdicts newly probed are persisted together, if at all.
+        with USABILITY_CACHE.batched_writes():
+            for t in impls:
+                attr_name = _module_attr_name(t)
+                if attr_name is None:
+                    LOG.log(
+                        1, "Not storing shared discovery cache entry of '%s' as "
+                           "'%s' is not bound to an attribute of its module.",
+                        _type_to_key(interface_type), _type_to_key(t)
+                    )
+                    return
+                impls_meta[_type_to_key(t)] = {
+                    "module": t.__module__,
+                    "attr": attr_name,
+                    "usable": not issubclass(t, Pluggable) or USABILITY_CACHE.is_usable(t, timeout),
+                }
+        filepath = self._filepath(self.key(interface_type))
+        try:
+            _atomic_write_text(filepath, json.dumps({
+                "format_version": self.FORMAT_VERSION,
+                "interface": _type_to_key(interface_type),
+                "impls": impls_meta,
+            }, indent=1, sort_keys=True))
+        except OSError as ex:
+            LOG.warning("Could not write shared discovery cache entry '%s': %s", filepath, ex)
+
+    def discard(self, interface_type: Type["Pluggable"]) -> None:
+        """
+        Remove the entry for the given interface type in the current
+        environment, if any.
+        """
+        try:
+            os.remove(self._filepath(self.key(interface_type)))
+        except FileNotFoundError:
+            pass
+
+    def resolve(self, module_name: str, attr_name: str, timeout: Optional[float] = None) -> Type:
+        """
+        Import and return the implementation type of an entry.
+
+        :param module_name: The recorded module of the type.
+        :param attr_name: The recorded module attribute of the type.
+        :param timeout: Optional time budget, in seconds, for importing the
+            module.
+
+        :raises _DeadlineExceeded: Importing the module exceeded the budget.
+        :raises ImportError: The module could not be imported.
+        :raises AttributeError: The module does not contain the attribute.
+        """
+        module = _profiled_import(
+            "shared_cache", module_name,
+            functools.partial(
+                _call_with_deadline, "import", module_name, timeout,
+                functools.partial(importlib.import_module, module_name),
+            ),
+        )
+        return getattr(module, attr_name)
+
+    def _resolve_or_discard(
+        self,
+        interface_type: Type["Pluggable"],
+        module_name: str,
+        attr_name: str,
+        timeout: Optional[float] = None,
+    ) -> Type:
+        """
+        Like :meth:`resolve`, but discard the entry of the given interface
+        type when it proves to be stale, i.e. when the type can no longer be
+        imported.
+        """
+        try:
+            return self.resolve(module_name, attr_name, timeout)
+        except (ImportError, AttributeError) as ex:
+            LOG.warning(
+                "Discarding stale shared discovery cache entry of '%s': %s",
+                _type_to_key(interface_type), ex
+            )
+            try:
+                self.discard(interface_type)
+            except OSError as discard_ex:
+                LOG.warning(
+                    "Could not discard shared discovery cache entry of '%s': %s",
+                    _type_to_key(interface_type), discard_ex
+                )
+            raise
+
+
+class _SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into a single call, whose
+    result, or exception, is shared with all callers waiting on it.
+
+    A re-entrant call for a key by the thread already computing it is
+    performed directly instead of waiting on itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, Tuple[int, "Future[Any]"]] = {}
+
+    def do(self, key: Hashable, func: Callable[[], R]) -> R:
+        """
+        Call the given function, unless a call for the same key is already in
+        progress in another thread, in which case its outcome is awaited.
+
+        :param key: Key identifying equivalent calls.
+        :param func: Function to call.
+
+        :return: The return of the function call for the key.
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                future: "Future[Any]" = Future()
+                self._flights[key] = (thread_id, future)
+        if flight is not None:
+            if flight[0] == thread_id:
+                return func()
+            return cast(R, flight[1].result())
+        try:
+            result = func()
+        except BaseException as ex:
+            future.set_exception(ex)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+
+# Discoveries in progress, keyed by interface type and discovery state key.
+_DISCOVERY_FLIGHTS = _SingleFlight()
+
+
+# Content of the entry-points selected for each interface type and namespace,
+# alongside the entry-point scan and sub-class generation it was selected
+# under. Interface types are weakly referenced.
+_SELECTED_EP_CONTENT: \
+    "weakref.WeakKeyDictionary[Type, Dict[str, Tuple[Dict, int, Tuple[Tuple[str, str], ...]]]]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _selected_ep_content(namespace: str, interface_type: Type) -> Tuple[Tuple[str, str], ...]:
+    """
+    Get the sorted names and values of the entry-points selected by
+    `_select_ns_entrypoints` for the given namespace and interface type.
+
+    The selection is memoized for as long as the cached entry-point scan (see
+    :func:`get_ns_entrypoints`) and the sub-class generation, which marks
+    when interfaces an entry-point may declare become defined, do not change.
+    """
+    groups = _get_entrypoint_groups()
+    generation = _SUBCLASS_GENERATION
+    ns_content = _SELECTED_EP_CONTENT.get(interface_type)
+    entry = ns_content.get(namespace) if ns_content is not None else None
+    if entry is not None and entry[0] is groups and entry[1] == generation:
+        return entry[2]
+    # Type ignoring here for the same reason as in
+    # `discover_via_entrypoint_extensions`.
+    ep_content = tuple(sorted(
+        (ep.name, ep.value)  # type: ignore[attr-defined]
+        for ep in _select_ns_entrypoints(namespace, interface_type)
+    ))
+    with _REGISTRY_LOCK:
+        ns_content = _SELECTED_EP_CONTENT.get(interface_type)
+        if ns_content is None:
+            ns_content = _SELECTED_EP_CONTENT[interface_type] = {}
+        ns_content[namespace] = (groups, generation, ep_content)
+    return ep_content
+
+
+def _discovery_state_key(interface_type: Type["Pluggable"]) -> Hashable:
+    """
+    Compose the key that describes the current state of all discovery
+    sources relevant to the given `Pluggable` interface type.
+
+    This includes the value of the interface's environment variable, the
+    entry-points of its namespace selected for the interface and the current
+    sub-class generation marker.
+    """
+    return _discovery_source_key(interface_type), _SUBCLASS_GENERATION
+
+
+def _discovery_source_key(interface_type: Type["Pluggable"]) -> Hashable:
+    """
+    Compose the part of the discovery state key of the given `Pluggable`
+    interface type that describes its discovery configuration and sources
+    other than sub-classes, i.e. all but the sub-class generation marker.
+    """
+    env_var = interface_type.PLUGIN_ENV_VAR
+    lazy = interface_type.PLUGIN_LAZY_TYPES
+    manifest_env_var = interface_type.PLUGIN_MANIFEST_ENV_VAR
+    shared_env_var = interface_type.PLUGIN_SHARED_CACHE_ENV_VAR
+    namespace = interface_type.PLUGIN_NAMESPACE
+    return (
+        env_var, os.environ.get(env_var, ""),
+        manifest_env_var, os.environ.get(manifest_env_var, ""),
+        shared_env_var, os.environ.get(shared_env_var, ""),
+        namespace, _selected_ep_content(namespace, interface_type),
+        lazy, interface_type.PLUGIN_STATIC_SCAN, interface_type.PLUGIN_TIMEOUT,
+    )
+
+
+def _pooled(
+    pools: Optional[Dict[Hashable, Set[Type]]],
+    key: Hashable,
+    discover: Callable[[], Set[Type]],
+) -> Set[Type]:
+    """
+    Get the result of a discovery function, reusing the result stored in the
+    given pools under the given key if present. If no pools are given, the
+    discovery function is always called.
+    """
+    if pools is None:
+        return discover()
+    if key not in pools:
+        pools[key] = discover()
+    return pools[key]
+
+
+def _discover_impls(
+    interface_type: Type["Pluggable"],
+    pools: Optional[Dict[Hashable, Set[Type]]] = None,
+) -> Set[Type]:
+    """
+    Perform a full discovery of implementations of the given `Pluggable`
+    interface type following its class-level discovery configuration.
+
+    See :meth:`Pluggable.get_impls` for details.
+
+    :param interface_type: Interface type to discover implementations of.
+    :param pools: Optional mapping in which candidate types drawn from the
+        environment variable and entry-point sources are stored and reused,
+        allowing them to be shared across the discovery of multiple
+        interfaces.
+    """
+    manifest_path = os.environ.get(interface_type.PLUGIN_MANIFEST_ENV_VAR, "")
+    namespace = interface_type.PLUGIN_NAMESPACE
+    lazy = interface_type.PLUGIN_LAZY_TYPES
+    max_workers = interface_type.PLUGIN_IMPORT_WORKERS
+    scan_for = interface_type if interface_type.PLUGIN_STATIC_SCAN else None
+    env_var = interface_type.PLUGIN_ENV_VAR
+    timeout = interface_type.PLUGIN_TIMEOUT
+    timeouts_generation = PLUGIN_TIMEOUTS.generation
+    shared_dir = os.environ.get(interface_type.PLUGIN_SHARED_CACHE_ENV_VAR, "")
+    # A manifest takes precedence over a shared cache.
+    shared_cache = SharedDiscoveryCache(shared_dir) if shared_dir and not manifest_path else None
+    shared_entry = shared_cache.get(interface_type) if shared_cache is not None else None
+    lazy_types: Dict[str, LazyPluginType] = {}
+    ep_types: Set[Type] = set()
+    env_types: Set[Type] = set()
+    if shared_cache is not None and shared_entry is not None:
+        # Stands in for both the entry-point and environment variable sources.
+        with _profiled_source(interface_type, "shared_cache"):
+            try:
+                for k, meta in shared_entry.items():
+                    if not lazy:
+                        try:
+                            ep_types.add(shared_cache._resolve_or_discard(
+                                interface_type, meta["module"], meta["attr"], timeout
+                            ))
+                        except _DeadlineExceeded:
+                            pass
+                    elif meta["usable"]:
+                        lazy_types[k] = LazyPluginType(k, functools.partial(
+                            shared_cache._resolve_or_discard,
+                            interface_type, meta["module"], meta["attr"],
+                        ))
+            except (ImportError, AttributeError):
+                # The entry was discarded, fall back to a full discovery.
+                shared_entry = None
+                ep_types = set()
+    if shared_entry is None:
+        if manifest_path and lazy:
+            with _profiled_source(interface_type, "manifest"):
+                manifest = get_manifest(manifest_path, namespace)
+                for k in manifest.impl_keys(interface_type):
+                    lazy_types[k] = LazyPluginType(k, functools.partial(manifest.resolve, k))
+        elif manifest_path:
+            with _profiled_source(interface_type, "manifest"):
+                ep_types = discover_via_manifest(interface_type, manifest_path, namespace)
+        else:
+            # Interfaces for which the same entry-points are selected share
+            # their pool.
+            selected_eps = frozenset(
+                ep.value  # type: ignore[attr-defined]
+                for ep in _select_ns_entrypoints(namespace, interface_type)
+            )
+            with _profiled_source(interface_type, f"entrypoint:{namespace}"):
+                ep_types = _pooled(
+                    pools, ("entrypoint", namespace, selected_eps, scan_for, timeout),
+                    lambda: discover_via_entrypoint_extensions(
+                        namespace, max_workers, scan_for, interface_type, timeout
+                    )
+                )
+        with _profiled_source(interface_type, f"env_var:{env_var}"):
+            env_types = _pooled(
+                pools, ("env_var", env_var, os.environ.get(env_var, ""), scan_for, timeout),
+                lambda: discover_via_env_var(env_var, max_workers, scan_for, timeout)
+            )
+    with _profiled_source(interface_type, "subclasses"):
+        subclass_types = discover_via_subclasses(interface_type)
+    with _profiled_source(interface_type, "filter"):
+        resolved_types = filter_plugin_types(
+            interface_type, {*env_types, *ep_types, *subclass_types}, timeout
+        )
+    # Written after filtering so that usability verdicts are already probed
+    # within the budget. Results missing modules, or verdicts, that exceeded
+    # their budget are not shared.
+    if (
+        shared_cache is not None and shared_entry is None
+        and PLUGIN_TIMEOUTS.generation == timeouts_generation
+    ):
+        shared_cache.put(interface_type, (
+            t for t in {*env_types, *ep_types}
+            if PLUGIN_VERDICT_CACHE.verdict(t, interface_type)[0] is None
+        ), timeout)
+    if lazy:
+        # Already imported types take the place of unresolved handles to the
+        # same type.
+        lazy_types.update(
+            (_type_to_key(t), LazyPluginType.from_type(t)) for t in resolved_types
+        )
+        return cast(Set[Type], set(lazy_types.values()))
+    return resolved_types
+
+
+def _extend_warmed_impls(
+    interface_type: Type["Pluggable"], warmed: Iterable[Type]
+) -> Set[Type]:
+    """
+    Get the implementations of the given `Pluggable` interface type from those
+    recorded by :func:`warmup` and the sub-classes defined since.
+
+    This is equivalent to `_discover_impls` as long as the discovery sources
+    other than sub-classes are as they were at warm-up, but neither draws
+    from those sources nor imports anything again.
+
+    :param interface_type: Interface type to get implementations of.
+    :param warmed: The implementation types recorded at warm-up.
+    """
+    with _profiled_source(interface_type, "warmup"):
+        resolved_types = filter_plugin_types(
+            interface_type, {*warmed, *discover_via_subclasses(interface_type)},
+            interface_type.PLUGIN_TIMEOUT,
+        )
+    if interface_type.PLUGIN_LAZY_TYPES:
+        return cast(Set[Type], {LazyPluginType.from_type(t) for t in resolved_types})
+    return resolved_types
+
+
+def _get_impls(
+    interface_type: Type["Pluggable"],
+    pools: Optional[Dict[Hashable, Set[Type]]] = None,
+) -> Set[Type]:
+    """
+    Get the implementations of the given `Pluggable` interface type, using
+    and populating `DISCOVERY_CACHE` when enabled for the interface.
+
+    When the cache misses for an interface warmed up via :func:`warmup`,
+    e.g. because sub-classes were defined since, and its other discovery
+    sources are unchanged, its warm-up result is extended via
+    `_extend_warmed_impls` instead of performing a full discovery.
+
+    This is safe to call from multiple threads. Concurrent calls for the same
+    interface type and discovery state share a single discovery.
+
+    See :func:`_discover_impls` for the ``pools`` parameter.
+    """
+    use_cache = interface_type.PLUGIN_DISCOVERY_CACHE
+    state_key = _discovery_state_key(interface_type)
+    if use_cache:
+        cached = DISCOVERY_CACHE.get(interface_type, state_key)
+        if cached is not None:
+            return set(cached)
+
+    def discover() -> FrozenSet[Type]:
+        if use_cache:
+            # Another thread may have completed the same discovery since the
+            # lookup above. The state key is drawn again as that discovery may
+            # have imported modules that define new sub-classes.
+            cached = DISCOVERY_CACHE.get(interface_type, _discovery_state_key(interface_type))
+            if cached is not None:
+                return cached
+        timeouts_generation = PLUGIN_TIMEOUTS.generation
+        warmed = (
+            WARMUP_REGISTRY.impls(interface_type, _discovery_source_key(interface_type))
+            if use_cache else None
+        )
+        if warmed is not None:
+            resolved_types = _extend_warmed_impls(interface_type, warmed)
+        else:
+            resolved_types = _discover_impls(interface_type, pools)
+        # Results missing plugins that exceeded their time budget are not
+        # cached so that those plugins are picked up once they complete.
+        if use_cache and PLUGIN_TIMEOUTS.generation == timeouts_generation:
+            # State key is drawn again for the same reason as above.
+            return DISCOVERY_CACHE.put(
+                interface_type, _discovery_state_key(interface_type), resolved_types
+            )
+        return frozenset(resolved_types)
+
+    # Concurrent discoveries for the same interface and state are performed
+    # once, with all callers receiving its result.
+    return set(_DISCOVERY_FLIGHTS.do((interface_type, state_key), discover))
 
 
 class Pluggable(metaclass=abc.ABCMeta):
@@ -373,6 +2934,34 @@ class Pluggable(metaclass=abc.ABCMeta):
 
     PLUGIN_ENV_VAR = "SMQTK_PLUGIN_PATH"
     PLUGIN_NAMESPACE = "smqtk_plugins"
+    PLUGIN_MANIFEST_ENV_VAR = "SMQTK_PLUGIN_MANIFEST"
+    PLUGIN_DISCOVERY_CACHE = True
+    PLUGIN_LAZY_TYPES = False
+    PLUGIN_IMPORT_WORKERS: Optional[int] = None
+    PLUGIN_STATIC_SCAN = False
+    PLUGIN_SHARED_CACHE_ENV_VAR = "SMQTK_PLUGIN_SHARED_CACHE"
+    PLUGIN_TIMEOUT: Optional[float] = None
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """
+        Register the new sub-class as a descendant of all of its `Pluggable`
+        ancestors.
+
+        Sub-classes that override this method must call the super method in
+        order to be found by :func:`discover_via_subclasses`.
+        """
+        super().__init_subclass__(**kwargs)
+        global _SUBCLASS_GENERATION
+        pluggable_bases = [b for b in cls.__mro__[1:] if issubclass(b, Pluggable)]
+        with _REGISTRY_LOCK:
+            for base in pluggable_bases:
+                descendants = _PLUGGABLE_DESCENDANTS.get(base)
+                if descendants is None:
+                    descendants = _PLUGGABLE_DESCENDANTS[base] = weakref.WeakSet()
+                descendants.add(cls)
+            # Mark that discovery results computed before now may be missing
+            # this new type.
+            _SUBCLASS_GENERATION += 1
 
     @classmethod
     def get_impls(cls: Type[P]) -> Set[Type[P]]:
@@ -386,22 +2975,184 @@ class Pluggable(metaclass=abc.ABCMeta):
         The class-level variables ``PLUGIN_ENV_VAR`` and ``PLUGIN_NAMESPACE``
         may be overridden to change what environment and entry-point extension
         are looked for, respectively.
+        Of the modules exposed through entry-point extensions, only those that
+        declare this class, via the namespace scoped to it, or do not declare
+        any interface are loaded. See
+        :func:`discover_via_entrypoint_extensions` for details.
+
+        If the environment variable named by the ``PLUGIN_MANIFEST_ENV_VAR``
+        class-level variable is set, its value is taken as the path to a
+        plugin manifest file for the entry-point namespace and
+        :func:`discover_via_manifest` is used instead of
+        :func:`discover_via_entrypoint_extensions`.
+
+        Otherwise, if the environment variable named by the
+        ``PLUGIN_SHARED_CACHE_ENV_VAR`` class-level variable is set, its value
+        is taken as the path to a directory shared with other processes, and
+        possibly machines, in which the types drawn from the environment
+        variable and entry-point extensions are stored by the first process to
+        discover them and reused by all others. See
+        :class:`SharedDiscoveryCache` for details.
+
+        If the ``PLUGIN_LAZY_TYPES`` class-level variable is set to ``True``,
+        the returned set contains :class:`LazyPluginType` handles instead of
+        class types. Used with a plugin manifest, types sourced from the
+        manifest are not imported until their handle is used. Note that this
+        relies on the ``is_usable()`` verdict recorded in the manifest for
+        those types.
+
+        If the ``PLUGIN_IMPORT_WORKERS`` class-level variable is set to an
+        integer greater than 1, modules are imported concurrently across up to
+        that many threads. See :func:`discover_via_env_var` for details.
+
+        If the ``PLUGIN_STATIC_SCAN`` class-level variable is set to ``True``,
+        the sources of modules listed in the environment variable and
+        entry-point extensions are statically scanned first, and modules that
+        do not plausibly provide implementations of this class are not
+        imported. See :func:`discover_via_env_var` for details.
+
+        If the ``PLUGIN_TIMEOUT`` class-level variable is set to a number of
+        seconds, each module imported from the environment variable,
+        entry-point extensions or a shared discovery cache, and each
+        ``is_usable()`` probe, is given that much time. Modules and types
+        exceeding it are skipped, logged as a warning and recorded in
+        `PLUGIN_TIMEOUTS`, so that a plugin hanging on import or probing does
+        not stall discovery. Results of discoveries that skipped anything are
+        not cached. Note that this bounds each import and probe individually,
+        not discovery as a whole. Discovery may take up to about the budget
+        times the number of modules and probes that are slow without hanging,
+        divided by ``PLUGIN_IMPORT_WORKERS`` for imports.
+
+        Results are cached in `DISCOVERY_CACHE` unless the class-level variable
+        ``PLUGIN_DISCOVERY_CACHE`` is set to ``False``. A cached result is
+        returned for as long as the environment variable value, entry-point
+        extensions and set of defined `Pluggable` sub-classes do not change.
+        Because of this, and because ``is_usable()`` verdicts are memoized in
+        `USABILITY_CACHE`, changes in the return of an implementation's
+        ``is_usable()`` are not observed until the caches are invalidated,
+        e.g. via :meth:`refresh_impls`.
+
+        This method is safe to call from multiple threads, including on
+        free-threaded builds of python. Concurrent calls for the same class
+        under the same discovery state share a single discovery, whose
+        result each caller receives a copy of.
 
         :return: Set of discovered class types that are considered "valid"
             plugins of this type. See :py:func:`is_valid_plugin` for what we
             define a "valid" type to be relative to this class.
 
         """
-        candidate_types = {
-            *discover_via_env_var(cls.PLUGIN_ENV_VAR),
-            *discover_via_entrypoint_extensions(cls.PLUGIN_NAMESPACE),
-            *discover_via_subclasses(cls)
-        }
-        resolved_types = cast(
-            Set[Type[P]],
-            filter_plugin_types(cls, candidate_types)
-        )
-        return resolved_types
+        return cast(Set[Type[P]], _get_impls(cls))
+
+    @classmethod
+    def get_impl(cls: Type[P], type_key: str) -> Type[P]:
+        """
+        Get the single implementation of this class that has the given type
+        key, as used for the ``"type"`` value of configuration dictionaries.
+
+        This first attempts to directly import the type from the module named
+        by the key, returning it if it is a valid plugin of this class (see
+        :py:func:`is_valid_plugin`). This avoids performing a full discovery
+        and thus importing all other plugin modules. Only if the type cannot
+        be imported this way, e.g. because the class is not accessible as a
+        module attribute, is a full discovery via :meth:`get_impls` performed
+        to look for it.
+
+        Note that the direct import may import any module on the python path
+        named by the type key, not only those exposed via the discovery
+        methods. Its types are only ever returned if valid plugins of this
+        class, however.
+
+        The direct import is subject to the ``PLUGIN_TIMEOUT`` budget, as
+        described for :meth:`get_impls`. A module exceeding it, or still being
+        imported after exceeding it before, is not waited on.
+
+        :param type_key: Key of the implementation type to get.
+
+        :raises ValueError: No valid implementation type with the given key
+            could be found.
+
+        :return: The implementation type.
+        """
+        llevel = 1
+        module_name, _, name = type_key.rpartition(".")
+        if module_name:
+            try:
+                module = _import_with_deadline(
+                    "get_impl", module_name,
+                    functools.partial(importlib.import_module, module_name),
+                    cls.PLUGIN_TIMEOUT,
+                )
+                if module is None:
+                    raise ImportError(f"Import of '{module_name}' exceeded its time budget.")
+                t = getattr(module, name)
+            except (ImportError, AttributeError) as ex:
+                LOG.log(llevel, f"[{cls.__name__}] Could not directly import type '{type_key}': {ex!r}")
+            else:
+                if (
+                    isinstance(t, type) and _type_to_key(t) == type_key
+                    and is_valid_plugin(t, cls, cls.PLUGIN_TIMEOUT)
+                ):
+                    return t
+        LOG.log(llevel, f"[{cls.__name__}] Falling back to full discovery for type '{type_key}'.")
+        impl_map = {_type_to_key(t): t for t in cls.get_impls()}
+        if type_key not in impl_map:
+            raise ValueError(
+                f"Implementation type specified as '{type_key}', but no plugin "
+                f"implementations of `{cls.__name__}` are available for that "
+                f"type. Available implementation types options: {list(impl_map)}"
+            )
+        return resolve_type(impl_map[type_key])
+
+    @classmethod
+    async def aget_impls(
+        cls: Type[P], executor: Optional[Executor] = None
+    ) -> Set[Type[P]]:
+        """
+        Asynchronously discover and return a set of classes that implement
+        the calling class.
+
+        The discovery performed by :meth:`get_impls`, which may block on
+        importing modules and probing ``is_usable()``, is run in the given
+        executor so as to not block the running event loop. Discovery results
+        are cached the same as for :meth:`get_impls`.
+
+        :param executor: Executor to run discovery in. If None, the event
+            loop's default executor is used.
+
+        :return: Set of discovered class types that are considered "valid"
+            plugins of this type.
+        """
+        # Deferred as asyncio is costly to import and only needed here.
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, cls.get_impls)
+
+    @classmethod
+    def invalidate_impls(cls) -> None:
+        """
+        Drop any cached discovery result for this interface type.
+
+        The next call to :meth:`get_impls` will perform a full discovery.
+        """
+        DISCOVERY_CACHE.invalidate(cls)
+
+    @classmethod
+    def refresh_impls(cls: Type[P]) -> Set[Type[P]]:
+        """
+        Drop any cached discovery result and memoized plugin verdicts for
+        this interface type, as well as the memoized ``is_usable()`` verdicts
+        of its currently defined descendants, and perform a fresh discovery.
+
+        :return: Set of discovered class types that are considered "valid"
+            plugins of this type.
+        """
+        DISCOVERY_CACHE.invalidate(cls)
+        PLUGIN_VERDICT_CACHE.invalidate(cls)
+        for t in discover_via_subclasses(cls):
+            USABILITY_CACHE.invalidate(t)
+        return cls.get_impls()
 
     @classmethod
     def is_usable(cls) -> bool:
@@ -430,3 +3181,179 @@ class Pluggable(metaclass=abc.ABCMeta):
 
         """
         return True
+
+
+def discover_all(interface_types: Iterable[Type[P]]) -> Dict[Type[P], Set[Type[P]]]:
+    """
+    Discover the implementations of multiple `Pluggable` interface types in a
+    single pass.
+
+    Candidate types drawn from environment variables and entry-point
+    extensions are collected once for each distinct environment variable and
+    namespace among the interfaces and partitioned across all interfaces,
+    instead of being collected again for each interface. The result for each
+    interface is the same as what its :meth:`Pluggable.get_impls` would
+    return, including the use of `DISCOVERY_CACHE`.
+
+    :param interface_types: The `Pluggable` interface types to discover
+        implementations of.
+
+    :return: Mapping of each interface type to its set of discovered
+        implementation types.
+    """
+    pools: Dict[Hashable, Set[Type]] = {}
+    return {
+        iface: cast(Set[Type[P]], _get_impls(iface, pools))
+        for iface in interface_types
+    }
+
+
+async def adiscover_all(
+    interface_types: Iterable[Type[P]], executor: Optional[Executor] = None
+) -> Dict[Type[P], Set[Type[P]]]:
+    """
+    Asynchronously discover the implementations of multiple `Pluggable`
+    interface types, running the discovery of each interface concurrently via
+    :meth:`Pluggable.aget_impls`.
+
+    Unlike :func:`discover_all`, candidate types are not shared across
+    interfaces, however modules are only imported once regardless and
+    concurrent discoveries of the same interface are coalesced.
+
+    :param interface_types: The `Pluggable` interface types to discover
+        implementations of.
+    :param executor: Executor to run discoveries in. If None, the event loop's
+        default executor is used.
+
+    :return: Mapping of each interface type to its set of discovered
+        implementation types.
+    """
+    # Deferred for the same reason as in `Pluggable.aget_impls`.
+    import asyncio
+
+    ifaces = list(interface_types)
+    results = await asyncio.gather(*(iface.aget_impls(executor) for iface in ifaces))
+    return dict(zip(ifaces, results))
+
+
+class WarmupRegistry:
+    """
+    Record of the plugin discovery results of interfaces warmed up via
+    :func:`warmup`, alongside the discovery sources they were drawn from.
+
+    `Pluggable.get_impls` falls back to these results when its
+    `DISCOVERY_CACHE` entry for a warmed-up interface is missing or stale but
+    the interface's discovery sources, other than its sub-classes, are
+    unchanged. Thus, defining new `Pluggable` sub-classes, e.g. in a forked
+    process, does not cause the discovery of warmed-up interfaces to be
+    performed again.
+
+    The instance of this class populated by :func:`warmup` is available as
+    the module-level `WARMUP_REGISTRY` attribute. Processes forked after a
+    warm-up inherit its content, as well as the content of `DISCOVERY_CACHE`
+    and `USABILITY_CACHE`.
+    """
+
+    def __init__(self) -> None:
+        # Interface type to the discovery source key at warm-up and the
+        # implementations discovered.
+        self._entries: Dict[Type, Tuple[Hashable, FrozenSet[Type]]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, interface_type: Type) -> bool:
+        return interface_type in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(
+        self, interface_type: Type, impls: Iterable[Type], source_key: Hashable
+    ) -> None:
+        """
+        Record the warm-up result of an interface.
+
+        :param interface_type: The warmed-up interface type.
+        :param impls: The implementation types discovered for the interface.
+        :param source_key: The discovery source key of the interface the
+            result was discovered under.
+        """
+        with self._lock:
+            self._entries[interface_type] = (source_key, frozenset(impls))
+
+    def impls(
+        self, interface_type: Type, source_key: Optional[Hashable] = None
+    ) -> Optional[FrozenSet[Type]]:
+        """
+        :param interface_type: The interface type to get the implementations
+            of.
+        :param source_key: Optional current discovery source key of the
+            interface. If given, the recorded implementations are only
+            returned if they were discovered under an equal key.
+
+        :return: The implementations recorded for the interface type, or None
+            if it was not warmed up.
+        """
+        entry = self._entries.get(interface_type)
+        if entry is None or (source_key is not None and entry[0] != source_key):
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        """
+        Drop all recorded warm-up results.
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+WARMUP_REGISTRY = WarmupRegistry()
+
+
+def warmup(
+    interface_types: Iterable[Type[P]],
+    constructors: bool = True,
+    freeze_gc: bool = False,
+) -> Dict[Type[P], Set[Type[P]]]:
+    """
+    Perform the plugin discovery of the given interfaces up front, e.g. in a
+    parent process before forking worker processes, so that the results are
+    shared with, instead of computed again by, the workers.
+
+    This discovers the implementations of each interface, populating
+    `DISCOVERY_CACHE` and `USABILITY_CACHE` along the way, resolves any
+    `LazyPluginType` handles so that their modules are imported, and records
+    the results in `WARMUP_REGISTRY`. Forked processes inherit all of these,
+    thus their own :meth:`Pluggable.get_impls` calls are served without
+    importing anything, as long as the environment variables and entry-points
+    the interfaces are discovered from do not change. See `WarmupRegistry`.
+
+    :param interface_types: The `Pluggable` interface types to warm up.
+    :param constructors: If the constructors of the implementations that are
+        `smqtk_core.configuration.Configurable` are to be introspected too,
+        as memoized for, and used by, their ``get_default_config()`` and
+        ``from_config()``.
+    :param freeze_gc: If the garbage collector is to be run and then have all
+        currently tracked objects frozen via `gc.freeze`, so that the
+        collector does not touch, and thus un-share, their memory pages in
+        forked processes.
+
+    :return: Mapping of each interface type to its set of discovered
+        implementation types.
+    """
+    # Deferred to avoid a circular import, as the configuration module depends
+    # on this one.
+    # noinspection PyProtectedMember
+    from smqtk_core.configuration import Configurable, _get_constructor_adapter
+
+    result = discover_all(interface_types)
+    for iface, impls in result.items():
+        resolved = [resolve_type(t) for t in impls]
+        if constructors:
+            for t in resolved:
+                if issubclass(t, Configurable):
+                    _get_constructor_adapter(t)
+        WARMUP_REGISTRY.put(iface, resolved, _discovery_source_key(iface))
+    if freeze_gc:
+        gc.collect()
+        gc.freeze()
+    return result
@@ -0,0 +1,174 @@
+"""Unit tests for the plugin command-line tool."""
+import json
+import os
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from smqtk_core.cli import main, _percentile
+from smqtk_core.plugin import (
+    metadata, PersistentUsabilityStore, PLUGIN_TIMEOUTS, PluginManifest,
+    SharedDiscoveryCache,
+)
+
+from tests.test_plugin_dir import module_of_pluggables
+
+
+IFACE_KEY = "tests.test_plugin_dir.module_of_pluggables.PluggableInterface"
+USABLE_KEY = "tests.test_plugin_dir.module_of_pluggables.UsableImpl"
+NOT_USABLE_KEY = "tests.test_plugin_dir.module_of_pluggables.NotUsableImpl"
+ENTRYPOINTS = (
+    metadata.EntryPoint(
+        name="pluggables",
+        value="tests.test_plugin_dir.module_of_pluggables",
+        group="smqtk_plugins",
+    ),
+)
+
+
+@mock.patch.dict(os.environ, {"SMQTK_PLUGIN_PATH": "tests.test_plugin_dir.module_of_pluggables"})
+@mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+def test_list(_: mock.Mock, capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that implementations are listed with the sources that provide them.
+    """
+    main(["list", "--json", IFACE_KEY])
+    report = json.loads(capsys.readouterr().out)
+    assert report == {
+        IFACE_KEY: {
+            USABLE_KEY: ["env_var:SMQTK_PLUGIN_PATH", "entrypoint:smqtk_plugins", "subclasses"],
+        }
+    }
+
+    main(["list", IFACE_KEY])
+    out = capsys.readouterr().out
+    assert out.splitlines() == [
+        IFACE_KEY,
+        f"    {USABLE_KEY}  [env_var:SMQTK_PLUGIN_PATH, entrypoint:smqtk_plugins, subclasses]",
+    ]
+
+
+def test_list_all_interfaces(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that, without interfaces specified, defined abstract `Pluggable`
+    types are listed.
+    """
+    main(["list", "--json"])
+    report = json.loads(capsys.readouterr().out)
+    assert report[IFACE_KEY] == {USABLE_KEY: ["subclasses"]}
+
+
+def test_invalid_interface(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that a non-importable, or non-`Pluggable`, interface is reported as
+    a usage error.
+    """
+    with pytest.raises(SystemExit) as exc_info:
+        main(["list", "probably.not.a.valid.Interface"])
+    assert exc_info.value.code == 2
+    assert "Could not import interface" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(["list", "json.JSONDecoder"])
+    assert "is not a `Pluggable` type" in capsys.readouterr().err
+
+
+def test_time(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that repeated discovery is timed and summarized.
+    """
+    with mock.patch.object(
+        module_of_pluggables.PluggableInterface, "get_impls"
+    ) as m_get_impls:
+        main(["time", "--json", "-r", "3", IFACE_KEY])
+    assert m_get_impls.call_count == 3
+    report = json.loads(capsys.readouterr().out)
+    r = report[IFACE_KEY]
+    assert r["repeats"] == 3
+    assert r["min"] <= r["median"] <= r["p95"]
+
+
+def test_percentile() -> None:
+    """
+    Test nearest-rank percentiles.
+    """
+    values = [float(v) for v in range(1, 101)]
+    assert _percentile(values, 95) == 95.
+    assert _percentile(values, 100) == 100.
+    assert _percentile([3.], 95) == 3.
+
+
+@mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+def test_manifest(_: mock.Mock, tmp_path: Path) -> None:
+    """
+    Test that a manifest file is generated.
+    """
+    filepath = str(tmp_path / "manifest.json")
+    main(["manifest", filepath])
+    manifest = PluginManifest.load(filepath)
+    assert manifest.namespace == "smqtk_plugins"
+    assert manifest.impl_keys(module_of_pluggables.PluggableInterface) == {USABLE_KEY}
+
+
+def test_usability_cache(tmp_path: Path) -> None:
+    """
+    Test that the verdicts of implementations are written to a usability
+    cache file.
+    """
+    filepath = str(tmp_path / "usability.json")
+    main(["usability-cache", filepath, IFACE_KEY])
+    store = PersistentUsabilityStore(filepath)
+    usable = store.get(USABLE_KEY)
+    not_usable = store.get(NOT_USABLE_KEY)
+    assert usable is not None and usable[0] is True
+    assert not_usable is not None and not_usable[0] is False
+
+
+def test_usability_cache_single_write(tmp_path: Path) -> None:
+    """
+    Test that the verdicts of all implementations are written to the file
+    at once.
+    """
+    filepath = str(tmp_path / "usability.json")
+    with mock.patch.object(
+        PersistentUsabilityStore, "_write", autospec=True,
+        side_effect=PersistentUsabilityStore._write,
+    ) as m_write:
+        main(["usability-cache", filepath, IFACE_KEY])
+    assert m_write.call_count == 1
+    assert PersistentUsabilityStore(filepath).get(USABLE_KEY) is not None
+
+
+def test_usability_cache_timeout(tmp_path: Path) -> None:
+    """
+    Test that implementations whose probe exceeds the interface's time
+    budget are given no verdict.
+    """
+    def slow_probe() -> bool:
+        time.sleep(0.2)
+        return True
+
+    filepath = str(tmp_path / "usability.json")
+    with mock.patch.object(module_of_pluggables.PluggableInterface, "PLUGIN_TIMEOUT", 0.02), \
+            mock.patch.object(module_of_pluggables.UsableImpl, "is_usable", slow_probe):
+        main(["usability-cache", filepath, IFACE_KEY])
+        while PLUGIN_TIMEOUTS.pending("usability", USABLE_KEY):
+            time.sleep(0.01)
+    PLUGIN_TIMEOUTS.clear()
+    store = PersistentUsabilityStore(filepath)
+    assert store.get(USABLE_KEY) is None
+    assert store.get(NOT_USABLE_KEY) is not None
+
+
+def test_shared_cache(tmp_path: Path) -> None:
+    """
+    Test that entries are written to a shared discovery cache directory.
+    """
+    directory = str(tmp_path / "shared")
+    with mock.patch.dict(os.environ):
+        main(["shared-cache", directory, IFACE_KEY])
+        entry = SharedDiscoveryCache(directory).get(module_of_pluggables.PluggableInterface)
+    module_of_pluggables.PluggableInterface.invalidate_impls()
+    assert entry is not None
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Set, Type, TypeVar
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, cast, Dict, Iterator, List, Set, Type, TypeVar
 import unittest.mock as mock
 
 import pytest
@@ -10,8 +12,13 @@ from smqtk_core.configuration import (
     make_default_config,
     to_config_dict,
     from_config_dict,
+    from_config_dict_many,
+    afrom_config_dict,
     configuration_test_helper,
+    _param_map_func,
+    _resolve_config_type,
 )
+from smqtk_core.plugin import LazyPluginType, Pluggable, TypeKeyIndex
 
 
 ###############################################################################
@@ -73,6 +80,18 @@ class T2 (Configurable):
         }
 
 
+class TPluggable (Pluggable, Configurable):
+    """
+    Interface whose implementations are resolved through plugin discovery.
+    """
+
+
+class TPluggableImpl (TPluggable, T1):
+    """
+    Implementation of the plugin interface above.
+    """
+
+
 # Set of "available" types for tests below.
 T_CLASS_SET: Set[Type[Configurable]] = {T1, T2}
 
@@ -181,6 +200,88 @@ def test_configurable_classmethod_override_getdefaultconfig() -> None:
     }
 
 
+def test_configurable_default_config_memoized() -> None:
+    """
+    Test that constructor parameters are introspected once per class, until
+    the constructor or its defaults are replaced, and that returned
+    configurations may be modified without affecting later calls.
+    """
+    # noinspection PyAbstractClass
+    class T (Configurable):
+        # noinspection PyUnusedLocal
+        def __init__(self, a: int = 0, b: str = 'foo'):
+            """ empty constructor """
+
+    with mock.patch("smqtk_core.configuration._param_map_func",
+                    wraps=_param_map_func) as m_pmf:
+        config = T.get_default_config()
+        config['a'] = 1
+        assert T.get_default_config() == {'a': 0, 'b': 'foo'}
+        assert m_pmf.call_count == 1
+
+        # noinspection PyUnusedLocal
+        def new_init(self: Any, c: float = 1.) -> None:
+            """ replacement constructor """
+        setattr(T, "__init__", new_init)
+        assert T.get_default_config() == {'c': 1.}
+        T.__init__.__defaults__ = (2.,)
+        assert T.get_default_config() == {'c': 2.}
+        assert m_pmf.call_count == 3
+
+
+def test_from_config_merge_default() -> None:
+    """
+    Test that constructing from a configuration fills in constructor defaults
+    as a recursive merge of the configuration on top of them would, and
+    follows the replacement of the constructor.
+    """
+    class T (Configurable):
+        def __init__(self, a: int, b: str = 'foo', c: Dict = {'x': 1, 'y': 2}):
+            self.kwargs = dict(a=a, b=b, c=c)
+
+        def get_config(self) -> Dict:
+            return self.kwargs
+
+    inst = T.from_config({'a': 1})
+    assert inst.kwargs == {'a': 1, 'b': 'foo', 'c': {'x': 1, 'y': 2}}
+    inst = T.from_config({'b': 'bar', 'c': {'y': 3}})
+    assert inst.kwargs == {'a': None, 'b': 'bar', 'c': {'x': 1, 'y': 3}}
+    inst = T.from_config({'a': 1, 'c': {}}, merge_default=False)
+    assert inst.kwargs == {'a': 1, 'b': 'foo', 'c': {}}
+    with pytest.raises(TypeError):
+        T.from_config({'d': 0})
+
+    # noinspection PyUnusedLocal
+    def new_init(self: Any, d: int = 4) -> None:
+        self.kwargs = dict(d=d)
+    setattr(T, "__init__", new_init)
+    assert T.from_config({}).kwargs == {'d': 4}
+
+
+def test_from_config_merge_default_not_mutated() -> None:
+    """
+    Test that merging configured dictionaries into dictionary defaults does
+    not modify the constructor's default values, whether or not the default
+    configuration is overridden.
+    """
+    class T (Configurable):
+        def __init__(self, opts: Dict = {'a': 1}):
+            self.opts = opts
+
+        def get_config(self) -> Dict:
+            return {'opts': self.opts}
+
+    class TOverride (T):
+        @classmethod
+        def get_default_config(cls) -> Dict[str, Any]:
+            return super().get_default_config()
+
+    for cls in (T, TOverride):
+        assert cls.from_config({'opts': {'b': 2}}).opts == {'a': 1, 'b': 2}
+        assert cls.get_default_config() == {'opts': {'a': 1}}
+        assert cls().opts == {'a': 1}
+
+
 def test_make_default_config() -> None:
     """
     Test expected normal operation of ``make_default_config``.
@@ -471,6 +572,194 @@ def test_from_config_dict() -> None:
     assert i.beta == "euclidean"
 
 
+def test_from_config_dict_lazy_types() -> None:
+    """
+    Test that lazy plugin type handles are accepted in place of types and that
+    only the selected handle is resolved.
+    """
+    test_config = {
+        'type': 'tests.test_configuration.T1',
+        'tests.test_configuration.T1': {'foo': 3, 'bar': 'b'},
+    }
+    h_t1 = LazyPluginType('tests.test_configuration.T1')
+    h_t2 = LazyPluginType('tests.test_configuration.T2')
+    # Handles stand in for types.
+    handles = cast(List[Type[Configurable]], [h_t1, h_t2])
+    cls, cls_conf = cls_conf_from_config_dict(test_config, handles)
+    assert cls is T1
+    assert not h_t2.is_resolved
+
+    i = from_config_dict(test_config, handles)
+    assert isinstance(i, T1)
+    assert i.foo == 3
+
+    assert make_default_config(handles) == make_default_config(T_CLASS_SET)
+
+
+def test_from_config_dict_pluggable_interface() -> None:
+    """
+    Test that a Pluggable interface type may be given to select from, which
+    only resolves the configured implementation.
+    """
+    test_config = {
+        'type': 'tests.test_configuration.TPluggableImpl',
+        'tests.test_configuration.TPluggableImpl': {'foo': 7},
+    }
+    with mock.patch.object(TPluggable, 'get_impls') as m_get_impls:
+        i = from_config_dict(test_config, TPluggable)
+        m_get_impls.assert_not_called()
+    assert isinstance(i, TPluggableImpl)
+    assert i.foo == 7
+    assert i.bar == 'baz'
+
+    test_config['type'] = 'tests.test_configuration.T1'
+    test_config['tests.test_configuration.T1'] = {}
+    with pytest.raises(ValueError, match=r"no plugin implementations of `TPluggable`"):
+        from_config_dict(test_config, TPluggable)
+
+    with pytest.raises(ValueError, match=r"must be a `Pluggable` interface type"):
+        cls_conf_from_config_dict(test_config, T1)
+
+
+def test_from_config_dict_type_key_index() -> None:
+    """
+    Test resolving configured types from a type key index, without keying
+    the indexed types again.
+    """
+    index = TypeKeyIndex(T_CLASS_SET)
+    test_config = {
+        'type': 'tests.test_configuration.T1',
+        'tests.test_configuration.T1': {'foo': 5},
+    }
+    with mock.patch("smqtk_core.configuration._type_to_key") as m_type_to_key:
+        i: Configurable = from_config_dict(test_config, index)
+        insts: List[Configurable] = list(from_config_dict_many([test_config] * 3, index))
+    m_type_to_key.assert_not_called()
+    assert isinstance(i, T1) and i.foo == 5
+    assert [cast(T1, i).foo for i in insts] == [5] * 3
+
+    with pytest.raises(ValueError, match="no plugin implementations are available"):
+        from_config_dict({'type': 'other.Type', 'other.Type': {}}, index)
+
+
+def test_afrom_config_dict() -> None:
+    """
+    Test that the asynchronous variant constructs the same as the synchronous
+    one, passing along extra positional arguments.
+    """
+    test_config = {
+        'type': 'tests.test_configuration.TPluggableImpl',
+        'tests.test_configuration.TPluggableImpl': {'foo': 7},
+    }
+    i = asyncio.run(afrom_config_dict(test_config, TPluggable))
+    assert isinstance(i, TPluggableImpl)
+    assert i.foo == 7
+
+    with mock.patch.object(TPluggableImpl, 'from_config') as m_from_config:
+        asyncio.run(afrom_config_dict(test_config, TPluggable, 'extra'))
+    m_from_config.assert_called_once_with({'foo': 7}, 'extra')
+
+
+def test_from_config_many() -> None:
+    """
+    Test that batch construction matches individual construction, drawing
+    configurations lazily, both in and out of an executor.
+    """
+    drawn: List[int] = []
+
+    def configs() -> Iterator[Dict]:
+        for i in range(10):
+            drawn.append(i)
+            yield {'foo': i}
+
+    insts = T1.from_config_many(configs())
+    assert next(insts).foo == 0
+    assert drawn == [0]
+    assert [i.foo for i in insts] == list(range(1, 10))
+    assert [i.bar for i in T1.from_config_many([{'bar': 'a'}])] == ['a']
+    assert [i.foo for i in T1.from_config_many([{'foo': 2}], merge_default=False)] == [2]
+
+    drawn.clear()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        insts = T1.from_config_many(configs(), executor=executor, max_pending=3)
+        assert next(insts).foo == 0
+        assert len(drawn) == 3
+        assert [i.foo for i in insts] == list(range(1, 10))
+
+    # Classes overriding how they are constructed are constructed through
+    # their `from_config`.
+    with mock.patch.object(T2, 'from_config', wraps=T2.from_config) as m_from_config:
+        insts2 = list(T2.from_config_many({'child': {'foo': i}} for i in range(3)))
+    assert m_from_config.call_count == 3
+    assert [i.child.foo for i in insts2] == [0, 1, 2]
+
+
+def test_from_config_many_process_pool() -> None:
+    """
+    Test that batch construction may be performed in a process pool.
+    """
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        insts = list(T1.from_config_many(({'foo': i} for i in range(5)), executor=executor))
+    assert [i.foo for i in insts] == list(range(5))
+
+
+def test_from_config_dict_many() -> None:
+    """
+    Test that batch construction from configuration dictionaries resolves
+    each configured type once and matches individual construction.
+    """
+    def configs() -> Iterator[Dict]:
+        for i in range(6):
+            if i % 2:
+                yield {'type': 'tests.test_configuration.T1',
+                       'tests.test_configuration.T1': {'foo': i}}
+            else:
+                yield {'type': 'tests.test_configuration.T2',
+                       'tests.test_configuration.T2': {'child': {'foo': i}}}
+
+    with mock.patch("smqtk_core.configuration._resolve_config_type",
+                    wraps=_resolve_config_type) as m_resolve:
+        insts = list(from_config_dict_many(configs(), iter(T_CLASS_SET)))
+    assert m_resolve.call_count == 2
+    assert [type(i) for i in insts] == [T2, T1] * 3
+    assert [i.foo if isinstance(i, T1) else cast(T2, i).child.foo for i in insts] == list(range(6))
+    assert [i.get_config() for i in insts] == [
+        from_config_dict(c, T_CLASS_SET).get_config() for c in configs()
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        insts = list(from_config_dict_many(configs(), T_CLASS_SET, executor=executor))
+    assert [type(i) for i in insts] == [T2, T1] * 3
+
+    # Extra positional arguments are passed along.
+    with mock.patch.object(TPluggableImpl, 'from_config') as m_from_config:
+        list(from_config_dict_many([{
+            'type': 'tests.test_configuration.TPluggableImpl',
+            'tests.test_configuration.TPluggableImpl': {'foo': 7},
+        }], TPluggable, 'extra'))
+    m_from_config.assert_called_once_with({'foo': 7}, 'extra')
+
+    # Invalid configurations are reported when reached.
+    insts_iter = from_config_dict_many(
+        [{'type': 'tests.test_configuration.T1', 'tests.test_configuration.T1': {}}, {'type': None}],
+        T_CLASS_SET,
+    )
+    assert isinstance(next(insts_iter), T1)
+    with pytest.raises(ValueError, match="No implementation type specified"):
+        next(insts_iter)
+
+    # Including when constructing in an executor, after the instances of
+    # earlier configurations are yielded.
+    valid_config = {'type': 'tests.test_configuration.T1', 'tests.test_configuration.T1': {}}
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        insts_iter = from_config_dict_many(
+            [valid_config] * 5 + [{'type': None}], T_CLASS_SET, executor=executor,
+        )
+        assert all(isinstance(next(insts_iter), T1) for _ in range(5))
+        with pytest.raises(ValueError, match="No implementation type specified"):
+            next(insts_iter)
+
+
 def test_from_config_dict_assertion_error() -> None:
     """
     Test that assertion error is raised when a class is provided AND specified
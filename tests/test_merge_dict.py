@@ -1,3 +1,5 @@
+import copy
+import sys
 from typing import Dict
 import unittest
 
@@ -218,3 +220,50 @@ class TestMergeDict (unittest.TestCase):
         }
         merge_dict(a, b)
         self.assertEqual(a, expected)
+
+    def test_copy_on_write(self) -> None:
+        """
+        Test that a copy-on-write merge leaves ``a`` unmodified and shares
+        nested dictionaries that ``b`` does not merge into.
+        """
+        a_before = copy.deepcopy(self.a)
+        a_nested = self.a['nested']
+        a_even_deeper = a_nested['even_deeper']
+        r = merge_dict(self.a, self.b, copy_on_write=True)
+        self.assertEqual(r, self.expected)
+        self.assertEqual(self.a, a_before)
+        self.assertIsNot(r, self.a)
+        self.assertIsNot(r['nested'], a_nested)
+        self.assertIsNot(r['nested']['even_deeper'], a_even_deeper)
+        self.assertEqual(a_even_deeper, {'j': 'x', 'k': 'l'})
+        self.assertEqual(self.a['nested']['l'], [0, 1, 2])
+        self.assertEqual(self.a[3], 'value')
+        self.assertNotIn(4, self.a)
+        self.assertIs(r['s'], self.a['s'])
+
+        a = {'x': {'y': 1}, 'z': {'w': 2}}
+        r = merge_dict(a, {'x': {'y': 3}}, copy_on_write=True)
+        self.assertEqual(r, {'x': {'y': 3}, 'z': {'w': 2}})
+        self.assertIs(r['z'], a['z'])
+        self.assertEqual(a['x'], {'y': 1})
+
+    def test_deeply_nested(self) -> None:
+        """
+        Test merging dictionaries nested deeper than the recursion limit.
+        """
+        depth = sys.getrecursionlimit() * 2
+        a: Dict = {}
+        b: Dict = {}
+        a_leaf, b_leaf = a, b
+        for _ in range(depth):
+            a_leaf['n'] = {'keep': 1}
+            b_leaf['n'] = {}
+            a_leaf, b_leaf = a_leaf['n'], b_leaf['n']
+        b_leaf['new'] = 2
+
+        for copy_on_write in (False, True):
+            r = merge_dict(a, b, copy_on_write=copy_on_write)
+            leaf = r
+            for _ in range(depth):
+                leaf = leaf['n']
+            self.assertEqual(leaf, {'keep': 1, 'new': 2})
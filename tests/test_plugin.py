@@ -1,12 +1,28 @@
 """Unit tests for the plugin utility sub-module."""
 import abc
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import importlib
+import inspect
+import json
+import multiprocessing
+import multiprocessing.connection
 import os
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
 import types
-from typing import cast
+from typing import cast, Dict, List, Set, Tuple, Type
 from unittest import mock
 
 import pytest
 
+import smqtk_core.plugin
+from smqtk_core.configuration import Configurable
 # noinspection PyProtectedMember
 from smqtk_core.plugin import (
     metadata,
@@ -18,11 +34,40 @@ from smqtk_core.plugin import (
     discover_via_entrypoint_extensions,
     discover_via_subclasses,
     filter_plugin_types,
+    get_ns_entrypoints,
+    get_interface_ns,
+    invalidate_entrypoint_cache,
+    DiscoveryCache,
+    DISCOVERY_CACHE,
+    _SingleFlight,
+    _discovery_state_key,
+    _select_ns_entrypoints,
+    PluginManifest,
+    get_manifest,
+    clear_loaded_manifests,
+    discover_via_manifest,
+    LazyPluginType,
+    resolve_type,
+    UsabilityCache,
+    USABILITY_CACHE,
+    PluginVerdictCache,
+    PLUGIN_VERDICT_CACHE,
+    PersistentUsabilityStore,
+    discover_all,
+    adiscover_all,
+    profile_discovery,
+    warmup,
+    WARMUP_REGISTRY,
+    SharedDiscoveryCache,
+    PLUGIN_TIMEOUTS,
+    TypeKeyIndex,
+    _type_to_key,
     Pluggable,
 )
 
 from tests.test_plugin_dir import module_of_stuff
 from tests.test_plugin_dir import module_of_more_stuff
+from tests.test_plugin_dir import module_of_pluggables
 
 
 TYPES_IN_STUFF_MODULE = {
@@ -217,6 +262,153 @@ class TestDiscoveryViaEnvVar:
         with pytest.raises(RuntimeError, match=r"^Expected error on import$"):
             discover_via_env_var(TestDiscoveryViaEnvVar.VAR_NAME)
 
+    @mock.patch.dict(os.environ, {
+        VAR_NAME: OS_ENV_PATH_SEP.join([
+            "tests.test_plugin_dir.module_of_stuff",
+            "",
+            "tests.test_plugin_dir.module_of_more_stuff",
+        ])
+    })
+    def test_multiple_in_path_concurrent(self) -> None:
+        """
+        Test that concurrently importing modules yields the same result.
+        """
+        test_set = discover_via_env_var(TestDiscoveryViaEnvVar.VAR_NAME, max_workers=4)
+        assert test_set == (TYPES_IN_STUFF_MODULE | TYPES_IN_MORE_STUFF_MODULE)
+
+    @mock.patch.dict(os.environ, {
+        VAR_NAME: OS_ENV_PATH_SEP.join([
+            "tests.test_plugin_dir.module_of_stuff",
+            "probably.not.a.valid.path",
+            "tests.test_plugin_dir.module_with_exception",
+        ])
+    })
+    def test_concurrent_error_order(self) -> None:
+        """
+        Test that, when importing concurrently, the error of the first failing
+        module in listed order is propagated.
+        """
+        with pytest.raises(ModuleNotFoundError):
+            discover_via_env_var(TestDiscoveryViaEnvVar.VAR_NAME, max_workers=3)
+
+    @mock.patch.dict(os.environ, {
+        VAR_NAME: OS_ENV_PATH_SEP.join([
+            "tests.test_plugin_dir.module_unrelated_to_pluggables",
+            "tests.test_plugin_dir.module_of_aliased_pluggables",
+        ])
+    })
+    def test_static_scan(self) -> None:
+        """
+        Test that, when statically scanning for an interface, only modules
+        plausibly defining implementations of it are imported.
+        """
+        unrelated = "tests.test_plugin_dir.module_unrelated_to_pluggables"
+        aliased = "tests.test_plugin_dir.module_of_aliased_pluggables"
+        sys.modules.pop(unrelated, None)
+        sys.modules.pop(aliased, None)
+        test_set = discover_via_env_var(TestDiscoveryViaEnvVar.VAR_NAME, scan_for=Pluggable)
+        assert unrelated not in sys.modules
+        assert aliased in sys.modules
+        assert sys.modules[aliased].AliasedImpl in test_set
+
+    def test_static_scan_conditional_classes(self, tmp_path: Path) -> None:
+        """
+        Test that, when statically scanning, classes defined within
+        conditional blocks are considered.
+        """
+        pkg = tmp_path / "smqtk_scan_test_cond"
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+        (pkg / "interface.py").write_text(
+            "from smqtk_core.plugin import Pluggable\n"
+            "class CondInterface(Pluggable):\n"
+            "    ...\n"
+        )
+        (pkg / "plugins.py").write_text(
+            "import sys\n"
+            "import smqtk_scan_test_cond.interface as mp\n"
+            "try:\n"
+            "    import json\n"
+            "except ImportError:\n"
+            "    pass\n"
+            "else:\n"
+            "    class CondImpl(mp.CondInterface):\n"
+            "        ...\n"
+            "if sys.version_info >= (3,):\n"
+            "    class VersionedImpl(mp.CondInterface):\n"
+            "        ...\n"
+        )
+        try:
+            with mock.patch("sys.path", [*sys.path, str(tmp_path)]), \
+                    mock.patch.dict(os.environ, {self.VAR_NAME: "smqtk_scan_test_cond.plugins"}):
+                interface = importlib.import_module("smqtk_scan_test_cond.interface").CondInterface
+                test_set = discover_via_env_var(self.VAR_NAME, scan_for=interface)
+            plugins = sys.modules["smqtk_scan_test_cond.plugins"]
+            assert {plugins.CondImpl, plugins.VersionedImpl} <= test_set
+        finally:
+            for name in list(sys.modules):
+                if name.startswith("smqtk_scan_test_cond"):
+                    del sys.modules[name]
+
+    def test_static_scan_cross_package(self, tmp_path: Path) -> None:
+        """
+        Test that, when statically scanning, a module whose classes derive
+        from a base in another, not yet imported, package is imported.
+        """
+        pkg_a = tmp_path / "smqtk_scan_test_pkga"
+        pkg_b = tmp_path / "smqtk_scan_test_pkgb"
+        for pkg in (pkg_a, pkg_b):
+            pkg.mkdir()
+            (pkg / "__init__.py").write_text("")
+        (pkg_a / "base.py").write_text(
+            "from tests.test_plugin_dir.module_of_pluggables import PluggableInterface\n"
+            "class Intermediate(PluggableInterface):\n"
+            "    def cool_thing(self): ...\n"
+        )
+        (pkg_b / "plugins.py").write_text(
+            "from smqtk_scan_test_pkga.base import Intermediate\n"
+            "class Impl(Intermediate):\n"
+            "    ...\n"
+        )
+        (pkg_b / "dotted_plugins.py").write_text(
+            "import smqtk_scan_test_pkga.base\n"
+            "class DottedImpl(smqtk_scan_test_pkga.base.Intermediate):\n"
+            "    ...\n"
+        )
+        (pkg_b / "unrelated.py").write_text(
+            "import os\n"
+            "class Unrelated(object):\n"
+            "    ...\n"
+        )
+        modules = [
+            "smqtk_scan_test_pkgb.plugins",
+            "smqtk_scan_test_pkgb.dotted_plugins",
+            "smqtk_scan_test_pkgb.unrelated",
+        ]
+        try:
+            with mock.patch("sys.path", [*sys.path, str(tmp_path)]), \
+                    mock.patch.dict(os.environ, {self.VAR_NAME: OS_ENV_PATH_SEP.join(modules)}):
+                test_set = discover_via_env_var(
+                    self.VAR_NAME, scan_for=module_of_pluggables.PluggableInterface
+                )
+            assert "smqtk_scan_test_pkgb.unrelated" not in sys.modules
+            plugins = sys.modules["smqtk_scan_test_pkgb.plugins"]
+            dotted_plugins = sys.modules["smqtk_scan_test_pkgb.dotted_plugins"]
+            assert {plugins.Impl, plugins.Intermediate, dotted_plugins.DottedImpl} <= test_set
+        finally:
+            for name in list(sys.modules):
+                if name.startswith(("smqtk_scan_test_pkga", "smqtk_scan_test_pkgb")):
+                    del sys.modules[name]
+
+    @mock.patch.dict(os.environ, {VAR_NAME: "probably.not.a.valid.path"})
+    def test_static_scan_invalid_module(self) -> None:
+        """
+        Test that statically scanning a module that does not exist raises
+        the same error as importing it would.
+        """
+        with pytest.raises(ModuleNotFoundError):
+            discover_via_env_var(TestDiscoveryViaEnvVar.VAR_NAME, scan_for=Pluggable)
+
 
 class TestDiscoveryViaEntrypointExtensions:
     """
@@ -310,6 +502,178 @@ class TestDiscoveryViaEntrypointExtensions:
         )
         with pytest.raises(RuntimeError, match=r"^Expected error on import$"):
             discover_via_entrypoint_extensions("my_namespace")
+        with pytest.raises(RuntimeError, match=r"^Expected error on import$"):
+            discover_via_entrypoint_extensions("my_namespace", max_workers=3)
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints")
+    def test_concurrent_load(self, m_get_ep: mock.Mock) -> None:
+        """
+        Test that concurrently loading entry-point modules yields the same
+        result, including the rejection of non-module entry-points.
+        """
+        my_namespace = "my_namespace"
+        m_get_ep.return_value = (
+            metadata.EntryPoint(
+                name="module_via_extension_one",
+                value="tests.test_plugin_dir.module_of_stuff",
+                group=my_namespace,
+            ),
+            metadata.EntryPoint(
+                name="module_via_extension_two",
+                value="tests.test_plugin_dir.module_of_more_stuff",
+                group=my_namespace,
+            ),
+        )
+        type_set = discover_via_entrypoint_extensions(my_namespace, max_workers=2)
+        assert type_set == (TYPES_IN_STUFF_MODULE | TYPES_IN_MORE_STUFF_MODULE)
+
+        m_get_ep.return_value += (
+            metadata.EntryPoint(
+                name="module_via_extension_bad",
+                value="tests.test_plugin_dir.module_of_more_stuff:argparse.ArgumentParser",
+                group=my_namespace,
+            ),
+        )
+        with pytest.raises(NotAModuleError):
+            discover_via_entrypoint_extensions(my_namespace, max_workers=2)
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints")
+    def test_static_scan(self, get_ep: mock.Mock) -> None:
+        """
+        Test that, when statically scanning for an interface, modules that do
+        not plausibly define implementations of it are not loaded, while
+        entry-points not referring to modules are still reported.
+        """
+        unrelated = "tests.test_plugin_dir.module_unrelated_to_pluggables"
+        sys.modules.pop(unrelated, None)
+        get_ep.return_value = (
+            metadata.EntryPoint(
+                name="unrelated", value=unrelated, group="my_namespace"
+            ),
+            metadata.EntryPoint(
+                name="pluggables",
+                value="tests.test_plugin_dir.module_of_pluggables",
+                group="my_namespace",
+            ),
+        )
+        type_set = discover_via_entrypoint_extensions(
+            "my_namespace", scan_for=module_of_pluggables.PluggableInterface
+        )
+        assert unrelated not in sys.modules
+        assert module_of_pluggables.UsableImpl in type_set
+
+        get_ep.return_value += (
+            metadata.EntryPoint(
+                name="not_a_module",
+                value="tests.test_plugin_dir.module_of_more_stuff:argparse.ArgumentParser",
+                group="my_namespace",
+            ),
+        )
+        with pytest.raises(NotAModuleError):
+            discover_via_entrypoint_extensions(
+                "my_namespace", scan_for=module_of_pluggables.PluggableInterface
+            )
+        assert unrelated not in sys.modules
+
+    def test_interface_scoped_namespaces(self) -> None:
+        """
+        Test that, given an interface type, only modules declaring it, or a
+        descendant of it, or declaring nothing are loaded.
+        """
+        unrelated = "tests.test_plugin_dir.module_unrelated_to_pluggables"
+        sys.modules.pop(unrelated, None)
+        declared_ns = get_interface_ns(
+            "my_namespace", module_of_pluggables.StillAbstractInterface
+        )
+        groups = {
+            "my_namespace": (
+                metadata.EntryPoint(
+                    name="undeclared",
+                    value="tests.test_plugin_dir.module_of_stuff",
+                    group="my_namespace",
+                ),
+            ),
+            declared_ns: (
+                metadata.EntryPoint(
+                    name="pluggables",
+                    value="tests.test_plugin_dir.module_of_pluggables",
+                    group=declared_ns,
+                ),
+            ),
+            "my_namespace.some.other.Interface": (
+                metadata.EntryPoint(
+                    name="unrelated", value=unrelated,
+                    group="my_namespace.some.other.Interface",
+                ),
+            ),
+        }
+        with mock.patch("smqtk_core.plugin._get_entrypoint_groups", return_value=groups):
+            type_set = discover_via_entrypoint_extensions(
+                "my_namespace",
+                interface_type=module_of_pluggables.PluggableInterface,
+            )
+            assert unrelated not in sys.modules
+            assert module_of_pluggables.UsableImpl in type_set
+            assert module_of_stuff.ClassDefinition in type_set
+
+            discover_via_entrypoint_extensions("my_namespace")
+            assert unrelated in sys.modules
+
+
+class TestGetNsEntrypoints:
+    """
+    Unit tests for the cached entry-point enumeration.
+    """
+
+    EPS = {
+        "ns_one": (metadata.EntryPoint(name="a", value="pkg.a", group="ns_one"),),
+        "ns_two": (metadata.EntryPoint(name="b", value="pkg.b", group="ns_two"),),
+    }
+
+    def teardown_method(self) -> None:
+        invalidate_entrypoint_cache()
+
+    @mock.patch("smqtk_core.plugin._scan_entrypoints", return_value=EPS)
+    def test_single_scan_serves_namespaces(self, m_scan: mock.Mock) -> None:
+        """
+        Test that one scan serves repeated queries of multiple namespaces.
+        """
+        invalidate_entrypoint_cache()
+        assert get_ns_entrypoints("ns_one") == self.EPS["ns_one"]
+        assert get_ns_entrypoints("ns_two") == self.EPS["ns_two"]
+        assert get_ns_entrypoints("ns_one") == self.EPS["ns_one"]
+        assert get_ns_entrypoints("ns_none") == ()
+        m_scan.assert_called_once_with()
+
+        invalidate_entrypoint_cache()
+        get_ns_entrypoints("ns_one")
+        assert m_scan.call_count == 2
+
+    @mock.patch("smqtk_core.plugin._scan_entrypoints", return_value=EPS)
+    def test_search_path_change(self, m_scan: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test that changes to sys.path, or to the content of its directories,
+        cause a new scan.
+        """
+        invalidate_entrypoint_cache()
+        get_ns_entrypoints("ns_one")
+        with mock.patch("sys.path", [*sys.path, str(tmp_path)]):
+            get_ns_entrypoints("ns_one")
+            assert m_scan.call_count == 2
+            get_ns_entrypoints("ns_one")
+            assert m_scan.call_count == 2
+            # Make sure the directory modification time observably changes.
+            os.utime(tmp_path, ns=(0, 0))
+            get_ns_entrypoints("ns_one")
+            assert m_scan.call_count == 3
+
+    def test_real_scan(self) -> None:
+        """
+        Test that an actual scan returns entry-points of the queried group.
+        """
+        invalidate_entrypoint_cache()
+        for ep in get_ns_entrypoints("console_scripts"):
+            assert ep.group == "console_scripts"
 
 
 class TestDiscoverViaSubclasses:
@@ -368,6 +732,60 @@ class TestDiscoverViaSubclasses:
             DerivedClassTwoSubOneMore
         }
 
+    def test_pluggable_registry(self) -> None:
+        """
+        Test that the registry-based result for Pluggable types is identical to
+        traversing ``__subclasses__``, including with multiple inheritance.
+        """
+        class Interface(Pluggable):
+            ...
+
+        class Mixin:
+            ...
+
+        class Derived(Interface):
+            ...
+
+        class DerivedSub(Mixin, Derived):
+            ...
+
+        class OtherInterface(Pluggable):
+            ...
+
+        class Diamond(DerivedSub, OtherInterface):
+            ...
+
+        def dfs(t: type) -> Set[type]:
+            found = set()
+            candidates: List[type] = t.__subclasses__()
+            while candidates:
+                c = candidates.pop()
+                found.add(c)
+                candidates.extend(c.__subclasses__())
+            return found
+
+        assert discover_via_subclasses(Interface) == {Derived, DerivedSub, Diamond} == dfs(Interface)
+        assert discover_via_subclasses(Derived) == dfs(Derived)
+        assert discover_via_subclasses(OtherInterface) == {Diamond} == dfs(OtherInterface)
+        assert discover_via_subclasses(Diamond) == set()
+        # Non-Pluggable types still use traversal.
+        assert discover_via_subclasses(Mixin) == {DerivedSub, Diamond}
+
+    def test_pluggable_registry_weak(self) -> None:
+        """
+        Test that the registry does not keep sub-classes alive.
+        """
+        class Interface(Pluggable):
+            ...
+
+        class Derived(Interface):
+            ...
+
+        assert discover_via_subclasses(Interface) == {Derived}
+        del Derived
+        gc.collect()
+        assert discover_via_subclasses(Interface) == set()
+
 
 class TestFilterPluginTypes:
     """
@@ -452,6 +870,47 @@ class TestPluggable:
         impls = SomeInterface.get_impls()
         assert len(impls) == 0
 
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions")
+    @mock.patch("smqtk_core.plugin.discover_via_env_var")
+    def test_get_impl_direct(self, m_d_env: mock.Mock, m_d_ent: mock.Mock) -> None:
+        """
+        Test that a module-level implementation is resolved by its key without
+        performing a full discovery.
+        """
+        impl = module_of_pluggables.PluggableInterface.get_impl(
+            "tests.test_plugin_dir.module_of_pluggables.UsableImpl"
+        )
+        assert impl is module_of_pluggables.UsableImpl
+        m_d_env.assert_not_called()
+        m_d_ent.assert_not_called()
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions", return_value=set())
+    @mock.patch("smqtk_core.plugin.discover_via_env_var", return_value=set())
+    def test_get_impl_fallback(self, m_d_env: mock.Mock, _: mock.Mock) -> None:
+        """
+        Test that full discovery is used when the key does not name a module
+        attribute, and that invalid or unknown keys raise an error.
+        """
+        class SomeInterface(Pluggable):
+            ...
+
+        class LocalImpl(SomeInterface):
+            ...
+
+        assert SomeInterface.get_impl("tests.test_plugin.LocalImpl") is LocalImpl
+        assert m_d_env.call_count == 1
+
+        with pytest.raises(ValueError, match=r"no plugin implementations of `SomeInterface`"):
+            SomeInterface.get_impl("not.a.module.Type")
+        # Not a valid plugin of the interface.
+        with pytest.raises(ValueError, match=r"Available implementation types options: "
+                                             r"\['tests.test_plugin.LocalImpl'\]"):
+            SomeInterface.get_impl("tests.test_plugin_dir.module_of_pluggables.UsableImpl")
+        with pytest.raises(ValueError):
+            module_of_pluggables.PluggableInterface.get_impl(
+                "tests.test_plugin_dir.module_of_pluggables.NotUsableImpl"
+            )
+
     def test_usable_cls_method(self) -> None:
         """
         Test that `is_usable` returns the appropriate value by default and that
@@ -477,3 +936,1288 @@ class TestPluggable:
         # These should both still succeed in this simple case.
         IsUsable()
         NotUsable()
+
+
+class TestDiscoveryCache:
+    """
+    Unit tests for the memoization of `Pluggable.get_impls` results.
+    """
+
+    def test_get_put_invalidate(self) -> None:
+        """
+        Test basic entry storage, state key validation and invalidation.
+        """
+        cache = DiscoveryCache()
+        assert cache.get(int, "k") is None
+        assert cache.put(int, "k", [bool]) == frozenset({bool})
+        assert int in cache
+        assert cache.get(int, "k") == {bool}
+        # Non-matching state key drops the entry.
+        assert cache.get(int, "other") is None
+        assert int not in cache
+
+        cache.put(int, "k", [bool])
+        cache.put(str, "k", [])
+        cache.invalidate(int)
+        assert len(cache) == 1
+        cache.invalidate()
+        assert len(cache) == 0
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions")
+    @mock.patch("smqtk_core.plugin.discover_via_env_var")
+    def test_repeated_get_impls_cached(
+        self,
+        m_d_env: mock.Mock,
+        m_d_ent: mock.Mock,
+    ) -> None:
+        """
+        Test that repeated calls do not perform discovery again while still
+        observing newly defined sub-classes.
+        """
+        m_d_env.return_value = set()
+        m_d_ent.return_value = set()
+
+        class SomeInterface(Pluggable):
+            ...
+
+        class ImplOne(SomeInterface):
+            ...
+
+        assert SomeInterface.get_impls() == {ImplOne}
+        assert SomeInterface.get_impls() == {ImplOne}
+        assert m_d_env.call_count == 1
+
+        # Mutating the returned set should not affect the cache.
+        SomeInterface.get_impls().clear()
+        assert SomeInterface.get_impls() == {ImplOne}
+        assert m_d_env.call_count == 1
+
+        # A new sub-class should cause a re-discovery.
+        class ImplTwo(SomeInterface):
+            ...
+
+        assert SomeInterface.get_impls() == {ImplOne, ImplTwo}
+        assert m_d_env.call_count == 2
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions", return_value=set())
+    @mock.patch("smqtk_core.plugin.discover_via_env_var", return_value=set())
+    def test_weak_references(self, m_d_env: mock.Mock, m_d_ent: mock.Mock) -> None:
+        """
+        Test that cached results do not keep interface or implementation
+        types alive, and that results including collected types are not
+        returned.
+        """
+        class SomeInterface(Pluggable):
+            ...
+
+        def define_impl() -> None:
+            class LocalImpl(SomeInterface):
+                ...
+
+            assert SomeInterface.get_impls() == {LocalImpl}
+
+        define_impl()
+        gc.collect()
+        assert SomeInterface.get_impls() == set()
+
+        class OtherInterface(Pluggable):
+            ...
+
+        OtherInterface.get_impls()
+        assert OtherInterface in DISCOVERY_CACHE
+        n_entries = len(DISCOVERY_CACHE)
+        # Mocks retain the arguments they were called with.
+        m_d_env.reset_mock()
+        m_d_ent.reset_mock()
+        del OtherInterface
+        gc.collect()
+        assert len(DISCOVERY_CACHE) == n_entries - 1
+
+    def test_state_key_selection_memoized(self) -> None:
+        """
+        Test that the entry-points selected for an interface are not selected
+        again to compose its state key until the entry-points or defined
+        sub-classes change.
+        """
+        class SomeInterface(Pluggable):
+            ...
+
+        with mock.patch(
+            "smqtk_core.plugin._select_ns_entrypoints",
+            wraps=_select_ns_entrypoints,
+        ) as m_select:
+            key = _discovery_state_key(SomeInterface)
+            assert _discovery_state_key(SomeInterface) == key
+            assert m_select.call_count == 1
+
+            class ImplOne(SomeInterface):
+                ...
+
+            _discovery_state_key(SomeInterface)
+            assert m_select.call_count == 2
+            invalidate_entrypoint_cache()
+            _discovery_state_key(SomeInterface)
+            assert m_select.call_count == 3
+
+    @mock.patch.dict(os.environ, {"SMQTK_PLUGIN_PATH": ""})
+    def test_env_var_change_invalidates(self) -> None:
+        """
+        Test that a change to the environment variable value is observed.
+        """
+        class SomeInterface(Pluggable):
+            ...
+
+        with mock.patch(
+            "smqtk_core.plugin.discover_via_env_var", return_value=set()
+        ) as m_d_env:
+            SomeInterface.get_impls()
+            SomeInterface.get_impls()
+            assert m_d_env.call_count == 1
+            os.environ["SMQTK_PLUGIN_PATH"] = "tests.test_plugin_dir.module_of_stuff"
+            SomeInterface.get_impls()
+            assert m_d_env.call_count == 2
+
+    @mock.patch("smqtk_core.plugin.discover_via_env_var")
+    def test_refresh_and_disable(self, m_d_env: mock.Mock) -> None:
+        """
+        Test that `refresh_impls` and disabling the cache cause full discovery.
+        """
+        m_d_env.return_value = set()
+
+        class SomeInterface(Pluggable):
+            ...
+
+        SomeInterface.get_impls()
+        SomeInterface.refresh_impls()
+        assert m_d_env.call_count == 2
+        SomeInterface.invalidate_impls()
+        assert SomeInterface not in DISCOVERY_CACHE
+
+        class NoCacheInterface(SomeInterface):
+            PLUGIN_DISCOVERY_CACHE = False
+
+        NoCacheInterface.get_impls()
+        NoCacheInterface.get_impls()
+        assert m_d_env.call_count == 4
+        assert NoCacheInterface not in DISCOVERY_CACHE
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions")
+    @mock.patch("smqtk_core.plugin.discover_via_env_var")
+    def test_concurrent_single_flight(
+        self,
+        m_d_env: mock.Mock,
+        m_d_ent: mock.Mock,
+    ) -> None:
+        """
+        Test that concurrent calls for the same interface share a single
+        discovery, even with the discovery cache disabled.
+        """
+        release = threading.Event()
+
+        def slow_discovery(*_: object) -> Set[Type]:
+            release.wait(5)
+            return set()
+
+        m_d_env.side_effect = slow_discovery
+        m_d_ent.return_value = set()
+
+        class SomeInterface(Pluggable):
+            PLUGIN_DISCOVERY_CACHE = False
+
+        class ImplOne(SomeInterface):
+            ...
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(SomeInterface.get_impls) for _ in range(8)]
+            # Give all callers the chance to join the discovery in progress.
+            time.sleep(0.2)
+            release.set()
+            results = [f.result() for f in futures]
+        assert m_d_env.call_count == 1
+        assert all(r == {ImplOne} for r in results)
+        # Each caller receives its own set.
+        assert len({id(r) for r in results}) == len(results)
+
+    def test_single_flight_error_and_reentrance(self) -> None:
+        """
+        Test that errors propagate to the caller, and that re-entrant calls
+        for the same key do not wait on themselves.
+        """
+        flights = _SingleFlight()
+
+        def fail() -> None:
+            raise RuntimeError("expected")
+
+        with pytest.raises(RuntimeError, match="expected"):
+            flights.do("k", fail)
+        # The failed flight does not linger.
+        assert flights.do("k", lambda: 1) == 1
+        assert flights.do("k", lambda: flights.do("k", lambda: 2) + 1) == 3
+
+
+class TestPluginManifest:
+    """
+    Unit tests for plugin manifest generation, persistence and use in
+    discovery.
+    """
+
+    NS = "my_namespace"
+    ENTRYPOINTS = (
+        metadata.EntryPoint(
+            name="pluggables",
+            value="tests.test_plugin_dir.module_of_pluggables",
+            group=NS,
+        ),
+    )
+    IFACE_KEY = "tests.test_plugin_dir.module_of_pluggables.PluggableInterface"
+    USABLE_KEY = "tests.test_plugin_dir.module_of_pluggables.UsableImpl"
+    NOT_USABLE_KEY = "tests.test_plugin_dir.module_of_pluggables.NotUsableImpl"
+
+    def teardown_method(self) -> None:
+        clear_loaded_manifests()
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+    def test_generate(self, _: mock.Mock) -> None:
+        """
+        Test that generation records concrete Pluggable types against each of
+        their Pluggable ancestors.
+        """
+        m = PluginManifest.generate(self.NS)
+        assert m.interfaces[self.IFACE_KEY] == [self.NOT_USABLE_KEY, self.USABLE_KEY]
+        assert m.interfaces["smqtk_core.plugin.Pluggable"] == [self.NOT_USABLE_KEY, self.USABLE_KEY]
+        assert m.types[self.USABLE_KEY] == {
+            "module": "tests.test_plugin_dir.module_of_pluggables",
+            "attr": "UsableImpl",
+            "usable": True,
+        }
+        assert m.types[self.NOT_USABLE_KEY]["usable"] is False
+        assert m.impl_keys(module_of_pluggables.PluggableInterface) == {self.USABLE_KEY}
+        assert m.impl_keys(
+            module_of_pluggables.PluggableInterface, usable_only=False
+        ) == {self.USABLE_KEY, self.NOT_USABLE_KEY}
+        assert m.resolve(self.USABLE_KEY) is module_of_pluggables.UsableImpl
+        assert m.fingerprint["entrypoints"] == [
+            ["pluggables", "tests.test_plugin_dir.module_of_pluggables"]
+        ]
+        assert module_of_pluggables.__file__ in m.fingerprint["mtimes"]
+        assert not m.is_stale()
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+    def test_save_load_and_staleness(self, _: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test round-tripping through a file and staleness detection.
+        """
+        filepath = str(tmp_path / "manifest.json")
+        m = PluginManifest.generate(self.NS)
+        m.save(filepath)
+        m2 = PluginManifest.load(filepath)
+        assert m2.to_dict() == m.to_dict()
+
+        m2.fingerprint["mtimes"][module_of_pluggables.__file__] -= 1
+        assert m2.is_stale()
+        m2.fingerprint["mtimes"] = {}
+        m2.fingerprint["distributions"]["not-a-real-dist"] = "1.0"
+        assert m2.is_stale()
+        m2.fingerprint["distributions"] = m.fingerprint["distributions"]
+        m2.fingerprint["entrypoints"] = []
+        assert m2.is_stale()
+
+    def test_load_invalid(self, tmp_path: Path) -> None:
+        """
+        Test that loading invalid content raises a ValueError.
+        """
+        filepath = tmp_path / "manifest.json"
+        filepath.write_text('{"format_version": 0}')
+        with pytest.raises(ValueError, match=r"Unsupported plugin manifest format"):
+            PluginManifest.load(str(filepath))
+        filepath.write_text('{"format_version": 1}')
+        with pytest.raises(ValueError, match=r"Invalid plugin manifest content"):
+            PluginManifest.load(str(filepath))
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+    def test_get_manifest_regenerates(self, _: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test that a manifest is generated when missing or stale, and otherwise
+        loaded.
+        """
+        filepath = str(tmp_path / "manifest.json")
+        m = get_manifest(filepath, self.NS)
+        assert os.path.isfile(filepath)
+        # Loaded once per process.
+        assert get_manifest(filepath, self.NS) is m
+
+        clear_loaded_manifests()
+        with mock.patch.object(PluginManifest, "generate") as m_generate:
+            m2 = get_manifest(filepath, self.NS)
+            m_generate.assert_not_called()
+        assert m2.to_dict() == m.to_dict()
+
+        stale = json.loads(json.dumps(m.to_dict()))
+        stale["fingerprint"]["entrypoints"] = []
+        Path(filepath).write_text(json.dumps(stale))
+        clear_loaded_manifests()
+        assert get_manifest(filepath, self.NS).to_dict() == m.to_dict()
+        assert json.loads(Path(filepath).read_text()) == m.to_dict()
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+    def test_get_manifest_unwritable(self, _: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test that a generated manifest that cannot be saved is still used.
+        """
+        (tmp_path / "not_a_dir").write_text("")
+        filepath = str(tmp_path / "not_a_dir" / "manifest.json")
+        with mock.patch("smqtk_core.plugin.LOG.warning") as m_warning:
+            m = get_manifest(filepath, self.NS)
+        m_warning.assert_called_once()
+        assert m.impl_keys(module_of_pluggables.PluggableInterface) == {self.USABLE_KEY}
+        assert get_manifest(filepath, self.NS) is m
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions")
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=ENTRYPOINTS)
+    def test_get_impls_via_manifest(
+        self, _: mock.Mock, m_d_ent: mock.Mock, tmp_path: Path
+    ) -> None:
+        """
+        Test that get_impls uses the manifest when the manifest environment
+        variable is set.
+        """
+        class ManifestInterface(module_of_pluggables.PluggableInterface):
+            PLUGIN_NAMESPACE = self.NS
+
+        filepath = str(tmp_path / "manifest.json")
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_MANIFEST": filepath}):
+            assert discover_via_manifest(
+                module_of_pluggables.PluggableInterface, filepath, self.NS
+            ) == {module_of_pluggables.UsableImpl}
+            # The local interface has no implementations
+            assert ManifestInterface.get_impls() == set()
+            assert module_of_pluggables.PluggableInterface.refresh_impls() == {
+                module_of_pluggables.UsableImpl
+            }
+        m_d_ent.assert_not_called()
+
+
+class TestLazyPluginType:
+    """
+    Unit tests for lazily resolved plugin type handles.
+    """
+
+    KEY = "tests.test_plugin_dir.module_of_pluggables.UsableImpl"
+
+    def test_resolution_on_use(self) -> None:
+        """
+        Test that type key attributes are available without resolution and
+        that other use resolves the type.
+        """
+        h = LazyPluginType(self.KEY)
+        assert h.__module__ == "tests.test_plugin_dir.module_of_pluggables"
+        assert h.__name__ == "UsableImpl"
+        assert not h.is_resolved
+        assert "unresolved" in repr(h)
+        assert h.is_usable() is True
+        assert h.is_resolved
+        assert h.resolve() is module_of_pluggables.UsableImpl
+        assert isinstance(h(), module_of_pluggables.UsableImpl)
+
+        inst = module_of_pluggables.UsableImpl()
+        assert isinstance(inst, h)  # type: ignore[arg-type]
+        assert issubclass(module_of_pluggables.UsableImpl, h)  # type: ignore[arg-type]
+
+    def test_loader(self) -> None:
+        """
+        Test that a given loader is used for resolution, and only once.
+        """
+        m_loader = mock.Mock(return_value=int)
+        h = LazyPluginType("some.module.Thing", m_loader)
+        m_loader.assert_not_called()
+        assert h.resolve() is int
+        assert h.resolve() is int
+        m_loader.assert_called_once_with()
+
+    def test_equality(self) -> None:
+        """
+        Test that handles are equal based on their type key.
+        """
+        h = LazyPluginType.from_type(module_of_pluggables.UsableImpl)
+        assert h.is_resolved
+        assert h == LazyPluginType(self.KEY)
+        assert len({h, LazyPluginType(self.KEY)}) == 1
+        assert h != LazyPluginType("some.other.Type")
+        assert h != module_of_pluggables.UsableImpl
+        assert resolve_type(h) is module_of_pluggables.UsableImpl
+        assert resolve_type(int) is int
+
+    @mock.patch.object(PluginManifest, "is_stale", return_value=False)
+    def test_get_impls_lazy_via_manifest(self, _: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test that with a manifest, types sourced from it are not imported until
+        used, while otherwise discovered types are wrapped.
+        """
+        class LazyInterface(Pluggable):
+            PLUGIN_NAMESPACE = "my_namespace"
+            PLUGIN_LAZY_TYPES = True
+
+        class LocalImpl(LazyInterface):
+            ...
+
+        not_imported_key = "not.an.imported.module.Impl"
+        filepath = str(tmp_path / "manifest.json")
+        PluginManifest(
+            "my_namespace",
+            {"tests.test_plugin.LazyInterface": [not_imported_key]},
+            {not_imported_key: {"module": "not.an.imported.module", "attr": "Impl", "usable": True}},
+            {},
+        ).save(filepath)
+
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_MANIFEST": filepath}):
+            try:
+                impls = LazyInterface.get_impls()
+            finally:
+                clear_loaded_manifests()
+        assert impls == {LazyPluginType.from_type(LocalImpl), LazyPluginType(not_imported_key)}
+        handles = {h.type_key: h for h in cast(Set[LazyPluginType], impls)}
+        assert handles[not_imported_key].is_resolved is False
+        # Only on use is an import attempted.
+        with pytest.raises(ModuleNotFoundError):
+            handles[not_imported_key].resolve()
+
+
+class TestUsabilityCache:
+    """
+    Unit tests for the memoization of `Pluggable.is_usable` verdicts.
+    """
+
+    @staticmethod
+    def _make_types() -> Tuple[Type[Pluggable], Type[Pluggable], mock.Mock]:
+        m_probe = mock.Mock(return_value=True)
+
+        class Interface(Pluggable):
+            ...
+
+        class Impl(Interface):
+            @classmethod
+            def is_usable(cls) -> bool:
+                return m_probe()
+
+        return Interface, Impl, m_probe
+
+    def test_memoized(self) -> None:
+        """
+        Test that verdicts are memoized until invalidated.
+        """
+        _, impl, m_probe = self._make_types()
+        cache = UsabilityCache()
+        assert cache.is_usable(impl) is True
+        assert cache.is_usable(impl) is True
+        assert m_probe.call_count == 1
+        assert impl in cache
+
+        m_probe.return_value = False
+        cache.invalidate(impl)
+        assert cache.is_usable(impl) is False
+        cache.invalidate()
+        assert len(cache) == 0
+
+    @mock.patch("smqtk_core.plugin.time.time")
+    def test_ttl(self, m_time: mock.Mock) -> None:
+        """
+        Test that verdicts older than the time-to-live are probed again.
+        """
+        _, impl, m_probe = self._make_types()
+        cache = UsabilityCache(ttl=10)
+        m_time.return_value = 100.
+        cache.is_usable(impl)
+        m_time.return_value = 110.
+        cache.is_usable(impl)
+        assert m_probe.call_count == 1
+        m_time.return_value = 110.5
+        cache.is_usable(impl)
+        assert m_probe.call_count == 2
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions", return_value=set())
+    @mock.patch("smqtk_core.plugin.discover_via_env_var", return_value=set())
+    def test_discovery_integration(self, *_: mock.Mock) -> None:
+        """
+        Test that repeated validation does not probe again, and that
+        `refresh_impls` does.
+        """
+        interface, impl, m_probe = self._make_types()
+        assert is_valid_plugin(impl, interface)
+        assert filter_plugin_types(interface, [impl]) == {impl}
+        assert m_probe.call_count == 1
+        assert impl in USABILITY_CACHE
+
+        assert interface.get_impls() == {impl}
+        assert m_probe.call_count == 1
+        m_probe.return_value = False
+        assert interface.refresh_impls() == set()
+        assert m_probe.call_count == 2
+
+    def test_persisted_across_instances(self, tmp_path: Path) -> None:
+        """
+        Test that verdicts are reused by a new cache instance, as would be the
+        case in a new process, when the persistent store is specified.
+        """
+        _, impl, m_probe = self._make_types()
+        filepath = str(tmp_path / "usability.json")
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_USABILITY_CACHE": filepath}):
+            assert UsabilityCache().is_usable(impl) is True
+            assert m_probe.call_count == 1
+            m_probe.return_value = False
+            assert UsabilityCache().is_usable(impl) is True
+            assert m_probe.call_count == 1
+
+            # Explicit invalidation drops the persisted verdict too.
+            cache = UsabilityCache()
+            cache.invalidate(impl)
+            assert cache.is_usable(impl) is False
+            assert m_probe.call_count == 2
+            assert PersistentUsabilityStore(filepath).get(
+                "tests.test_plugin.Impl"
+            ) == (False, mock.ANY)
+
+            # Expired persisted verdicts are probed again.
+            m_probe.return_value = True
+            with mock.patch("smqtk_core.plugin.time.time", return_value=time.time() + 60):
+                assert UsabilityCache(ttl=30).is_usable(impl) is True
+            assert m_probe.call_count == 3
+
+    def test_persisted_batched(self, tmp_path: Path) -> None:
+        """
+        Test that verdicts newly probed while filtering are written to the
+        persistent store at once.
+        """
+        interface, impl, _ = self._make_types()
+        impls = [type(f"Impl{i}", (impl,), {}) for i in range(20)]
+        filepath = str(tmp_path / "usability.json")
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_USABILITY_CACHE": filepath}), \
+                mock.patch("smqtk_core.plugin.USABILITY_CACHE", UsabilityCache()), \
+                mock.patch(
+                    "smqtk_core.plugin._atomic_write_text",
+                    wraps=smqtk_core.plugin._atomic_write_text,
+                ) as m_write:
+            assert filter_plugin_types(interface, impls) == set(impls)
+            assert m_write.call_count == 1
+        verdicts = json.loads(Path(filepath).read_text())["verdicts"]
+        assert set(verdicts) == {_type_to_key(t) for t in impls}
+
+    def test_persisted_concurrent(self, tmp_path: Path) -> None:
+        """
+        Test that verdicts probed concurrently from multiple threads are all
+        persisted.
+        """
+        _, impl, _ = self._make_types()
+        n_threads = 8
+        impls = [type(f"Impl{i}", (impl,), {}) for i in range(n_threads * 25)]
+        filepath = str(tmp_path / "usability.json")
+        cache = UsabilityCache()
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_USABILITY_CACHE": filepath}):
+            with ThreadPoolExecutor(max_workers=n_threads) as pool:
+                list(pool.map(cache.is_usable, impls))
+        verdicts = json.loads(Path(filepath).read_text())["verdicts"]
+        assert set(verdicts) == {_type_to_key(t) for t in impls}
+
+    def test_persisted_unwritable(self, tmp_path: Path) -> None:
+        """
+        Test that a persistent store path that cannot be written does not
+        fail probing, with verdicts retained in memory.
+        """
+        _, impl, m_probe = self._make_types()
+        (tmp_path / "not_a_dir").write_text("")
+        filepath = str(tmp_path / "not_a_dir" / "usability.json")
+        cache = UsabilityCache()
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_USABILITY_CACHE": filepath}), \
+                mock.patch("smqtk_core.plugin.LOG.warning") as m_warning:
+            assert cache.is_usable(impl) is True
+            assert cache.is_usable(impl) is True
+            assert m_probe.call_count == 1
+            assert m_warning.call_count == 1
+            cache.invalidate(impl)
+
+    def test_persisted_environment_change(self, tmp_path: Path) -> None:
+        """
+        Test that verdicts persisted under a different environment are not
+        used.
+        """
+        _, impl, m_probe = self._make_types()
+        filepath = str(tmp_path / "usability.json")
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_USABILITY_CACHE": filepath}):
+            UsabilityCache().is_usable(impl)
+            with mock.patch("smqtk_core.plugin._environment_fingerprint", return_value="other"):
+                UsabilityCache().is_usable(impl)
+                assert m_probe.call_count == 2
+                assert json.loads(Path(filepath).read_text())["fingerprint"] == "other"
+
+        # Invalid content is ignored.
+        Path(filepath).write_text("not json")
+        assert PersistentUsabilityStore(filepath).get("tests.test_plugin.Impl") is None
+
+
+class TestPluginVerdictCache:
+    """
+    Unit tests for the memoization of structural `is_valid_plugin` verdicts.
+    """
+
+    def test_memoized(self) -> None:
+        """
+        Test that verdicts are evaluated once per candidate and interface pair
+        until invalidated.
+        """
+        class Interface(Pluggable):
+            @abc.abstractmethod
+            def f(self) -> None: ...
+
+        class Impl(Interface):
+            def f(self) -> None: ...
+
+        cache = PluginVerdictCache()
+        with mock.patch("smqtk_core.plugin.inspect.isabstract",
+                        wraps=inspect.isabstract) as m_isabstract:
+            assert cache.verdict(Impl, Interface) == (None, True)
+            assert cache.verdict(Impl, Interface) == (None, True)
+            assert m_isabstract.call_count == 1
+            assert cache.verdict(Interface, Interface)[0] is not None
+            assert cache.verdict(str, Interface)[0] is not None
+        assert (Impl, Interface) in cache
+        assert len(cache) == 3
+
+        cache.invalidate(Impl)
+        assert (Impl, Interface) not in cache
+        assert len(cache) == 2
+        cache.invalidate(Interface)
+        assert len(cache) == 0
+
+    def test_weak_keys(self) -> None:
+        """
+        Test that verdicts do not keep their candidate types alive.
+        """
+        cache = PluginVerdictCache()
+
+        class Interface(Pluggable):
+            ...
+
+        class Impl(Interface):
+            ...
+
+        cache.verdict(Impl, Interface)
+        assert len(cache) == 1
+        del Impl
+        gc.collect()
+        assert len(cache) == 0
+
+    def test_is_valid_plugin_uses_cache(self) -> None:
+        """
+        Test that `is_valid_plugin` populates the module-level cache, while
+        still checking usability through the usability cache.
+        """
+        m_probe = mock.Mock(return_value=True)
+
+        class Interface(Pluggable):
+            ...
+
+        class Impl(Interface):
+            @classmethod
+            def is_usable(cls) -> bool:
+                return m_probe()
+
+        assert is_valid_plugin(Impl, Interface)
+        assert (Impl, Interface) in PLUGIN_VERDICT_CACHE
+        m_probe.return_value = False
+        USABILITY_CACHE.invalidate(Impl)
+        assert not is_valid_plugin(Impl, Interface)
+
+    @mock.patch("smqtk_core.plugin.LOG")
+    def test_no_logging_when_disabled(self, m_log: mock.Mock) -> None:
+        """
+        Test that no log messages are emitted, or built, when trace logging is
+        not enabled.
+        """
+        m_log.isEnabledFor.return_value = False
+        is_valid_plugin(str, Pluggable)
+        m_log.log.assert_not_called()
+
+        m_log.isEnabledFor.return_value = True
+        is_valid_plugin(str, Pluggable)
+        m_log.log.assert_called_once()
+
+
+class TestDiscoveryProfile:
+    """
+    Unit tests for the profiling of plugin discovery.
+    """
+
+    def test_profile_discovery(self) -> None:
+        """
+        Test that sources, module imports and usability probes are recorded
+        while profiling, and that the report is JSON serializable.
+        """
+        unrelated = "tests.test_plugin_dir.module_unrelated_to_pluggables"
+        sys.modules.pop(unrelated, None)
+
+        class SomeInterface(Pluggable):
+            ...
+
+        class Impl(SomeInterface):
+            ...
+
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_PATH": unrelated}):
+            with profile_discovery() as profile:
+                SomeInterface.refresh_impls()
+        assert not tracemalloc.is_tracing()
+
+        interface_key = f"{SomeInterface.__module__}.{SomeInterface.__name__}"
+        sources = {r["source"] for r in profile.sources if r["interface"] == interface_key}
+        assert sources == {
+            "entrypoint:smqtk_plugins", "env_var:SMQTK_PLUGIN_PATH",
+            "subclasses", "filter",
+        }
+        import_record = [r for r in profile.imports if r["module"] == unrelated][0]
+        assert import_record["source"] == "env_var:SMQTK_PLUGIN_PATH"
+        assert import_record["seconds"] >= 0
+        assert isinstance(import_record["memory_delta"], int)
+        assert import_record["error"] is False
+        assert [r["usable"] for r in profile.usability if r["type"].endswith(".Impl")] == [True]
+        assert profile.slowest_imports(1)[0]["seconds"] == max(r["seconds"] for r in profile.imports)
+        assert json.loads(profile.to_json()) == profile.to_dict()
+
+        # Nothing is recorded outside of the context.
+        SomeInterface.refresh_impls()
+        assert len(profile.usability) == 1
+
+    def test_profile_without_memory(self) -> None:
+        """
+        Test that memory deltas are not recorded when not requested, and that
+        profiling may not be nested.
+        """
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_PATH": "tests.test_plugin_dir.module_of_stuff"}):
+            with profile_discovery(trace_memory=False) as profile:
+                assert not tracemalloc.is_tracing()
+                discover_via_env_var("SMQTK_PLUGIN_PATH")
+                with pytest.raises(RuntimeError, match="already being profiled"):
+                    with profile_discovery():
+                        ...
+        assert [r["memory_delta"] for r in profile.imports] == [None]
+
+
+def _child_get_impls_without_discovery(
+    interface_type: Type[Pluggable], conn: "multiprocessing.connection.Connection"
+) -> None:
+    """
+    Report, from a forked child, the implementations of the given interface
+    and if getting them required discovery.
+    """
+    # Defining any sub-class makes cached discovery results stale.
+    class ChildDefined(Pluggable):
+        ...
+
+    with mock.patch("smqtk_core.plugin._discover_impls") as m_discover:
+        impls = interface_type.get_impls()
+    conn.send(({_type_to_key(t) for t in impls}, m_discover.called))
+    conn.close()
+
+
+class TestWarmup:
+    """
+    Unit tests for pre-fork warm-up of plugin discovery.
+    """
+
+    def test_warmup(self) -> None:
+        """
+        Test that discovery results are recorded and constructors are
+        introspected.
+        """
+        class Interface(Pluggable, Configurable):
+            ...
+
+        class Impl(Interface):
+            def __init__(self, a: int = 1):
+                ...
+
+            def get_config(self) -> Dict:
+                return {}
+
+        class NotConfigurableInterface(Pluggable):
+            ...
+
+        class NotConfigurableImpl(NotConfigurableInterface):
+            ...
+
+        result = warmup([Interface, NotConfigurableInterface], freeze_gc=False)
+        assert result == {Interface: {Impl}, NotConfigurableInterface: {NotConfigurableImpl}}
+        assert WARMUP_REGISTRY.impls(Interface) == {Impl}
+        assert "_smqtk_constructor_adapter" in Impl.__dict__
+
+        class OtherImpl(Interface):
+            def get_config(self) -> Dict:
+                return {}
+
+        warmup(cast(List[Type[Pluggable]], [Interface]), constructors=False)
+        assert "_smqtk_constructor_adapter" not in OtherImpl.__dict__
+        WARMUP_REGISTRY.clear()
+        assert Interface not in WARMUP_REGISTRY
+
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions", return_value=set())
+    @mock.patch("smqtk_core.plugin.discover_via_env_var")
+    def test_get_impls_extends_warmup(self, m_d_env: mock.Mock, _: mock.Mock) -> None:
+        """
+        Test that, after warm-up, defining new sub-classes does not cause a
+        full discovery, while a change of environment does.
+        """
+        m_d_env.return_value = {module_of_stuff.ClassDefinition}
+
+        class Interface(Pluggable):
+            ...
+
+        class Impl(Interface):
+            ...
+
+        warmup([Interface])
+        assert m_d_env.call_count == 1
+
+        class Unrelated(Pluggable):
+            ...
+
+        class NewImpl(Interface):
+            ...
+
+        assert Interface.get_impls() == {Impl, NewImpl}
+        assert m_d_env.call_count == 1
+
+        with mock.patch.dict(os.environ, {Interface.PLUGIN_ENV_VAR: "some.other.module"}):
+            assert Interface.get_impls() == {Impl, NewImpl}
+            assert m_d_env.call_count == 2
+        WARMUP_REGISTRY.clear()
+
+    @mock.patch("smqtk_core.plugin.gc.freeze")
+    def test_warmup_freeze_gc(self, m_freeze: mock.Mock) -> None:
+        """
+        Test that the garbage collector is only frozen when requested.
+        """
+        warmup([])
+        m_freeze.assert_not_called()
+        warmup([], freeze_gc=True)
+        m_freeze.assert_called_once_with()
+
+    @pytest.mark.skipif(
+        "fork" not in multiprocessing.get_all_start_methods(),
+        reason="Requires the fork start method."
+    )
+    def test_forked_child_reuses_discovery(self) -> None:
+        """
+        Test that a child forked after warm-up gets implementations without
+        performing discovery.
+        """
+        warmup(cast(List[Type[Pluggable]], [module_of_pluggables.PluggableInterface]))
+        ctx = multiprocessing.get_context("fork")
+        parent_conn, child_conn = ctx.Pipe()
+        p = ctx.Process(
+            target=_child_get_impls_without_discovery,
+            args=(module_of_pluggables.PluggableInterface, child_conn),
+        )
+        p.start()
+        impl_keys, discovered = parent_conn.recv()
+        p.join()
+        assert impl_keys == {_type_to_key(module_of_pluggables.UsableImpl)}
+        assert not discovered
+        WARMUP_REGISTRY.clear()
+
+
+class TestSharedDiscoveryCache:
+    """
+    Unit tests for the shared directory discovery cache.
+    """
+
+    IFACE = module_of_pluggables.PluggableInterface
+
+    def test_put_get(self, tmp_path: Path) -> None:
+        """
+        Test that entries round-trip and are keyed on the environment.
+        """
+        cache = SharedDiscoveryCache(str(tmp_path / "shared"))
+        assert cache.get(self.IFACE) is None
+        cache.put(self.IFACE, [module_of_pluggables.UsableImpl, module_of_pluggables.NotUsableImpl])
+        assert cache.get(self.IFACE) == {
+            _type_to_key(module_of_pluggables.UsableImpl): {
+                "module": module_of_pluggables.__name__, "attr": "UsableImpl", "usable": True,
+            },
+            _type_to_key(module_of_pluggables.NotUsableImpl): {
+                "module": module_of_pluggables.__name__, "attr": "NotUsableImpl", "usable": False,
+            },
+        }
+        assert cache.resolve(
+            module_of_pluggables.__name__, "UsableImpl"
+        ) is module_of_pluggables.UsableImpl
+
+        # A different environment, or interface, misses.
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_PATH": "tests.test_plugin_dir.module_of_stuff"}):
+            assert cache.get(self.IFACE) is None
+        with mock.patch("smqtk_core.plugin._environment_fingerprint", return_value="other"):
+            assert cache.get(self.IFACE) is None
+        assert cache.get(Pluggable) is None
+
+        cache.discard(self.IFACE)
+        assert cache.get(self.IFACE) is None
+        cache.discard(self.IFACE)
+
+    def test_put_attr_alias(self, tmp_path: Path) -> None:
+        """
+        Test that types are recorded by the module attribute bound to them,
+        and that no entry is stored if a type is not bound to any.
+        """
+        hidden = type("_Hidden", (), {"__module__": module_of_pluggables.__name__})
+        cache = SharedDiscoveryCache(str(tmp_path))
+        with mock.patch.object(module_of_pluggables, "DynImpl", hidden, create=True):
+            cache.put(self.IFACE, [hidden])
+            entry = cache.get(self.IFACE)
+            assert entry is not None
+            meta = entry[_type_to_key(hidden)]
+            assert meta["attr"] == "DynImpl"
+            assert cache.resolve(meta["module"], meta["attr"]) is hidden
+
+        cache.discard(self.IFACE)
+        cache.put(self.IFACE, [hidden])
+        assert cache.get(self.IFACE) is None
+
+    def test_put_unwritable(self, tmp_path: Path) -> None:
+        """
+        Test that failing to write an entry is not an error.
+        """
+        not_a_dir = tmp_path / "not_a_dir"
+        not_a_dir.write_text("")
+        cache = SharedDiscoveryCache(str(not_a_dir))
+        cache.put(self.IFACE, [module_of_pluggables.UsableImpl])
+        assert cache.get(self.IFACE) is None
+
+    def test_put_timeout(self, tmp_path: Path) -> None:
+        """
+        Test that usability probes when storing an entry are subject to the
+        time budget.
+        """
+        class Interface(Pluggable):
+            ...
+
+        class SlowProbeImpl(Interface):
+            @classmethod
+            def is_usable(cls) -> bool:
+                time.sleep(0.2)
+                return True
+
+        cache = SharedDiscoveryCache(str(tmp_path))
+        with mock.patch.dict(globals(), {"SlowProbeImpl": SlowProbeImpl}):
+            cache.put(Interface, [SlowProbeImpl], timeout=0.02)
+            entry = cache.get(Interface)
+        assert entry is not None
+        assert entry[_type_to_key(SlowProbeImpl)]["usable"] is False
+        TestPluginTimeouts._wait_for("usability", _type_to_key(SlowProbeImpl))
+        PLUGIN_TIMEOUTS.clear()
+
+    def test_get_invalid(self, tmp_path: Path) -> None:
+        """
+        Test that an entry file of invalid content is a miss.
+        """
+        cache = SharedDiscoveryCache(str(tmp_path))
+        filepath = tmp_path / f"{cache.key(self.IFACE)}.json"
+        filepath.write_text("{not json")
+        assert cache.get(self.IFACE) is None
+        filepath.write_text(json.dumps({"format_version": -1, "interface": "", "impls": {}}))
+        assert cache.get(self.IFACE) is None
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=TestPluginManifest.ENTRYPOINTS)
+    def test_get_impls(self, _: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test that discovery writes an entry which later discoveries, in this
+        or another process, draw from instead of the entry-point and
+        environment variable sources.
+        """
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_SHARED_CACHE": str(tmp_path)}):
+            self.IFACE.invalidate_impls()
+            assert self.IFACE.get_impls() == {module_of_pluggables.UsableImpl}
+            assert SharedDiscoveryCache(str(tmp_path)).get(self.IFACE) is not None
+            self.IFACE.invalidate_impls()
+            with mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions") as m_d_ent, \
+                    mock.patch("smqtk_core.plugin.discover_via_env_var") as m_d_env:
+                assert self.IFACE.get_impls() == {module_of_pluggables.UsableImpl}
+            m_d_ent.assert_not_called()
+            m_d_env.assert_not_called()
+        self.IFACE.invalidate_impls()
+
+    def test_get_impls_lazy(self, tmp_path: Path) -> None:
+        """
+        Test that lazy interfaces get handles of the recorded usable types
+        without importing them.
+        """
+        class LazyInterface(Pluggable):
+            PLUGIN_LAZY_TYPES = True
+
+        cache = SharedDiscoveryCache(str(tmp_path))
+        cache.put(LazyInterface, [])
+        entry = {
+            "probably.not.a.module.Impl": {
+                "module": "probably.not.a.module", "attr": "Impl", "usable": True,
+            },
+            "probably.not.a.module.Unusable": {
+                "module": "probably.not.a.module", "attr": "Unusable", "usable": False,
+            },
+        }
+        filepath = tmp_path / f"{cache.key(LazyInterface)}.json"
+        data = json.loads(filepath.read_text())
+        data["impls"] = entry
+        filepath.write_text(json.dumps(data))
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_SHARED_CACHE": str(tmp_path)}):
+            impls = LazyInterface.get_impls()
+        assert {cast(LazyPluginType, t).type_key for t in impls} == {"probably.not.a.module.Impl"}
+
+        # A handle that fails to resolve discards the stale entry.
+        with pytest.raises(ImportError):
+            cast(LazyPluginType, impls.pop()).resolve()
+        assert cache.get(LazyInterface) is None
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=TestPluginManifest.ENTRYPOINTS)
+    def test_get_impls_stale(self, _: mock.Mock, tmp_path: Path) -> None:
+        """
+        Test that an entry whose types can no longer be imported is discarded
+        in favor of a full discovery, which writes a new entry.
+        """
+        cache = SharedDiscoveryCache(str(tmp_path))
+        cache.put(self.IFACE, [module_of_pluggables.UsableImpl])
+        filepath = tmp_path / f"{cache.key(self.IFACE)}.json"
+        data = json.loads(filepath.read_text())
+        data["impls"][_type_to_key(module_of_pluggables.UsableImpl)]["attr"] = "Renamed"
+        filepath.write_text(json.dumps(data))
+        with mock.patch.dict(os.environ, {"SMQTK_PLUGIN_SHARED_CACHE": str(tmp_path)}):
+            self.IFACE.invalidate_impls()
+            assert self.IFACE.get_impls() == {module_of_pluggables.UsableImpl}
+        self.IFACE.invalidate_impls()
+        entry = cache.get(self.IFACE)
+        assert entry is not None
+        assert entry[_type_to_key(module_of_pluggables.UsableImpl)]["attr"] == "UsableImpl"
+
+
+class TestPluginTimeouts:
+    """
+    Unit tests for time budgets on plugin module imports and usability
+    probes.
+    """
+
+    SLOW_MODULE = "tests.test_plugin_dir.module_with_slow_import"
+
+    @staticmethod
+    def _wait_for(kind: str, name: str) -> None:
+        while PLUGIN_TIMEOUTS.pending(kind, name):
+            time.sleep(0.01)
+
+    def test_env_var_import(self) -> None:
+        """
+        Test that a module exceeding the budget is skipped, and skipped again
+        without waiting while its import is still running, and that it is
+        imported normally once that completes.
+        """
+        env = {"SMQTK_PLUGIN_PATH": f"tests.test_plugin_dir.module_of_stuff:{self.SLOW_MODULE}"}
+        # The module may have been imported when collecting doctests.
+        with mock.patch.dict(sys.modules), mock.patch.dict(os.environ, env):
+            sys.modules.pop(self.SLOW_MODULE, None)
+            s = time.perf_counter()
+            type_set = discover_via_env_var("SMQTK_PLUGIN_PATH", timeout=0.02)
+            assert type_set == TYPES_IN_STUFF_MODULE
+            type_set = discover_via_env_var("SMQTK_PLUGIN_PATH", timeout=0.02)
+            assert type_set == TYPES_IN_STUFF_MODULE
+            assert time.perf_counter() - s < 0.3
+            report = PLUGIN_TIMEOUTS.report()
+            assert [(r["kind"], r["name"], r["budget"]) for r in report] == [
+                ("import", self.SLOW_MODULE, 0.02)
+            ]
+            assert self.SLOW_MODULE in PLUGIN_TIMEOUTS
+
+            self._wait_for("import", self.SLOW_MODULE)
+            type_set = discover_via_env_var("SMQTK_PLUGIN_PATH", timeout=0.02)
+            assert {t.__name__ for t in type_set} >= {"SlowImportInterface", "SlowImportImpl"}
+        PLUGIN_TIMEOUTS.clear()
+        assert len(PLUGIN_TIMEOUTS) == 0
+
+    def test_get_impl_import(self) -> None:
+        """
+        Test that the direct import of `Pluggable.get_impl` is subject to the
+        budget, falling back to discovery without waiting on an abandoned
+        import still in progress.
+        """
+        class Interface(Pluggable):
+            PLUGIN_TIMEOUT = 0.02
+
+        type_key = f"{self.SLOW_MODULE}.SlowImportImpl"
+        with mock.patch.dict(sys.modules):
+            sys.modules.pop(self.SLOW_MODULE, None)
+            s = time.perf_counter()
+            with mock.patch.object(Interface, "get_impls", return_value=set()) as m_get_impls:
+                with pytest.raises(ValueError):
+                    Interface.get_impl(type_key)
+                with pytest.raises(ValueError):
+                    Interface.get_impl(type_key)
+            assert time.perf_counter() - s < 0.3
+            assert m_get_impls.call_count == 2
+            assert PLUGIN_TIMEOUTS.pending("import", self.SLOW_MODULE)
+            self._wait_for("import", self.SLOW_MODULE)
+        PLUGIN_TIMEOUTS.clear()
+
+    def test_import_error_propagates(self) -> None:
+        """
+        Test that errors raised within the budget still propagate.
+        """
+        env = {"SMQTK_PLUGIN_PATH": "tests.test_plugin_dir.not_a_module"}
+        with mock.patch.dict(os.environ, env):
+            with pytest.raises(ModuleNotFoundError):
+                discover_via_env_var("SMQTK_PLUGIN_PATH", timeout=5)
+
+    def test_usability_probe(self) -> None:
+        """
+        Test that a type whose usability probe exceeds the budget is not a
+        valid plugin, not cached as a discovery result, and probed again once
+        the earlier probe completed.
+        """
+        class Interface(Pluggable):
+            ...
+
+        class SlowProbeImpl(Interface):
+            @classmethod
+            def is_usable(cls) -> bool:
+                time.sleep(0.2)
+                return True
+
+        class Impl(Interface):
+            ...
+
+        assert not is_valid_plugin(SlowProbeImpl, Interface, timeout=0.02)
+        assert SlowProbeImpl not in USABILITY_CACHE
+
+        Interface.PLUGIN_TIMEOUT = 0.02
+        assert Interface.get_impls() == {Impl}
+        assert Interface not in DISCOVERY_CACHE
+
+        self._wait_for("usability", _type_to_key(SlowProbeImpl))
+        Interface.PLUGIN_TIMEOUT = None
+        assert Interface.get_impls() == {SlowProbeImpl, Impl}
+        PLUGIN_TIMEOUTS.clear()
+
+
+class TestTypeKeyIndex:
+    """
+    Unit tests for the type key index.
+    """
+
+    def test_iterable(self) -> None:
+        """
+        Test that an index built from types is maintained incrementally.
+        """
+        index = TypeKeyIndex([module_of_stuff.ClassDefinition])
+        key = _type_to_key(module_of_stuff.Derived)
+        assert key not in index
+        with pytest.raises(KeyError):
+            index[key]
+        index.add(module_of_stuff.Derived)
+        assert index[key] is module_of_stuff.Derived
+        assert set(index) == {_type_to_key(module_of_stuff.ClassDefinition), key}
+        index.discard(module_of_stuff.Derived)
+        index.discard(module_of_stuff.Derived)
+        assert len(index) == 1
+        assert index.refresh() is False
+
+        lazy = LazyPluginType(key, lambda: module_of_stuff.Derived)
+        index.update([cast(Type, lazy)])
+        assert index[key] is lazy
+        assert not lazy.is_resolved
+
+    def test_from_interface(self) -> None:
+        """
+        Test that an index tracking an interface picks up new implementations
+        when looking up their key and drops removed ones on refresh.
+        """
+        class Interface(Pluggable):
+            ...
+
+        class ImplA(Interface):
+            ...
+
+        index = TypeKeyIndex.from_interface(Interface)
+        assert dict(index) == {_type_to_key(ImplA): ImplA}
+
+        class ImplB(Interface):
+            ...
+
+        assert len(index) == 1
+        assert index[_type_to_key(ImplB)] is ImplB
+        assert len(index) == 2
+
+        with mock.patch.object(Interface, "get_impls", return_value={ImplB}):
+            assert index.refresh() is True
+            assert index.refresh() is False
+        assert set(index) == {_type_to_key(ImplB)}
+
+
+class TestDiscoverAll:
+    """
+    Unit tests for single-pass discovery across multiple interfaces.
+    """
+
+    @mock.patch("smqtk_core.plugin.get_ns_entrypoints", return_value=TestPluginManifest.ENTRYPOINTS)
+    @mock.patch("smqtk_core.plugin.discover_via_entrypoint_extensions",
+                wraps=discover_via_entrypoint_extensions)
+    @mock.patch("smqtk_core.plugin.discover_via_env_var", wraps=discover_via_env_var)
+    def test_shared_pool(self, m_d_env: mock.Mock, m_d_ent: mock.Mock, _: mock.Mock) -> None:
+        """
+        Test that sources are drawn once per distinct namespace and that the
+        result matches individual discovery.
+        """
+        class InterfaceA(Pluggable):
+            PLUGIN_DISCOVERY_CACHE = False
+
+        class ImplA(InterfaceA):
+            ...
+
+        class InterfaceB(Pluggable):
+            PLUGIN_DISCOVERY_CACHE = False
+
+        class InterfaceC(Pluggable):
+            PLUGIN_DISCOVERY_CACHE = False
+            PLUGIN_NAMESPACE = "other_namespace"
+
+        interfaces = [
+            InterfaceA, InterfaceB, InterfaceC,
+            module_of_pluggables.PluggableInterface,
+        ]
+        result = discover_all(interfaces)
+        assert m_d_env.call_count == 1
+        assert m_d_ent.call_count == 2
+        assert result == {iface: iface.refresh_impls() for iface in interfaces}
+        assert result[InterfaceA] == {ImplA}
+        assert result[module_of_pluggables.PluggableInterface] == {module_of_pluggables.UsableImpl}
+
+    def test_adiscover_all(self) -> None:
+        """
+        Test that asynchronous discovery runs in the given executor and
+        matches synchronous discovery.
+        """
+        class InterfaceA(Pluggable):
+            ...
+
+        class ImplA(InterfaceA):
+            ...
+
+        class InterfaceB(Pluggable):
+            ...
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        with mock.patch.object(executor, "submit", wraps=executor.submit) as m_submit:
+            result = asyncio.run(adiscover_all([InterfaceA, InterfaceB], executor))
+        executor.shutdown()
+        assert m_submit.call_count == 2
+        assert result == {InterfaceA: {ImplA}, InterfaceB: set()}
+        assert asyncio.run(InterfaceA.aget_impls()) == InterfaceA.get_impls()
+
+    def test_asyncio_not_imported(self) -> None:
+        """
+        Test that importing the package does not import asyncio, which is
+        only needed by the asynchronous functions.
+        """
+        subprocess.run([
+            sys.executable, "-c",
+            "import sys, smqtk_core.configuration; assert 'asyncio' not in sys.modules",
+        ], check=True)
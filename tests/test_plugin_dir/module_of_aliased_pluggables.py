@@ -0,0 +1,17 @@
+"""
+Test module defining a `Pluggable` interface and implementation via an aliased
+base class.
+"""
+import abc
+
+from smqtk_core.plugin import Pluggable as AliasedBase
+
+
+class AliasedInterface(AliasedBase):
+    @abc.abstractmethod
+    def cool_thing(self) -> str: ...
+
+
+class AliasedImpl(AliasedInterface):
+    def cool_thing(self) -> str:  # type: ignore[empty-body]
+        """ Some implementation, content doesn't matter. """
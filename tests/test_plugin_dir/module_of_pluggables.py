@@ -0,0 +1,29 @@
+"""
+Test module defining a `Pluggable` interface with some implementations.
+"""
+import abc
+
+from smqtk_core.plugin import Pluggable
+
+
+class PluggableInterface(Pluggable):
+    @abc.abstractmethod
+    def cool_thing(self) -> str: ...
+
+
+class UsableImpl(PluggableInterface):
+    def cool_thing(self) -> str:  # type: ignore[empty-body]
+        """ Some implementation, content doesn't matter. """
+
+
+class NotUsableImpl(PluggableInterface):
+    @classmethod
+    def is_usable(cls) -> bool:
+        return False
+
+    def cool_thing(self) -> str:  # type: ignore[empty-body]
+        """ Some implementation, content doesn't matter. """
+
+
+class StillAbstractInterface(PluggableInterface):
+    ...
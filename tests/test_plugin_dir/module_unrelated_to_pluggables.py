@@ -0,0 +1,9 @@
+"""
+Test module that defines nothing related to `Pluggable` types, and should not
+be imported when statically scanning for implementations of one.
+"""
+import collections
+
+
+class UnrelatedType(collections.OrderedDict):
+    ...
@@ -0,0 +1,20 @@
+"""
+Test module that takes a while to import, standing in for a module that hangs
+on import, e.g. while probing for a missing device driver.
+"""
+import time
+
+from smqtk_core.plugin import Pluggable
+
+
+IMPORT_SECONDS = 0.3
+
+time.sleep(IMPORT_SECONDS)
+
+
+class SlowImportInterface(Pluggable):
+    ...
+
+
+class SlowImportImpl(SlowImportInterface):
+    ...